@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""Topological ordering of a long synthetic causal chain.
+
+explain_causal_chain orders nodes with Kahn's algorithm, ties broken by
+(timestamp, node_id). The ready queue used to be a list that was re-sorted on
+every insert and popped from the front, with each newly ready node found by a
+linear scan of all nodes. It is now a heap over a node-id dict. This builds a
+chain of --nodes nodes (each step also fanning out to a short side branch),
+checks both orderings agree on a --baseline-nodes prefix, and times them.
+
+Usage:
+    python benchmarks/bench_causal_topological_order.py [--nodes 50000] [--baseline-nodes 5000]
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import List
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from v2.core.causal_trace import CausalEdge, CausalNode, _topological_order  # noqa: E402
+
+
+def _chain(count: int):
+    base = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    nodes: List[CausalNode] = []
+    edges: List[CausalEdge] = []
+    for index in range(count):
+        nodes.append(
+            CausalNode(
+                node_id=f"node-{index:06d}",
+                node_type="EVIDENCE" if index == 0 else "ACTION",
+                description=f"step {index}",
+                related_task_id="task-1",
+                related_plan_id=None,
+                related_step_id=None,
+                # Coarse timestamps so node_id tie-breaks are exercised too.
+                timestamp=base + timedelta(seconds=index // 4),
+            )
+        )
+        if index >= 1:
+            edges.append(CausalEdge(nodes[index - 1 - (index % 3 == 0)].node_id, nodes[index].node_id, "caused_by"))
+    return nodes, edges
+
+
+def _list_queue_order(nodes: List[CausalNode], edges: List[CausalEdge]):
+    """The previous implementation, kept here as the baseline."""
+    graph = {node.node_id: [] for node in nodes}
+    indegree = {node.node_id: 0 for node in nodes}
+    for edge in edges:
+        if edge.from_node_id in graph and edge.to_node_id in graph:
+            graph[edge.from_node_id].append(edge.to_node_id)
+            indegree[edge.to_node_id] += 1
+    queue = sorted(
+        [node for node in nodes if indegree[node.node_id] == 0],
+        key=lambda n: (n.timestamp, n.node_id),
+    )
+    ordered: List[CausalNode] = []
+    while queue:
+        current = queue.pop(0)
+        ordered.append(current)
+        for neighbor in graph[current.node_id]:
+            indegree[neighbor] -= 1
+            if indegree[neighbor] == 0:
+                next_node = next(n for n in nodes if n.node_id == neighbor)
+                queue.append(next_node)
+                queue.sort(key=lambda n: (n.timestamp, n.node_id))
+    if len(ordered) != len(nodes):
+        return None
+    return ordered
+
+
+def _timed(fn, *args):
+    start = time.perf_counter()
+    result = fn(*args)
+    return result, time.perf_counter() - start
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="causal trace topological order benchmark")
+    parser.add_argument("--nodes", type=int, default=50_000)
+    parser.add_argument("--baseline-nodes", type=int, default=5_000)
+    args = parser.parse_args()
+
+    small_nodes, small_edges = _chain(args.baseline_nodes)
+    expected, baseline = _timed(_list_queue_order, small_nodes, small_edges)
+    ordered, small_heap = _timed(_topological_order, small_nodes, small_edges)
+    assert ordered == expected
+
+    nodes, edges = _chain(args.nodes)
+    ordered, heap = _timed(_topological_order, nodes, edges)
+    assert ordered is not None and len(ordered) == args.nodes
+
+    print(f"{'measurement':<34} {'ms':>10}")
+    print(f"{f'list queue, {args.baseline_nodes} nodes':<34} {baseline * 1000:>10.1f}")
+    print(f"{f'heap, {args.baseline_nodes} nodes':<34} {small_heap * 1000:>10.1f}")
+    print(f"{f'heap, {args.nodes} nodes':<34} {heap * 1000:>10.1f}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""Micro-benchmark for contract validation on the trace-emit hot path.
+
+Times N calls of validate_trace_event against the cached validator and
+against the pre-cache behaviour (YAML parse + jsonschema.validate per call).
+
+Usage:
+    python benchmarks/bench_contract_validation.py [--iterations 10000]
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import yaml
+from jsonschema import validate
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+if str(ROOT_DIR) not in sys.path:
+    sys.path.insert(0, str(ROOT_DIR))
+
+from v2.core.contracts import loader  # noqa: E402
+
+EVENT = {
+    "trace_id": "trace-bench",
+    "event_id": "evt-1",
+    "event_type": "tool_call",
+    "timestamp": "2026-01-01T00:00:00Z",
+    "actor": {"component": "tool_runner"},
+    "payload": {"tool": "demo.hello"},
+    "metadata": {"duration_ms": 3, "outcome": "success"},
+}
+
+
+def _uncached_validate(event: dict) -> None:
+    with open(loader.CONTRACTS_DIR / "trace-event.schema.yaml", "r") as f:
+        schema = yaml.safe_load(f)
+    validate(instance=event, schema=schema)
+
+
+def _time(fn, iterations: int) -> float:
+    start = time.perf_counter()
+    for _ in range(iterations):
+        fn(EVENT)
+    return time.perf_counter() - start
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="validate_trace_event micro-benchmark")
+    parser.add_argument("--iterations", type=int, default=10_000)
+    args = parser.parse_args()
+
+    loader.clear_schema_cache()
+    loader.validate_trace_event(EVENT)
+
+    cached = _time(loader.validate_trace_event, args.iterations)
+    uncached = _time(_uncached_validate, args.iterations)
+
+    print(f"iterations:      {args.iterations}")
+    print(f"uncached total:  {uncached:.3f}s ({uncached / args.iterations * 1e6:.1f} us/call)")
+    print(f"cached total:    {cached:.3f}s ({cached / args.iterations * 1e6:.1f} us/call)")
+    print(f"speedup:         {uncached / cached:.1f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""Evidence claim lookups against a large per-trace evidence file.
+
+has_evidence and friends used to re-read and re-parse the whole trace JSONL
+and re-check every record's TTL on each call. Lookups now go through an
+in-memory claim index that is extended by tailing appends, with expired
+entries dropped in bulk from an expiry heap. This writes --records records
+over --claims claims and times lookups, an append followed by a lookup, and
+lookups after the clock has moved past most TTLs.
+
+Usage:
+    python benchmarks/bench_evidence_claim_index.py [--records 50000] [--claims 500] [--queries 2000]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import tempfile
+import time
+from datetime import timedelta
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+import v2.core.causal_trace as causal_trace  # noqa: E402
+import v2.core.evidence as evidence  # noqa: E402
+
+TRACE_ID = "trace-bench-evidence"
+
+
+def _populate(records: int, claims: int) -> None:
+    base = evidence._now()
+    path = evidence._require_path()
+    with path.open("a", encoding="utf-8") as handle:
+        for index in range(records):
+            record = evidence._apply_expiry(
+                evidence.Evidence(
+                    evidence_id=f"ev-{index}",
+                    claim=f"host.claim_{index % claims}",
+                    source_type="command",
+                    source_ref="bench",
+                    content_hash=evidence._hash_content("ok"),
+                    timestamp=base,
+                    ttl_seconds=30 if index % 10 else 3600,
+                    scope="host",
+                    confidence=evidence.CONFIDENCE_SINGLE,
+                )
+            )
+            handle.write(json.dumps(record.to_dict(), sort_keys=True) + "\n")
+
+
+def _time_queries(queries: int, claims: int, now) -> float:
+    start = time.perf_counter()
+    for index in range(queries):
+        evidence.confidence_for_claim(f"host.claim_{index % claims}", now)
+    return (time.perf_counter() - start) / queries
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="evidence claim index benchmark")
+    parser.add_argument("--records", type=int, default=50_000)
+    parser.add_argument("--claims", type=int, default=500)
+    parser.add_argument("--queries", type=int, default=2000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        evidence.EVIDENCE_DIR = Path(tmp) / "evidence"
+        causal_trace.CAUSAL_TRACE_DIR = Path(tmp) / "causal_traces"
+        evidence.EVIDENCE_DIR.mkdir()
+        causal_trace.CAUSAL_TRACE_DIR.mkdir()
+        evidence.load_evidence(TRACE_ID)
+        _populate(args.records, args.claims)
+        now = evidence._now()
+
+        start = time.perf_counter()
+        evidence.has_evidence("host.claim_0")
+        first = time.perf_counter() - start
+        warm = _time_queries(args.queries, args.claims, now)
+
+        start = time.perf_counter()
+        for index in range(args.queries // 10):
+            evidence.record_evidence(f"host.appended_{index}", "command", "bench", "ok")
+            evidence.has_evidence(f"host.appended_{index}")
+        append = (time.perf_counter() - start) / (args.queries // 10)
+
+        decayed = _time_queries(args.queries, args.claims, now + timedelta(seconds=60))
+
+    print(f"{args.records} records over {args.claims} claims, {args.queries} queries")
+    print(f"{'measurement':<28} {'ms':>10}")
+    print(f"{'first lookup (build index)':<28} {first * 1000:>10.2f}")
+    print(f"{'lookup':<28} {warm * 1000:>10.4f}")
+    print(f"{'append + lookup':<28} {append * 1000:>10.4f}")
+    print(f"{'lookup after TTL decay':<28} {decayed * 1000:>10.4f}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""Directory inspection paging cost on a large generated tree.
+
+inspect_directory used to walk, stat and sort the whole tree for every page
+and then slice by an integer offset. Pages now resume the walk from an
+opaque cursor. This generates a tree of --files files and times the first
+page, a page deep into the listing, and paging through everything; the
+"full walk" row is the work every single page used to cost.
+
+Usage:
+    python benchmarks/bench_inspect_directory_paging.py [--files 100000] [--page-size 200]
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from v2.core.tools import inspect_file_runner  # noqa: E402
+
+FILES_PER_DIRECTORY = 100
+SUBDIRECTORIES = 100
+
+
+def _generate_tree(root: Path, files: int) -> int:
+    """Lays files out as root/dNN/sNNN/fNNN.txt; returns the entry count at depth 3."""
+    entries = 0
+    created = 0
+    top = 0
+    while created < files:
+        top_dir = root / f"d{top:03d}"
+        top_dir.mkdir()
+        entries += 1
+        for sub in range(SUBDIRECTORIES):
+            if created >= files:
+                break
+            sub_dir = top_dir / f"s{sub:03d}"
+            sub_dir.mkdir()
+            entries += 1
+            for index in range(min(FILES_PER_DIRECTORY, files - created)):
+                (sub_dir / f"f{index:03d}.txt").write_bytes(b"x")
+                created += 1
+                entries += 1
+        top += 1
+    return entries
+
+
+def _full_walk(root: Path) -> int:
+    """What every page cost before: list, stat and sort the whole tree."""
+    queue = [root]
+    paths = []
+    while queue:
+        directory = queue.pop()
+        with os.scandir(directory) as iterator:
+            for entry in sorted(iterator, key=lambda item: item.name):
+                entry.stat(follow_symlinks=False)
+                paths.append(entry.path)
+                if entry.is_dir(follow_symlinks=False):
+                    queue.append(Path(entry.path))
+    paths.sort()
+    return len(paths)
+
+
+def _page(root: Path, page_size: int, page_token: str | None) -> dict:
+    result = inspect_file_runner.inspect_directory(
+        {"path": ".", "max_depth": 3, "page_size": page_size, "page_token": page_token},
+        root,
+    )
+    assert result["status"] == "ok", result["error"]
+    return result
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="inspect_directory paging benchmark")
+    parser.add_argument("--files", type=int, default=100_000)
+    parser.add_argument("--page-size", type=int, default=inspect_file_runner.MAX_PAGE_SIZE)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        expected = _generate_tree(root, args.files)
+
+        start = time.perf_counter()
+        assert _full_walk(root) == expected
+        full_walk = time.perf_counter() - start
+
+        page_times = []
+        emitted = 0
+        page_token = None
+        start = time.perf_counter()
+        while True:
+            page_start = time.perf_counter()
+            result = _page(root, args.page_size, page_token)
+            page_times.append(time.perf_counter() - page_start)
+            emitted += len(result["entries"])
+            page_token = result["next_page_token"]
+            if page_token is None:
+                break
+        all_pages = time.perf_counter() - start
+        assert emitted == expected, (emitted, expected)
+
+    pages = len(page_times)
+    print(f"{args.files} files, {expected} entries, {pages} pages of {args.page_size}")
+    print(f"{'measurement':<22} {'ms':>10}")
+    print(f"{'full walk (old page)':<22} {full_walk * 1000:>10.1f}")
+    print(f"{'first page':<22} {page_times[0] * 1000:>10.2f}")
+    print(f"{'middle page':<22} {page_times[pages // 2] * 1000:>10.2f}")
+    print(f"{'mean page':<22} {all_pages / pages * 1000:>10.2f}")
+    print(f"{'all pages':<22} {all_pages * 1000:>10.1f}")
+    print(f"old cost of all pages (est.): {full_walk * pages:.1f} s")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
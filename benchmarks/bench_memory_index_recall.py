@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""Recall@k and query latency of Agent Zero memory index types vs flat.
+
+Builds flat, IVF and HNSW indexes (via python.helpers.memory_index) over
+synthetic clustered, L2-normalised embeddings and reports recall@k against
+the exact flat results, so the accuracy cost of each ANN option is visible.
+
+Usage:
+    python benchmarks/bench_memory_index_recall.py [--vectors 100000] [--dim 384]
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+AGENT_ZERO_DIR = Path(__file__).resolve().parents[1] / "v2" / "agent_zero"
+if str(AGENT_ZERO_DIR) not in sys.path:
+    sys.path.insert(0, str(AGENT_ZERO_DIR))
+
+from python.helpers.memory_index import (  # noqa: E402
+    INDEX_FLAT,
+    INDEX_HNSW,
+    INDEX_IVF,
+    IndexConfig,
+    build_index,
+    index_kind,
+)
+
+
+def _synthetic_embeddings(rng: np.random.Generator, count: int, dim: int, clusters: int) -> np.ndarray:
+    centers = rng.standard_normal((clusters, dim)).astype(np.float32)
+    labels = rng.integers(0, clusters, size=count)
+    vectors = centers[labels] + 0.35 * rng.standard_normal((count, dim)).astype(np.float32)
+    vectors /= np.linalg.norm(vectors, axis=1, keepdims=True)
+    return np.ascontiguousarray(vectors, dtype=np.float32)
+
+
+def _recall_at_k(truth: np.ndarray, found: np.ndarray) -> float:
+    hits = sum(len(set(t) & set(f)) for t, f in zip(truth, found))
+    return hits / truth.size
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="memory index recall@k benchmark")
+    parser.add_argument("--vectors", type=int, default=100_000)
+    parser.add_argument("--queries", type=int, default=500)
+    parser.add_argument("--dim", type=int, default=384)
+    parser.add_argument("--k", type=int, default=10)
+    parser.add_argument("--nlist", type=int, default=256)
+    parser.add_argument("--nprobe", type=int, default=16)
+    parser.add_argument("--hnsw-m", type=int, default=32)
+    parser.add_argument("--ef-search", type=int, default=64)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(args.seed)
+    data = _synthetic_embeddings(rng, args.vectors, args.dim, clusters=max(16, args.nlist // 2))
+    queries = _synthetic_embeddings(rng, args.queries, args.dim, clusters=max(16, args.nlist // 2))
+
+    configs = [
+        IndexConfig(index_type=INDEX_FLAT),
+        IndexConfig(index_type=INDEX_IVF, ivf_nlist=args.nlist, ivf_nprobe=args.nprobe, ivf_train_min_vectors=args.nlist),
+        IndexConfig(index_type=INDEX_HNSW, hnsw_m=args.hnsw_m, hnsw_ef_search=args.ef_search),
+    ]
+
+    truth = None
+    print(f"vectors={args.vectors} dim={args.dim} queries={args.queries} k={args.k}")
+    print(f"{'index':<6} {'build s':>9} {'query ms':>9} {'recall@k':>9}")
+    for config in configs:
+        start = time.perf_counter()
+        index = build_index(data, config, args.dim)
+        build_s = time.perf_counter() - start
+
+        start = time.perf_counter()
+        _, ids = index.search(queries, args.k)
+        query_ms = (time.perf_counter() - start) / args.queries * 1000
+
+        if truth is None:
+            truth = ids
+        recall = _recall_at_k(truth, ids)
+        print(f"{index_kind(index):<6} {build_s:>9.2f} {query_ms:>9.3f} {recall:>9.3f}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,279 @@
+#!/usr/bin/env python3
+"""End-to-end cost of BillyRuntime.run_turn over a fixed corpus of turns.
+
+Each conversation in CORPUS runs on a fresh runtime and SessionState, with
+the model provider replaced by a stub that answers instantly (config and
+charter loading still run), environment introspection replaced by a fixed
+snapshot, and every persistent store redirected into a temporary directory.
+Besides the per-turn wall time, the runtime's main stages are wrapped with
+timers; phase times are inclusive, so a phase that runs inside another
+(llm_answer inside conversation_layer, say) is counted in both.
+
+--json writes the results so two commits can be compared; --compare reads
+such a file and prints the change in median turn and phase times.
+
+Usage:
+    python benchmarks/bench_run_turn.py [--repeat 20] [--warmup 2] [--json out.json] [--compare base.json]
+"""
+
+from __future__ import annotations
+
+import argparse
+import io
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from contextlib import contextmanager, redirect_stdout
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, Iterator, List
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+import v2.core.causal_trace as causal_trace  # noqa: E402
+import v2.core.evidence as evidence  # noqa: E402
+import v2.core.introspection as introspection  # noqa: E402
+import v2.core.plans_hamp as plans_hamp  # noqa: E402
+import v2.core.runtime as runtime_mod  # noqa: E402
+import v2.core.task_graph as task_graph  # noqa: E402
+from v2.core.execution.execution_journal import ExecutionJournal  # noqa: E402
+from v2.core.memory.file_memory_store import FileMemoryStore  # noqa: E402
+from v2.core.sessions import SessionState, session_scope  # noqa: E402
+from v2.core.trace.file_trace_sink import FileTraceSink  # noqa: E402
+
+# Conversation name -> turns, sent in order to one runtime.
+CORPUS: Dict[str, tuple] = {
+    "chat": ("hello there", "tell me a joke", "what is a python decorator?"),
+    "website": ("build me a homepage", "business", "yes"),
+    "draft": ("draft: update parser in src/parser.py",),
+    "goal": ("Objective: ship the landing page", "yes"),
+    "claim": ("claim: nginx running",),
+    "inspect": ("inspect the file README.md",),
+    "capability": ("what can you execute?",),
+    "governed": ("create an empty text file in your home directory", "approve"),
+    "memory": ("remember: my editor is vim", "recall editor"),
+    # Resolves against the snapshot stub, so both turns journal a resolution.
+    "resolve": ("Locate n8n on the barn", "Locate n8n on the barn"),
+    "tone": ("summary and recommendation please", "sound confident"),
+    "plan": ("plan: add a health check endpoint",),
+}
+
+# Phase name -> (owner, attribute) wrapped with a timer for the run.
+PHASES = {
+    "bound_interactive": (runtime_mod.BillyRuntime, "_handle_bound_interactive_turn"),
+    "activity_mode": (runtime_mod.BillyRuntime, "_handle_activity_mode_turn"),
+    "secretary": (runtime_mod, "process_conversational_turn"),
+    "intent_routing": (runtime_mod, "route_intent"),
+    "conversation_layer": (runtime_mod.BillyRuntime, "_route_conversation_layer"),
+    "llm_answer": (runtime_mod.BillyRuntime, "_llm_answer"),
+    "config_load": (runtime_mod.BillyRuntime, "_load_config_from_yaml"),
+    "charter_load": (runtime_mod, "load_charter"),
+    "trace_write": (FileTraceSink, "emit"),
+    "journal_append": (ExecutionJournal, "append"),
+    "journal_read": (ExecutionJournal, "resolution_records"),
+    "memory_write": (FileMemoryStore, "write"),
+    "memory_query": (FileMemoryStore, "query"),
+}
+
+
+class _StubLLM:
+    """Stands in for llm_api: answers immediately, streaming if asked to."""
+
+    ANSWER = "Stub answer from the benchmark model."
+
+    @classmethod
+    def get_completion(cls, messages, config, on_delta=None):
+        if on_delta is not None:
+            on_delta(cls.ANSWER)
+        return cls.ANSWER
+
+
+def _stub_snapshot(scope):
+    """Stands in for collect_environment_snapshot: no subprocesses, same result every turn."""
+    return introspection.EnvironmentSnapshot(
+        snapshot_id="snap-bench",
+        collected_at=datetime.now(timezone.utc),
+        services={
+            "systemd_units": ["n8n.service loaded active running"],
+            "process_list": [],
+            "listening_ports": [],
+        },
+        containers={"containers": []},
+        network={"listening_sockets": []},
+        filesystem={"paths": []},
+    )
+
+
+def _isolate_state(root: Path) -> None:
+    for module, attr, name in (
+        (evidence, "EVIDENCE_DIR", "evidence"),
+        (causal_trace, "CAUSAL_TRACE_DIR", "causal_traces"),
+        (task_graph, "TASK_GRAPH_DIR", "task_graph"),
+        (plans_hamp, "PLANS_DIR", "plans"),
+    ):
+        setattr(module, attr, root / name)
+        (root / name).mkdir(parents=True, exist_ok=True)
+    runtime_mod._trace_sink.base_dir = root / "traces"
+    runtime_mod._trace_sink.base_dir.mkdir(parents=True, exist_ok=True)
+    runtime_mod._memory_store = FileMemoryStore(str(root / "memory"), trace_sink=runtime_mod._trace_sink)
+    runtime_mod._execution_journal = ExecutionJournal(str(root / "executions"))
+    runtime_mod.llm_api = _StubLLM
+    introspection.collect_environment_snapshot = _stub_snapshot
+
+
+@contextmanager
+def _instrument(phase_times: Dict[str, List[float]]) -> Iterator[None]:
+    originals = []
+
+    def timed(phase, fn):
+        def wrapper(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                phase_times.setdefault(phase, []).append(time.perf_counter() - start)
+
+        return wrapper
+
+    for phase, (owner, attr) in PHASES.items():
+        original = owner.__dict__[attr]
+        originals.append((owner, attr, original))
+        setattr(owner, attr, timed(phase, original))
+    try:
+        yield
+    finally:
+        for owner, attr, original in originals:
+            setattr(owner, attr, original)
+
+
+def _run_corpus(root: Path, label: str, turn_times: Dict[str, List[float]]) -> None:
+    for name, turns in CORPUS.items():
+        runtime = runtime_mod.BillyRuntime(config={}, aci_ledger_path=str(root / f"ledger-{name}.jsonl"))
+        with session_scope(SessionState()):
+            for index, text in enumerate(turns):
+                trace_id = f"trace-bench-{label}-{name}-{index}"
+                start = time.perf_counter()
+                runtime.run_turn(text, {"trace_id": trace_id})
+                turn_times.setdefault(f"{name}[{index}]", []).append(time.perf_counter() - start)
+
+
+def _percentile(values: List[float], percentile: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, max(0, round(percentile / 100 * len(ordered)) - 1))]
+
+
+def _git_revision() -> str | None:
+    try:
+        result = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=REPO_ROOT,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return result.stdout.strip() or None
+
+
+def _summarize(turn_times, phase_times, repeat: int) -> dict:
+    turns_per_pass = sum(len(turns) for turns in CORPUS.values())
+    all_turns = [value for values in turn_times.values() for value in values]
+    return {
+        "revision": _git_revision(),
+        "python": platform.python_version(),
+        "repeat": repeat,
+        "turns": {
+            key: {
+                "median_ms": statistics.median(values) * 1000,
+                "p95_ms": _percentile(values, 95) * 1000,
+            }
+            for key, values in turn_times.items()
+        },
+        "phases": {
+            phase: {
+                "calls_per_pass": len(values) / repeat,
+                "ms_per_pass": sum(values) * 1000 / repeat,
+                "median_call_ms": statistics.median(values) * 1000,
+            }
+            for phase, values in sorted(phase_times.items())
+        },
+        "total": {
+            "turns_per_pass": turns_per_pass,
+            "ms_per_pass": sum(all_turns) * 1000 / repeat,
+            "median_turn_ms": statistics.median(all_turns) * 1000,
+            "p95_turn_ms": _percentile(all_turns, 95) * 1000,
+        },
+    }
+
+
+def _delta(current: float, baseline: float | None) -> str:
+    if not baseline:
+        return ""
+    return f"{(current - baseline) / baseline * 100:+.1f}%"
+
+
+def _print_report(summary: dict, baseline: dict | None) -> None:
+    base_turns = (baseline or {}).get("turns", {})
+    base_phases = (baseline or {}).get("phases", {})
+    revision = summary["revision"] or "unknown"
+    print(f"run_turn benchmark @ {revision}, python {summary['python']}, {summary['repeat']} passes")
+    if baseline:
+        print(f"compared with {baseline.get('revision') or 'baseline'}")
+    print(f"\n{'turn':<16} {'median ms':>10} {'p95 ms':>10} {'vs base':>9}")
+    for key, stats in summary["turns"].items():
+        base = base_turns.get(key, {}).get("median_ms")
+        print(f"{key:<16} {stats['median_ms']:>10.3f} {stats['p95_ms']:>10.3f} {_delta(stats['median_ms'], base):>9}")
+    print(f"\n{'phase (inclusive)':<20} {'calls/pass':>10} {'ms/pass':>10} {'median ms':>10} {'vs base':>9}")
+    for phase, stats in summary["phases"].items():
+        base = base_phases.get(phase, {}).get("ms_per_pass")
+        print(
+            f"{phase:<20} {stats['calls_per_pass']:>10.1f} {stats['ms_per_pass']:>10.3f} "
+            f"{stats['median_call_ms']:>10.3f} {_delta(stats['ms_per_pass'], base):>9}"
+        )
+    total = summary["total"]
+    base_total = (baseline or {}).get("total", {}).get("ms_per_pass")
+    print(
+        f"\n{total['turns_per_pass']} turns/pass: {total['ms_per_pass']:.2f} ms/pass "
+        f"{_delta(total['ms_per_pass'], base_total)}, median turn {total['median_turn_ms']:.3f} ms, "
+        f"p95 turn {total['p95_turn_ms']:.3f} ms"
+    )
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="BillyRuntime.run_turn benchmark")
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--warmup", type=int, default=2)
+    parser.add_argument("--json", type=Path, help="write results to this file")
+    parser.add_argument("--compare", type=Path, help="results file from an earlier run to compare against")
+    args = parser.parse_args()
+    baseline = json.loads(args.compare.read_text(encoding="utf-8")) if args.compare else None
+
+    turn_times: Dict[str, List[float]] = {}
+    phase_times: Dict[str, List[float]] = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        _isolate_state(root)
+        # The charter loader prints on every load; keep the report readable.
+        with redirect_stdout(io.StringIO()):
+            for iteration in range(args.warmup):
+                _run_corpus(root, f"warmup{iteration}", {})
+            with _instrument(phase_times):
+                for iteration in range(args.repeat):
+                    _run_corpus(root, f"pass{iteration}", turn_times)
+
+    summary = _summarize(turn_times, phase_times, args.repeat)
+    _print_report(summary, baseline)
+    if args.json:
+        args.json.write_text(json.dumps(summary, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
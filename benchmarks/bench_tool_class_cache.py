@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""Tool class lookup cost, uncached import vs mtime-keyed cache.
+
+Agent.get_tool resolves the tool class from its file on every call. This
+times N consecutive lookups of one tool file through
+extract_tools.load_classes_from_file (a full module import each time) and
+through load_classes_from_file_cached (import once, then an mtime check).
+
+Usage:
+    python benchmarks/bench_tool_class_cache.py [--lookups 1000]
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import tempfile
+import textwrap
+import time
+from pathlib import Path
+
+AGENT_ZERO_DIR = Path(__file__).resolve().parents[1] / "v2" / "agent_zero"
+if str(AGENT_ZERO_DIR) not in sys.path:
+    sys.path.insert(0, str(AGENT_ZERO_DIR))
+
+from python.helpers import extract_tools  # noqa: E402
+
+# Roughly the shape of a python/tools module: a few imports and one class
+# (the benchmark resolves against base class `object`, so only one class).
+TOOL_SOURCE = textwrap.dedent(
+    """
+    import asyncio
+    import json
+    import os
+
+
+    class BenchTool:
+        async def execute(self, **kwargs):
+            await asyncio.sleep(0)
+            return {"message": json.dumps(kwargs), "break_loop": False}
+
+        def cwd(self):
+            return os.getcwd()
+    """
+)
+
+
+def _time_lookups(load, path: str, lookups: int) -> float:
+    start = time.perf_counter()
+    for _ in range(lookups):
+        classes = load(path)
+        assert classes and classes[0].__name__ == "BenchTool"
+    return time.perf_counter() - start
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="tool class lookup benchmark")
+    parser.add_argument("--lookups", type=int, default=1000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tool_file = Path(tmp) / "bench_tool.py"
+        tool_file.write_text(TOOL_SOURCE)
+        path = str(tool_file)
+
+        uncached = _time_lookups(
+            lambda p: extract_tools.load_classes_from_file(p, object), path, args.lookups
+        )
+        extract_tools.clear_classes_cache()
+        cached = _time_lookups(
+            lambda p: extract_tools.load_classes_from_file_cached(p, object, cache_key=("", "bench_tool")),
+            path,
+            args.lookups,
+        )
+
+    print(f"{args.lookups} lookups of one tool file")
+    print(f"{'mode':<10} {'total ms':>10} {'per lookup us':>14}")
+    for mode, seconds in (("uncached", uncached), ("cached", cached)):
+        print(f"{mode:<10} {seconds * 1000:>10.1f} {seconds / args.lookups * 1e6:>14.1f}")
+    print(f"speedup: {uncached / cached:.1f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -1,4 +1,7 @@
 import v2.core.command_interpreter as interpreter
+from v2.core.metrics import _MetricsStore
+from v2.core.observability import _TelemetryStore
+from v2.core.trace_report import TelemetryEvent
 
 
 def _set_flags(*, phase3: bool, phase4: bool, phase4_explain: bool, phase5: bool, phase8: bool) -> None:
@@ -184,3 +187,45 @@ def test_sensitive_user_content_is_masked_in_telemetry():
         assert any(value.startswith("<masked:len=") for value in all_values)
     finally:
         _teardown()
+
+
+def _event(session_id: str, index: int) -> TelemetryEvent:
+    return TelemetryEvent(
+        session_id=session_id,
+        correlation_id=f"corr-{index}",
+        timestamp=f"2024-01-01T00:00:{index:02d}+00:00",
+        phase="test",
+        event_type=f"event_{index}",
+        metadata={"index": index},
+    )
+
+
+def test_telemetry_store_keeps_most_recent_events_per_session():
+    store = _TelemetryStore(capacity=4)
+    for index in range(6):
+        store.append(_event("sess-a" if index % 3 else "sess-b", index))
+
+    assert [event.event_type for event in store.by_session("sess-a")] == ["event_2", "event_4", "event_5"]
+    assert [event.event_type for event in store.by_session("sess-b")] == ["event_3"]
+
+    store.set_capacity(1)
+    assert store.by_session("sess-b") == []
+    assert [event.event_type for event in store.by_session("sess-a")] == ["event_5"]
+
+    returned = store.by_session("sess-a")[0]
+    returned.metadata["index"] = -1
+    assert store.by_session("sess-a")[0].metadata == {"index": 5}
+
+
+def test_latency_histograms_report_tail_percentiles():
+    store = _MetricsStore()
+    for value in range(1, 101):
+        store.record_latency("op_latency_ms", float(value))
+
+    latency = store.summary().latencies_ms["op_latency_ms"]
+    assert latency["count"] == 100.0
+    assert latency["min_ms"] == 1.0
+    assert latency["max_ms"] == 100.0
+    for name, expected in (("p50_ms", 50.0), ("p95_ms", 95.0), ("p99_ms", 99.0)):
+        assert expected <= latency[name] <= expected * 1.1
+    assert latency["p50_ms"] <= latency["p95_ms"] <= latency["p99_ms"] <= latency["max_ms"]
@@ -516,3 +516,68 @@ def test_runtime_revoke_and_supersede_flow_is_confirmation_gated_and_non_executi
     assert supersede_replay["status"] == "error"
     assert supersede_replay["final_output"]["type"] == "refusal"
     assert supersede_replay["final_output"]["reason_code"] == "SUPERSESSION_ALREADY_EXISTS"
+
+
+def test_ledger_index_tails_appends_from_other_writers(tmp_path):
+    ledger_path = tmp_path / "ledger.jsonl"
+    reader = ACIIssuanceLedger(ledger_path=ledger_path)
+    writer = ACIIssuanceLedger(ledger_path=ledger_path)
+
+    first = writer.append_issued_artifact(
+        phase_id=28,
+        contract_name="inspection_capabilities_gate.v1",
+        issuer_identity_id="human",
+        environment_id="env-a",
+        lineage_refs=[],
+        request_context={},
+        lineage_required=False,
+    )
+    assert first.ok is True and first.record is not None
+    first_id = str(first.record["artifact_id"])
+    assert reader.lookup_by_artifact_id(first_id) is not None
+    assert reader.is_artifact_revoked(first_id) is False
+
+    revoke = writer.append_revocation_record(
+        revoked_artifact_id=first_id,
+        revocation_reason="superseded by policy",
+        issuer_identity_id="human",
+        environment_id="env-a",
+        request_context={},
+    )
+    assert revoke.ok is True and revoke.record is not None
+    assert reader.is_artifact_revoked(first_id) is True
+    assert reader.has_transition_key(str(revoke.record["transition_key"])) is True
+
+    second = reader.append_issued_artifact(
+        phase_id=29,
+        contract_name="inspection_result_binding.v1",
+        issuer_identity_id="human",
+        environment_id="env-a",
+        lineage_refs=[],
+        request_context={},
+        lineage_required=False,
+    )
+    assert second.ok is True and second.record is not None
+    assert second.record["artifact_id"] == "artifact-p29-00000003"
+
+
+def test_ledger_index_rebuilds_when_file_is_replaced(tmp_path):
+    ledger_path = tmp_path / "ledger.jsonl"
+    ledger = ACIIssuanceLedger(ledger_path=ledger_path)
+    append = ledger.append_issued_artifact(
+        phase_id=28,
+        contract_name="inspection_capabilities_gate.v1",
+        issuer_identity_id="human",
+        environment_id="env-a",
+        lineage_refs=[],
+        request_context={},
+        lineage_required=False,
+    )
+    assert append.ok is True and append.record is not None
+    artifact_id = str(append.record["artifact_id"])
+    assert ledger.lookup_by_artifact_id(artifact_id) is not None
+
+    ledger_path.write_text("", encoding="utf-8")
+    assert ledger.lookup_by_artifact_id(artifact_id) is None
+    assert ledger.lookup_by_phase_id(28) == []
+    assert ledger.has_transition_key(str(append.record["transition_key"])) is False
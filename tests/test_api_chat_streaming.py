@@ -0,0 +1,275 @@
+import asyncio
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+from fastapi.testclient import TestClient
+
+from v2 import api
+from v2.core import llm_api
+
+DELTAS = ["Streaming ", "answers ", "arrive ", "word ", "by ", "word."]
+DELTA_INTERVAL_SECONDS = 0.2
+USAGE = {"prompt_tokens": 11, "completion_tokens": 6, "total_tokens": 17}
+
+
+class _FakeProviderHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.0"
+    # When set, the stream is cut after this many deltas.
+    drop_after = None
+
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length", "0"))
+        request = json.loads(self.rfile.read(length) or b"{}")
+        if request.get("stream"):
+            self._stream(request)
+        else:
+            self._complete(request)
+
+    def _chunk(self, request, choices, usage=None):
+        payload = {
+            "id": "chatcmpl-fake",
+            "object": "chat.completion.chunk",
+            "created": 0,
+            "model": request.get("model", "fake"),
+            "choices": choices,
+        }
+        if usage is not None:
+            payload["usage"] = usage
+        self.wfile.write(f"data: {json.dumps(payload)}\n\n".encode("utf-8"))
+        self.wfile.flush()
+
+    def _stream(self, request):
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        if self.drop_after is not None:
+            # A length the body never reaches makes the early close an error.
+            self.send_header("Content-Length", "1000000")
+        self.end_headers()
+        for i, delta in enumerate(DELTAS):
+            if i == self.drop_after:
+                return
+            if i:
+                time.sleep(DELTA_INTERVAL_SECONDS)
+            self._chunk(request, [{"index": 0, "delta": {"content": delta}, "finish_reason": None}])
+        self._chunk(request, [{"index": 0, "delta": {}, "finish_reason": "stop"}])
+        self._chunk(request, [], usage=USAGE)
+        self.wfile.write(b"data: [DONE]\n\n")
+
+    def _complete(self, request):
+        body = json.dumps(
+            {
+                "id": "chatcmpl-fake",
+                "object": "chat.completion",
+                "created": 0,
+                "model": request.get("model", "fake"),
+                "choices": [
+                    {
+                        "index": 0,
+                        "message": {"role": "assistant", "content": "".join(DELTAS)},
+                        "finish_reason": "stop",
+                    }
+                ],
+                "usage": USAGE,
+            }
+        ).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def client(monkeypatch):
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _FakeProviderHandler)
+    server.daemon_threads = True
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    llm_api.close_clients()
+    monkeypatch.setattr(
+        api.runtime,
+        "config",
+        {
+            "provider": "openai",
+            "api_key": "test-key",
+            "base_url": f"http://127.0.0.1:{server.server_address[1]}/v1",
+            "model_name": "fake-model",
+        },
+    )
+    try:
+        yield TestClient(api.app)
+    finally:
+        llm_api.close_clients()
+        server.shutdown()
+        server.server_close()
+
+
+def _request(stream):
+    return {
+        "model": "billy-v2",
+        "messages": [{"role": "user", "content": "tell me a joke"}],
+        "stream": stream,
+    }
+
+
+def test_non_streaming_reports_usage(client):
+    response = client.post("/v1/chat/completions", json=_request(False))
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["choices"][0]["message"]["content"] == "".join(DELTAS)
+    assert body["usage"] == USAGE
+
+
+def _frames(lines):
+    for line in lines:
+        line = line.strip()
+        if not line.startswith("data: "):
+            continue
+        data = line[len("data: "):]
+        yield data if data == "[DONE]" else json.loads(data)
+
+
+def test_streaming_returns_sse_chunks_with_usage(client):
+    with client.stream("POST", "/v1/chat/completions", json=_request(True)) as response:
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/event-stream")
+        frames = list(_frames(response.iter_lines()))
+
+    assert frames[-1] == "[DONE]"
+    chunks = frames[:-1]
+    assert all(chunk["object"] == "chat.completion.chunk" for chunk in chunks)
+    assert len({chunk["id"] for chunk in chunks}) == 1
+    assert chunks[0]["choices"][0]["delta"]["role"] == "assistant"
+    content = "".join(c["choices"][0]["delta"].get("content", "") for c in chunks if c["choices"])
+    assert content == "".join(DELTAS)
+    assert chunks[-2]["choices"][0]["finish_reason"] == "stop"
+    assert chunks[-1]["choices"] == []
+    assert chunks[-1]["usage"] == USAGE
+
+
+def test_first_content_chunk_arrives_before_the_answer_completes(client):
+    # TestClient buffers streamed bodies, so time the SSE generator itself.
+    start = time.monotonic()
+    first_content_at = None
+    content = []
+
+    async def consume():
+        nonlocal first_content_at
+        async for line in api._stream_chat_completion("tell me a joke", "billy-v2"):
+            for frame in _frames([line]):
+                if frame == "[DONE]" or not frame["choices"]:
+                    continue
+                delta = frame["choices"][0]["delta"].get("content")
+                if delta:
+                    content.append(delta)
+                    if first_content_at is None:
+                        first_content_at = time.monotonic() - start
+
+    asyncio.run(consume())
+    total = time.monotonic() - start
+
+    provider_duration = DELTA_INTERVAL_SECONDS * (len(DELTAS) - 1)
+    assert "".join(content) == "".join(DELTAS)
+    assert len(content) > 1
+    assert total >= provider_duration
+    assert first_content_at is not None
+    assert first_content_at < provider_duration / 2
+
+
+def test_streamed_deltas_match_the_guarded_answer():
+    from v2.core.runtime import _AnswerDeltaGuard
+
+    answer = "  Billy can only help when Chad's repo is ready; Billy must wait. "
+    deltas = ["  Bil", "ly can", " only help when Ch", "ad's repo is ready; Billy", " must wait. "]
+    streamed = []
+    guard = _AnswerDeltaGuard(api.runtime._identity_rewrite, streamed.append)
+    for delta in deltas:
+        guard.feed(delta)
+
+    final = api.runtime._replace_terminal_filler(api.runtime._identity_guard("", answer))
+    sent = "".join(streamed)
+    assert sent
+    assert final.startswith(sent)
+    assert final == "I can only help when your repo is ready; I must wait."
+
+    shouted = ["The plan: ", "BILLY ", "MUST wait for the deploy", " to finish."]
+    streamed = []
+    guard = _AnswerDeltaGuard(api.runtime._identity_rewrite, streamed.append)
+    for delta in shouted:
+        guard.feed(delta)
+
+    assert "".join(streamed) == "The plan: "
+    with pytest.raises(RuntimeError, match="third-person Billy reference remained"):
+        api.runtime._identity_guard("", "".join(shouted))
+
+
+def test_words_that_may_complete_a_blocked_phrase_are_held_back():
+    from v2.core.runtime import _AnswerDeltaGuard
+
+    streamed = []
+    guard = _AnswerDeltaGuard(api.runtime._identity_rewrite, streamed.append)
+    for delta in ["Billy ", "can ", "only ", "help ", "BILLY ", "Should ", "stop"]:
+        guard.feed(delta)
+    assert "".join(streamed) == "I can only help "
+
+    streamed = []
+    guard = _AnswerDeltaGuard(api.runtime._identity_rewrite, streamed.append)
+    for delta in ["Billy\n", "  must ", "go now ", "ok"]:
+        guard.feed(delta)
+    assert "".join(streamed) == "I must go now"
+    assert api.runtime._identity_guard("", "Billy\n  must go now ok").startswith("".join(streamed))
+
+
+def test_possible_terminal_filler_is_held_back():
+    from v2.core.runtime import _AnswerDeltaGuard
+
+    streamed = []
+    guard = _AnswerDeltaGuard(api.runtime._identity_rewrite, streamed.append)
+    for delta in ["Let ", "me ", "know", "."]:
+        guard.feed(delta)
+
+    assert streamed == []
+
+
+def test_divergent_final_answer_ends_the_stream_with_an_error(monkeypatch):
+    def ask(session, prompt, on_delta=None):
+        on_delta("Sure, ")
+        return "No.", dict(USAGE)
+
+    monkeypatch.setattr(api, "_ask_with_usage", ask)
+
+    async def consume():
+        return [line async for line in api._stream_chat_completion("tell me a joke", "billy-v2")]
+
+    frames = list(_frames(asyncio.run(consume())))
+
+    assert frames[-1] == "[DONE]"
+    assert frames[-2]["error"]["type"] == "server_error"
+    chunks = [frame for frame in frames[:-2] if "choices" in frame]
+    assert "".join(c["choices"][0]["delta"].get("content", "") for c in chunks) == "Sure, "
+    assert all(c["choices"][0]["finish_reason"] is None for c in chunks)
+    assert not any("usage" in frame for frame in frames[:-1])
+
+
+def test_provider_dropping_the_stream_ends_it_with_an_error(client, monkeypatch):
+    monkeypatch.setattr(_FakeProviderHandler, "drop_after", 2)
+    with client.stream("POST", "/v1/chat/completions", json=_request(True)) as response:
+        assert response.status_code == 200
+        frames = list(_frames(response.iter_lines()))
+
+    assert frames[-1] == "[DONE]"
+    assert frames[-2]["error"]["type"] == "server_error"
+    assert "interrupted" in frames[-2]["error"]["message"]
+    chunks = frames[:-2]
+    content = "".join(c["choices"][0]["delta"].get("content", "") for c in chunks)
+    # The delta guard holds back trailing whitespace until more text follows.
+    assert content == "".join(DELTAS[:2]).rstrip()
+    assert all(c["choices"][0]["finish_reason"] is None for c in chunks)
+    assert not any("usage" in c for c in chunks)
@@ -0,0 +1,242 @@
+import asyncio
+import re
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from fastapi.testclient import TestClient
+
+from v2 import api
+import v2.core.runtime as runtime_mod
+from v2.core.sessions import SessionRegistry
+
+CLIENTS = 8
+LLM_LATENCY_SECONDS = 0.2
+
+
+def _session_id() -> str:
+    return f"load-{uuid.uuid4().hex[:12]}"
+
+
+def _ask(client: TestClient, session_id: str, prompt: str) -> dict:
+    response = client.post("/ask", json={"prompt": prompt}, headers={api.SESSION_HEADER: session_id})
+    assert response.status_code == 200
+    assert response.headers[api.SESSION_HEADER] == session_id
+    return response.json()
+
+
+def _run_clients(fn, count: int = CLIENTS) -> list:
+    start = threading.Barrier(count)
+
+    def client_main(index: int):
+        client = TestClient(api.app)
+        start.wait()
+        return fn(client, index)
+
+    with ThreadPoolExecutor(max_workers=count) as pool:
+        return list(pool.map(client_main, range(count)))
+
+
+def test_concurrent_sessions_keep_drafts_apart():
+    session_ids = [_session_id() for _ in range(CLIENTS)]
+
+    def create_draft(client, index):
+        result = _ask(client, session_ids[index], f"draft: update parser in src/parser_{index}.py")
+        assert result["status"] == "success"
+        return re.search(r"approve: (draft-\w+)", result["final_output"]).group(1)
+
+    draft_ids = _run_clients(create_draft)
+    assert len(set(draft_ids)) == CLIENTS
+
+    def approve(client, index):
+        other = draft_ids[(index + 1) % CLIENTS]
+        foreign = _ask(client, session_ids[index], f"approve: {other}")
+        own = _ask(client, session_ids[index], f"approve: {draft_ids[index]}")
+        return foreign["final_output"], own["final_output"]
+
+    for foreign, own in _run_clients(approve):
+        assert foreign == "Approval rejected: draft_id does not exist."
+        assert own.startswith("APPROVAL_ACCEPTED")
+
+    for index, session_id in enumerate(session_ids):
+        state = api.sessions.get(session_id).state
+        assert list(state.cdm_drafts) == [draft_ids[index]]
+        assert list(state.approved_drafts) == [draft_ids[index]]
+    assert not set(draft_ids) & set(runtime_mod._cdm_drafts)
+
+
+def test_concurrent_sessions_keep_tool_drafts_apart():
+    session_ids = [_session_id() for _ in range(CLIENTS)]
+
+    def create_tool_draft(client, index):
+        result = _ask(client, session_ids[index], f"tool: design log.scan.{index} for diagnostics")
+        assert result["status"] == "success"
+        return re.search(r"tool_draft_id: (tool-draft-\w+)", result["final_output"]).group(1)
+
+    tool_draft_ids = _run_clients(create_tool_draft)
+    assert len(set(tool_draft_ids)) == CLIENTS
+
+    def approve_and_register(client, index):
+        other = tool_draft_ids[(index + 1) % CLIENTS]
+        outputs = [
+            _ask(client, session_ids[index], f"approve tool: {other}"),
+            _ask(client, session_ids[index], f"approve tool: {tool_draft_ids[index]}"),
+            _ask(client, session_ids[index], f"register tool: {other}"),
+            _ask(client, session_ids[index], f"register tool: {tool_draft_ids[index]}"),
+        ]
+        return [output["final_output"] for output in outputs]
+
+    for foreign_approval, own_approval, foreign_registration, own_registration in _run_clients(approve_and_register):
+        assert foreign_approval == "Tool approval rejected: tool_draft_id does not exist."
+        assert own_approval.startswith("TOOL_APPROVAL_ACCEPTED")
+        assert foreign_registration == "Tool registration rejected: tool_draft_id does not exist."
+        assert own_registration.startswith("TOOL_REGISTRATION_ACCEPTED")
+
+    for index, session_id in enumerate(session_ids):
+        state = api.sessions.get(session_id).state
+        assert list(state.tool_drafts) == [tool_draft_ids[index]]
+        assert list(state.approved_tools) == [tool_draft_ids[index]]
+        # registered tools form one catalogue that every session sees
+        assert f"log.scan.{index}@{tool_draft_ids[index]}" in runtime_mod._registered_tools
+    assert not set(tool_draft_ids) & set(runtime_mod._tool_drafts)
+
+    # another session finds the registered tool's approval (and then stops at
+    # executability, which TDM drafts leave disabled)
+    result = _ask(TestClient(api.app), _session_id(), 'run tool: log.scan.0 {"request_context": "x"}')
+    assert result["final_output"] == "Tool execution rejected: executability is disabled."
+
+
+def test_interactive_prompts_stay_in_their_session():
+    session_ids = [_session_id() for _ in range(CLIENTS)]
+
+    def converse(client, index):
+        capture = _ask(client, session_ids[index], "use styled html for this session")
+        assert capture["interactive_prompt_type"] == "preference_capture"
+        _ask(client, session_ids[index], "yes" if index % 2 == 0 else "no")
+
+    _run_clients(converse)
+
+    runtimes = [api.sessions.get(session_id).runtime for session_id in session_ids]
+    assert len({id(rt) for rt in runtimes}) == CLIENTS
+    assert all(rt is not api.runtime for rt in runtimes)
+    for index, rt in enumerate(runtimes):
+        expected = {"website_style": "styled"} if index % 2 == 0 else {}
+        assert rt._session_preferences == expected
+        assert rt._interactive_prompt_state is None
+    assert api.runtime._session_preferences == {}
+
+
+@pytest.fixture
+def slow_llm(monkeypatch):
+    def answer(self, prompt):
+        time.sleep(LLM_LATENCY_SECONDS)
+        return f"Answer to: {prompt}"
+
+    monkeypatch.setattr(runtime_mod.BillyRuntime, "_llm_answer", answer)
+
+
+def _chat(client: TestClient, session_id: str, prompt: str) -> str:
+    response = client.post(
+        "/v1/chat/completions",
+        json={"messages": [{"role": "user", "content": prompt}], "session_id": session_id},
+    )
+    assert response.status_code == 200
+    return response.json()["choices"][0]["message"]["content"]
+
+
+def test_throughput_scales_across_sessions(slow_llm):
+    assert api.API_WORKERS >= CLIENTS
+    session_ids = [_session_id() for _ in range(CLIENTS)]
+
+    started = time.monotonic()
+    answers = _run_clients(lambda client, index: _chat(client, session_ids[index], f"tell me joke {index}"))
+    elapsed = time.monotonic() - started
+
+    assert answers == [f"Answer to: tell me joke {index}" for index in range(CLIENTS)]
+    assert elapsed < CLIENTS * LLM_LATENCY_SECONDS / 2
+
+
+def test_turns_within_a_session_are_serialized(slow_llm):
+    session_id = _session_id()
+    count = 4
+
+    started = time.monotonic()
+    _run_clients(lambda client, index: _chat(client, session_id, f"tell me joke {index}"), count=count)
+    elapsed = time.monotonic() - started
+
+    assert elapsed >= count * LLM_LATENCY_SECONDS * 0.9
+
+
+def test_turns_queued_on_one_session_do_not_hold_workers(slow_llm):
+    busy_session = _session_id()
+    other_session = _session_id()
+    queued = api.API_WORKERS + 2
+
+    async def main():
+        client_turns = [
+            api._run_in_session(api.sessions.get(busy_session), lambda: time.sleep(LLM_LATENCY_SECONDS))
+            for _ in range(queued)
+        ]
+        backlog = asyncio.gather(*client_turns)
+        await asyncio.sleep(LLM_LATENCY_SECONDS / 4)
+
+        started = time.monotonic()
+        await api._run_in_session(api.sessions.get(other_session), lambda: None)
+        other_elapsed = time.monotonic() - started
+        await backlog
+        return other_elapsed
+
+    other_elapsed = asyncio.run(main())
+
+    # Without loop-side queueing every pool worker would sit on the busy
+    # session's lock and the other turn would wait for the whole backlog.
+    assert other_elapsed < LLM_LATENCY_SECONDS
+
+
+def test_invalid_session_id_is_rejected():
+    client = TestClient(api.app)
+    response = client.post("/ask", json={"prompt": "hello", "session_id": "../etc/passwd"})
+
+    assert response.status_code == 400
+
+
+def test_lookup_keeps_an_idle_session_from_being_evicted():
+    registry = SessionRegistry(runtime_factory=object, default_runtime=object(), idle_timeout_seconds=0.05)
+    session = registry.get("kept")
+    time.sleep(0.1)
+
+    assert registry.get("kept") is session
+    registry.get("other")
+    assert "kept" in registry
+
+    async def queue_behind_running_turn():
+        await session.acquire_turn()
+        waiter = asyncio.ensure_future(session.acquire_turn())
+        await asyncio.sleep(0)
+        time.sleep(0.1)
+        registry.get("newcomer")
+        assert "kept" in registry
+        session.release_turn()
+        await waiter
+        session.release_turn()
+
+    asyncio.run(queue_behind_running_turn())
+    assert not session.in_use()
+
+
+def test_registry_evicts_least_recently_used_idle_session():
+    registry = SessionRegistry(runtime_factory=object, default_runtime=object(), max_sessions=2)
+    first = registry.get("first")
+    registry.get("second")
+
+    with first.lock:
+        registry.get("third")
+        assert "first" in registry
+        assert "second" not in registry
+
+    registry.get("first")
+    registry.get("fourth")
+    assert "third" not in registry
+    assert len(registry) == 2
@@ -0,0 +1,57 @@
+import os
+
+import pytest
+
+from v2.core.contracts import loader
+from v2.core.contracts.loader import ContractViolation, load_schema, validate_trace_event
+
+
+def _event(**overrides):
+    event = {
+        "trace_id": "trace-1",
+        "event_id": "evt-1",
+        "event_type": "tool_call",
+        "timestamp": "2026-01-01T00:00:00Z",
+        "actor": {"component": "tool_runner"},
+        "payload": {},
+    }
+    event.update(overrides)
+    return event
+
+
+def test_validator_is_compiled_once_and_reused():
+    loader.clear_schema_cache()
+    validate_trace_event(_event())
+    first = loader.get_validator("trace-event.schema.yaml")
+    validate_trace_event(_event(event_id="evt-2"))
+    assert loader.get_validator("trace-event.schema.yaml") is first
+
+
+def test_invalid_event_raises_contract_violation():
+    with pytest.raises(ContractViolation, match="TraceEvent validation failed"):
+        validate_trace_event(_event(actor={"component": "unknown"}))
+
+
+def test_load_schema_returns_independent_copies():
+    schema = load_schema("trace-event.schema.yaml")
+    schema["required"].append("tampered")
+    assert "tampered" not in load_schema("trace-event.schema.yaml")["required"]
+
+
+def test_schema_cache_invalidates_on_mtime_change(tmp_path, monkeypatch):
+    schema_path = tmp_path / "demo.schema.yaml"
+    schema_path.write_text("type: object\nrequired: [a]\n", encoding="utf-8")
+    monkeypatch.setattr(loader, "CONTRACTS_DIR", tmp_path)
+    loader.clear_schema_cache()
+    assert load_schema("demo.schema.yaml")["required"] == ["a"]
+
+    schema_path.write_text("type: object\nrequired: [b]\n", encoding="utf-8")
+    stat = schema_path.stat()
+    os.utime(schema_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    assert load_schema("demo.schema.yaml")["required"] == ["b"]
+
+
+def test_missing_schema_raises_contract_violation(tmp_path, monkeypatch):
+    monkeypatch.setattr(loader, "CONTRACTS_DIR", tmp_path)
+    with pytest.raises(ContractViolation, match="Missing required contract schema"):
+        load_schema("absent.schema.yaml")
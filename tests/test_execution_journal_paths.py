@@ -1,3 +1,4 @@
+import json
 import shutil
 
 from v2.core.execution.execution_journal import ExecutionJournal
@@ -13,3 +14,69 @@ def test_append_recreates_parent_after_cwd_change(tmp_path, monkeypatch):
     journal.append({"execution": {"trace_id": "trace-1"}})
 
     assert journal.records_path.exists()
+
+
+def test_resolution_index_tracks_appends_and_external_writes(tmp_path):
+    journal = ExecutionJournal(base_dir=str(tmp_path / "executions"))
+    assert journal.resolution_records("task-1") == []
+
+    journal.append(
+        journal.build_resolution_record(
+            trace_id="trace-1",
+            task_id="task-1",
+            resolution_type="RESOLVED",
+            resolution_message="done",
+            next_step=None,
+            evidence_fingerprint="fp-1",
+            contract_version="m27.v1",
+        )
+    )
+    journal.append({"execution": {"trace_id": "trace-1"}})
+    records = journal.resolution_records("task-1")
+    assert [record["evidence_fingerprint"] for record in records] == ["fp-1"]
+
+    other = ExecutionJournal(base_dir=str(tmp_path / "executions"))
+    other.append(
+        other.build_resolution_record(
+            trace_id="trace-1",
+            task_id="task-2",
+            resolution_type="RESOLVED",
+            resolution_message="done",
+            next_step=None,
+            evidence_fingerprint="fp-2",
+            contract_version="m27.v1",
+        )
+    )
+    assert [record["task_id"] for record in journal.resolution_records("task-2")] == ["task-2"]
+
+    journal.records_path.write_text("", encoding="utf-8")
+    assert journal.resolution_records("task-1") == []
+
+
+def test_resolution_index_rebuilds_after_a_rewrite_that_grows_the_journal(tmp_path):
+    journal = ExecutionJournal(base_dir=str(tmp_path / "executions"))
+
+    def resolution(task_id, fingerprint):
+        return journal.build_resolution_record(
+            trace_id="trace-1",
+            task_id=task_id,
+            resolution_type="RESOLVED",
+            resolution_message="done",
+            next_step=None,
+            evidence_fingerprint=fingerprint,
+            contract_version="m27.v1",
+        )
+
+    journal.append(resolution("task-1", "fp-1"))
+    assert [record["evidence_fingerprint"] for record in journal.resolution_records("task-1")] == ["fp-1"]
+    inode = journal.records_path.stat().st_ino
+
+    # Same inode, more bytes than were indexed, but not an append.
+    lines = [resolution("task-2", "fp-2"), resolution("task-1", "fp-rewritten")]
+    with journal.records_path.open("r+") as handle:
+        handle.write("".join(json.dumps(line) + "\n" for line in lines))
+        handle.truncate()
+
+    assert journal.records_path.stat().st_ino == inode
+    assert [record["evidence_fingerprint"] for record in journal.resolution_records("task-1")] == ["fp-rewritten"]
+    assert [record["task_id"] for record in journal.resolution_records("task-2")] == ["task-2"]
@@ -0,0 +1,104 @@
+import json
+
+import pytest
+
+from v2.core.contracts.loader import ContractViolation
+from v2.core.memory.file_memory_store import SCOPE_INDEX_FILENAME, FileMemoryStore
+
+
+def _entry(content: str, user_id: str = "default", session_id: str | None = None) -> dict:
+    return {
+        "content": content,
+        "scope": {"user_id": user_id, "persona_id": None, "session_id": session_id},
+        "metadata": {"category": "user_note"},
+    }
+
+
+def test_query_returns_only_matching_scope_in_write_order(tmp_path):
+    store = FileMemoryStore(base_dir=str(tmp_path))
+    store.write(_entry("a1", user_id="alice"), trace_id="t")
+    store.write(_entry("b1", user_id="bob"), trace_id="t")
+    store.write(_entry("a2", user_id="alice", session_id="s1"), trace_id="t")
+
+    assert [m["content"] for m in store.query({"user_id": "alice"}, trace_id="t")] == ["a1", "a2"]
+    assert [m["content"] for m in store.query({"user_id": "alice", "session_id": "s1"}, trace_id="t")] == ["a2"]
+    assert [m["content"] for m in store.query({"user_id": "carol"}, trace_id="t")] == []
+    assert len(store.query({"user_id": None}, trace_id="t")) == 3
+
+
+def test_query_newest_first_with_limit_skips_older_entries(tmp_path):
+    store = FileMemoryStore(base_dir=str(tmp_path))
+    for n in range(5):
+        store.write(_entry(f"note-{n}"), trace_id="t")
+
+    latest = store.query({"user_id": "default"}, trace_id="t", limit=2, newest_first=True)
+    assert [m["content"] for m in latest] == ["note-4", "note-3"]
+
+
+def test_rewriting_an_entry_moves_it_between_scopes(tmp_path):
+    store = FileMemoryStore(base_dir=str(tmp_path))
+    entry = store.write(_entry("moving", user_id="alice"), trace_id="t")
+    store.write(dict(entry, scope={"user_id": "bob"}), trace_id="t")
+
+    assert store.query({"user_id": "alice"}, trace_id="t") == []
+    assert [m["content"] for m in store.query({"user_id": "bob"}, trace_id="t")] == ["moving"]
+
+
+def test_index_is_rebuilt_when_missing_or_stale(tmp_path):
+    store = FileMemoryStore(base_dir=str(tmp_path))
+    store.write(_entry("kept", user_id="alice"), trace_id="t")
+    (tmp_path / SCOPE_INDEX_FILENAME).unlink()
+    (tmp_path / "external.json").write_text(
+        json.dumps(dict(_entry("external", user_id="alice"), id="external")),
+        encoding="utf-8",
+    )
+
+    reopened = FileMemoryStore(base_dir=str(tmp_path))
+    contents = sorted(m["content"] for m in reopened.query({"user_id": "alice"}, trace_id="t"))
+    assert contents == ["external", "kept"]
+    assert (tmp_path / SCOPE_INDEX_FILENAME).exists()
+
+
+def test_second_store_sees_appends_from_first(tmp_path):
+    first = FileMemoryStore(base_dir=str(tmp_path))
+    second = FileMemoryStore(base_dir=str(tmp_path))
+    first.write(_entry("shared", user_id="alice"), trace_id="t")
+    assert [m["content"] for m in second.query({"user_id": "alice"}, trace_id="t")] == ["shared"]
+
+
+def test_constructing_a_store_writes_no_index(tmp_path):
+    store = FileMemoryStore(base_dir=str(tmp_path))
+    assert not (tmp_path / SCOPE_INDEX_FILENAME).exists()
+
+    assert store.query({"user_id": "alice"}, trace_id="t") == []
+    assert (tmp_path / SCOPE_INDEX_FILENAME).exists()
+
+
+def test_numeric_and_boolean_scope_values_match_by_equality(tmp_path):
+    store = FileMemoryStore(base_dir=str(tmp_path))
+    store.write({"content": "int", "scope": {"tier": 1}, "metadata": {}}, trace_id="t")
+    store.write({"content": "float", "scope": {"tier": 1.0}, "metadata": {}}, trace_id="t")
+    store.write({"content": "bool", "scope": {"tier": True}, "metadata": {}}, trace_id="t")
+    store.write({"content": "zero", "scope": {"tier": 0}, "metadata": {}}, trace_id="t")
+    store.write({"content": "text", "scope": {"tier": "1"}, "metadata": {}}, trace_id="t")
+
+    for value in (1, 1.0, True):
+        assert [m["content"] for m in store.query({"tier": value}, trace_id="t")] == ["int", "float", "bool"]
+    assert [m["content"] for m in store.query({"tier": False}, trace_id="t")] == ["zero"]
+    assert [m["content"] for m in store.query({"tier": "1"}, trace_id="t")] == ["text"]
+
+
+def test_unhashable_scope_values_fall_back_to_a_scan(tmp_path):
+    store = FileMemoryStore(base_dir=str(tmp_path))
+    store.write({"content": "tagged", "scope": {"tags": ["a", "b"], "user_id": "alice"}, "metadata": {}}, trace_id="t")
+    store.write({"content": "other", "scope": {"tags": ["c"], "user_id": "alice"}, "metadata": {}}, trace_id="t")
+
+    assert [m["content"] for m in store.query({"tags": ["a", "b"]}, trace_id="t")] == ["tagged"]
+    assert [m["content"] for m in store.query({"tags": ["c"], "user_id": "alice"}, trace_id="t")] == ["other"]
+    assert store.query({"tags": {"a", "b"}}, trace_id="t") == []
+
+
+def test_invalid_entry_is_rejected(tmp_path):
+    store = FileMemoryStore(base_dir=str(tmp_path))
+    with pytest.raises(ContractViolation):
+        store.write({"content": "x"}, trace_id="t")
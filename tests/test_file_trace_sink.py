@@ -0,0 +1,110 @@
+import json
+import time
+
+import pytest
+
+from v2.core.trace.file_trace_sink import FileTraceSink
+
+
+def _event(trace_id: str, n: int) -> dict:
+    return {"trace_id": trace_id, "event_id": f"evt-{n}", "event_type": "demo"}
+
+
+def _lines(path):
+    if not path.exists():
+        return []
+    return [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines()]
+
+
+def test_unbuffered_sink_writes_each_event_immediately(tmp_path):
+    sink = FileTraceSink(base_dir=str(tmp_path))
+    sink.emit(_event("t1", 1))
+    assert [e["event_id"] for e in _lines(tmp_path / "t1.jsonl")] == ["evt-1"]
+
+
+def test_buffered_sink_batches_until_size_threshold(tmp_path):
+    sink = FileTraceSink(
+        base_dir=str(tmp_path),
+        buffered=True,
+        max_buffered_events=3,
+        flush_interval_seconds=3600,
+    )
+    sink.emit(_event("t1", 1))
+    sink.emit(_event("t1", 2))
+    assert _lines(tmp_path / "t1.jsonl") == []
+
+    sink.emit(_event("t1", 3))
+    assert [e["event_id"] for e in _lines(tmp_path / "t1.jsonl")] == ["evt-1", "evt-2", "evt-3"]
+    sink.close()
+
+
+def test_buffered_sink_flushes_on_time_threshold(tmp_path):
+    sink = FileTraceSink(base_dir=str(tmp_path), buffered=True, flush_interval_seconds=0)
+    sink.emit(_event("t1", 1))
+    assert [e["event_id"] for e in _lines(tmp_path / "t1.jsonl")] == ["evt-1"]
+    sink.close()
+
+
+def test_buffered_sink_flush_and_get_trace_see_pending_events(tmp_path):
+    sink = FileTraceSink(base_dir=str(tmp_path), buffered=True, durability="none", flush_interval_seconds=3600)
+    sink.emit(_event("t1", 1))
+    sink.emit(_event("t2", 1))
+    assert [e["event_id"] for e in sink.get_trace("t1")] == ["evt-1"]
+
+    sink.flush()
+    assert [e["event_id"] for e in _lines(tmp_path / "t1.jsonl")] == ["evt-1"]
+    sink.close()
+    assert [e["event_id"] for e in _lines(tmp_path / "t2.jsonl")] == ["evt-1"]
+
+
+def test_buffered_sink_bounds_open_handles(tmp_path):
+    sink = FileTraceSink(
+        base_dir=str(tmp_path),
+        buffered=True,
+        durability="fsync",
+        max_open_files=2,
+        max_buffered_events=1,
+    )
+    for n, trace_id in enumerate(["a", "b", "c", "a"]):
+        sink.emit(_event(trace_id, n))
+    assert len(sink._handles) == 2
+    assert [e["event_id"] for e in _lines(tmp_path / "a.jsonl")] == ["evt-0", "evt-3"]
+    sink.close()
+    assert len(sink._handles) == 0
+
+
+def test_unknown_durability_is_rejected(tmp_path):
+    with pytest.raises(ValueError):
+        FileTraceSink(base_dir=str(tmp_path), durability="eventually")
+
+
+def test_buffered_sink_flushes_a_quiet_trace_on_a_timer(tmp_path):
+    sink = FileTraceSink(
+        base_dir=str(tmp_path),
+        buffered=True,
+        durability="none",
+        flush_interval_seconds=0.05,
+    )
+    sink.emit(_event("t1", 1))
+    sink.emit(_event("t1", 2))
+    assert _lines(tmp_path / "t1.jsonl") == []
+
+    deadline = time.monotonic() + 5
+    while not _lines(tmp_path / "t1.jsonl") and time.monotonic() < deadline:
+        time.sleep(0.02)
+    # Read straight from disk, as TraceInspector does.
+    assert [e["event_id"] for e in _lines(tmp_path / "t1.jsonl")] == ["evt-1", "evt-2"]
+    assert sink._timer is None
+    sink.close()
+
+
+def test_runtime_falls_back_to_flush_for_an_unknown_durability(monkeypatch, caplog):
+    from v2.core import runtime
+
+    monkeypatch.setenv("BILLY_TRACE_DURABILITY", "fsnyc")
+    with caplog.at_level("WARNING", logger=runtime.__name__):
+        assert runtime._trace_durability_from_env() == "flush"
+    assert "fsnyc" in caplog.text
+
+    monkeypatch.setenv("BILLY_TRACE_DURABILITY", " FSYNC ")
+    assert runtime._trace_durability_from_env() == "fsync"
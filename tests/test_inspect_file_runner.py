@@ -253,3 +253,44 @@ def test_inspect_directory_respects_depth_limit(tmp_path):
     assert deep["status"] == "ok"
     deep_paths = {str(row["path"]) for row in deep["entries"]}
     assert str((workspace_root / "level1" / "level2")) in deep_paths
+
+
+def test_inspect_directory_pages_resume_in_path_order(tmp_path):
+    workspace_root = tmp_path / "workspace"
+    workspace_root.mkdir()
+    # "b" sorts before "b.txt", whose path sorts before everything under "b/".
+    for directory in ("b", "b/inner", "b-side", "c"):
+        (workspace_root / directory).mkdir()
+    for file_name in ("a.txt", "b.txt", "b/x.txt", "b/inner/y.txt", "b-side/z.txt", "c/w.txt"):
+        (workspace_root / file_name).write_text("x", encoding="utf-8")
+
+    complete = inspect_mod.inspect_directory({"path": ".", "max_depth": 3, "page_size": 50}, workspace_root)
+    assert [row["path"] for row in complete["entries"]] == sorted(row["path"] for row in complete["entries"])
+
+    paged = []
+    page_token = None
+    while True:
+        page = inspect_mod.inspect_directory(
+            {"path": ".", "max_depth": 3, "page_size": 2, "page_token": page_token},
+            workspace_root,
+        )
+        assert page["status"] == "ok"
+        paged.extend(page["entries"])
+        page_token = page["next_page_token"]
+        if page_token is None:
+            break
+
+    assert paged == complete["entries"]
+    assert len(paged) == 10
+
+
+def test_inspect_directory_rejects_invalid_page_token(tmp_path):
+    workspace_root = tmp_path / "workspace"
+    workspace_root.mkdir()
+    (workspace_root / "a.txt").write_text("a", encoding="utf-8")
+
+    for page_token in ("2", "not-a-cursor", "eyJ2IjoxLCJhZnRlciI6WyIuLiIsImV0YyJdfQ=="):
+        result = inspect_mod.inspect_directory({"path": ".", "page_token": page_token}, workspace_root)
+        assert result["status"] == "error"
+        assert result["error"]["code"] == "INVALID_ARGUMENT"
+        assert result["entries"] == []
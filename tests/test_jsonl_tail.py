@@ -0,0 +1,96 @@
+import json
+
+import pytest
+
+from v2.core.jsonl_tail import JsonlTailIndex
+
+
+def _tail(path):
+    def index_line(index, raw, offset, line_num):
+        if raw.strip():
+            index.append((line_num, offset, json.loads(raw)["n"]))
+
+    return JsonlTailIndex(path, list, index_line)
+
+
+def _line(n):
+    return json.dumps({"n": n}) + "\n"
+
+
+def test_appends_are_read_from_the_indexed_offset(tmp_path):
+    path = tmp_path / "log.jsonl"
+    path.write_text(_line(1) + _line(2))
+    tail = _tail(path)
+    index = tail.get()
+    assert index == [(1, 0, 1), (2, len(_line(1)), 2)]
+
+    with path.open("a") as handle:
+        handle.write("\n" + _line(3))
+    assert tail.get() is index
+    assert index[-1] == (4, 2 * len(_line(1)) + 1, 3)
+
+
+def test_missing_file_has_no_index(tmp_path):
+    tail = _tail(tmp_path / "absent.jsonl")
+    assert tail.get() is None
+
+
+def test_unterminated_final_line_is_indexed_once(tmp_path):
+    path = tmp_path / "log.jsonl"
+    path.write_text(_line(1) + '{"n": 2}')
+    tail = _tail(path)
+    assert [n for _, _, n in tail.get()] == [1, 2]
+
+    with path.open("a") as handle:
+        handle.write("\n" + _line(3))
+    assert tail.get() == [(1, 0, 1), (2, len(_line(1)), 2), (3, 2 * len(_line(1)), 3)]
+
+
+def test_torn_final_line_waits_for_the_rest_of_the_append(tmp_path):
+    path = tmp_path / "log.jsonl"
+    path.write_text(_line(1) + '{"n": ')
+    tail = _tail(path)
+    assert [n for _, _, n in tail.get()] == [1]
+
+    with path.open("a") as handle:
+        handle.write("2}\n")
+    assert [n for _, _, n in tail.get()] == [1, 2]
+
+
+@pytest.mark.parametrize("rewrite", ["grown", "same_size", "truncated", "completed_line"])
+def test_rewrite_in_place_is_indexed_from_the_start(tmp_path, rewrite):
+    path = tmp_path / "log.jsonl"
+    original = _line(1) + _line(2)
+    if rewrite == "completed_line":
+        original = _line(1) + '{"n": 2}'
+    path.write_text(original)
+    tail = _tail(path)
+    first = tail.get()
+    inode = path.stat().st_ino
+
+    replacement = {
+        "grown": _line(7) + _line(8) + _line(9),
+        "same_size": _line(7) + _line(8),
+        "truncated": _line(7),
+        "completed_line": _line(1) + '{"n": 2, "x": 1}\n',
+    }[rewrite]
+    with path.open("r+") as handle:
+        handle.write(replacement)
+        handle.truncate()
+
+    assert path.stat().st_ino == inode
+    index = tail.get()
+    assert index is not first
+    expected = {"grown": [7, 8, 9], "same_size": [7, 8], "truncated": [7], "completed_line": [1, 2]}[rewrite]
+    assert [n for _, _, n in index] == expected
+
+
+def test_rejected_line_is_retried_with_its_line_number(tmp_path):
+    path = tmp_path / "log.jsonl"
+    path.write_text(_line(1) + "{not json\n" + _line(3))
+    tail = _tail(path)
+
+    for _ in range(2):
+        with pytest.raises(ValueError):
+            tail.get()
+    assert tail.index == [(1, 0, 1)]
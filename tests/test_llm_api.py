@@ -0,0 +1,99 @@
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from v2.core import llm_api
+
+
+class _CompletionHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length", "0"))
+        request = json.loads(self.rfile.read(length) or b"{}")
+        body = json.dumps(
+            {
+                "id": "chatcmpl-stub",
+                "object": "chat.completion",
+                "created": 0,
+                "model": request.get("model", "stub"),
+                "choices": [
+                    {
+                        "index": 0,
+                        "message": {"role": "assistant", "content": "stub reply"},
+                        "finish_reason": "stop",
+                    }
+                ],
+                "usage": {"prompt_tokens": 1, "completion_tokens": 2, "total_tokens": 3},
+            }
+        ).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class _CountingServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.connections = 0
+
+    def process_request(self, request, client_address):
+        self.connections += 1
+        super().process_request(request, client_address)
+
+
+@pytest.fixture
+def stub_server():
+    server = _CountingServer(("127.0.0.1", 0), _CompletionHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    llm_api.close_clients()
+    try:
+        yield server
+    finally:
+        llm_api.close_clients()
+        server.shutdown()
+        server.server_close()
+
+
+def _config(server, **overrides):
+    config = {
+        "provider": "openai",
+        "api_key": "test-key",
+        "base_url": f"http://127.0.0.1:{server.server_address[1]}/v1",
+        "model_name": "stub-model",
+    }
+    config.update(overrides)
+    return config
+
+
+def test_get_completion_reuses_one_connection(stub_server):
+    config = _config(stub_server)
+    messages = [{"role": "user", "content": "hi"}]
+    for _ in range(5):
+        assert llm_api.get_completion(messages, config) == "stub reply"
+    assert stub_server.connections == 1
+
+
+def test_clients_are_keyed_by_provider_base_url_and_key(stub_server):
+    config = _config(stub_server)
+    first = llm_api.get_client("openai", config["base_url"], "key-a", config)
+    assert llm_api.get_client("openai", config["base_url"], "key-a", config) is first
+    assert llm_api.get_client("openai", config["base_url"], "key-b", config) is not first
+    assert llm_api.get_client("openrouter", config["base_url"], "key-a", config) is not first
+
+
+def test_connection_settings_come_from_config(stub_server):
+    config = _config(stub_server, timeout_seconds=7, connect_timeout_seconds=2, max_connections=3)
+    client = llm_api.get_client("openai", config["base_url"], "key-a", config)
+    assert client.timeout.read == 7
+    assert client.timeout.connect == 2
@@ -1,4 +1,6 @@
 import json
+import threading
+import time
 
 import v2.core.evidence as evidence
 import v2.core.introspection as introspection
@@ -66,3 +68,63 @@ def test_invalid_scope_refused(tmp_path, monkeypatch):
 def test_readonly_commands_only():
     forbidden = {"rm", "touch", "mkdir", "dd", "mkfs"}
     assert not (forbidden & introspection.READONLY_COMMANDS)
+
+
+def test_probes_run_concurrently_with_deterministic_evidence_order(tmp_path, monkeypatch):
+    _setup_evidence(tmp_path, monkeypatch)
+    sections = ["network", "host", "filesystem", "services", "containers"]
+    barrier = threading.Barrier(len(sections), timeout=5)
+
+    def probe(section, delay):
+        def run():
+            barrier.wait()
+            time.sleep(delay)
+            return {"first": section, "second": section}
+        return run
+
+    for index, section in enumerate(sections):
+        monkeypatch.setattr(introspection, f"_probe_{section}", probe(section, 0.05 * (len(sections) - index)))
+
+    snapshot = introspection.collect_environment_snapshot(sections)
+
+    assert snapshot.network == {"first": "network", "second": "network"}
+    path = evidence.EVIDENCE_DIR / "trace-1.jsonl"
+    claims = [json.loads(line)["claim"] for line in path.read_text().splitlines()]
+    assert claims == [
+        f"{section}.{key}" for section in introspection.DEFAULT_SCOPE for key in ("first", "second")
+    ]
+
+
+def test_probe_errors_surface_in_section_order(tmp_path, monkeypatch):
+    _setup_evidence(tmp_path, monkeypatch)
+
+    def refuse(code):
+        def run():
+            raise introspection.IntrospectionError(code, code)
+        return run
+
+    monkeypatch.setattr(introspection, "_probe_host", lambda: {"hostname": "test-host"})
+    monkeypatch.setattr(introspection, "_probe_services", refuse("PRIVILEGE_REQUIRED"))
+    monkeypatch.setattr(introspection, "_probe_containers", refuse("ENV_AMBIGUOUS"))
+    try:
+        introspection.collect_environment_snapshot(["containers", "services", "host"])
+        assert False, "Expected IntrospectionError"
+    except introspection.IntrospectionError as exc:
+        assert exc.code == "PRIVILEGE_REQUIRED"
+    assert evidence.list_evidence("host.hostname")
+
+
+def test_service_commands_run_concurrently(monkeypatch):
+    started = []
+    barrier = threading.Barrier(3, timeout=5)
+
+    def fake_run(command, timeout=introspection.COMMAND_TIMEOUT_SECONDS):
+        started.append(command[0])
+        barrier.wait()
+        return True, f"{command[0]} output"
+
+    monkeypatch.setattr(introspection, "_run_command", fake_run)
+    services = introspection._probe_services()
+    assert sorted(started) == ["ps", "ss", "systemctl"]
+    assert services["process_list"] == ["ps output"]
+    assert services["listening_ports"] == ["ss output"]
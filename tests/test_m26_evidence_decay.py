@@ -1,3 +1,4 @@
+import json
 from datetime import datetime, timedelta, timezone
 
 import v2.core.evidence as evidence
@@ -116,3 +117,70 @@ def test_m26_does_not_override_m23_refusals(tmp_path, monkeypatch):
     failure = evaluate_failure_modes(task, RuntimeContext(trace_id="trace-1", user_input="", via_ops=False))
     assert failure.status == "refuse"
     assert failure.failure_code == "IRREVERSIBLE_NO_ACK"
+
+
+def test_claim_index_tails_appends_and_drops_decayed_entries(tmp_path, monkeypatch):
+    _setup_evidence(tmp_path, monkeypatch)
+    base = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    monkeypatch.setattr(evidence, "_now", lambda: base)
+    for index, ttl in enumerate((1, 1, 100)):
+        evidence.record_evidence(
+            claim="disk healthy",
+            source_type="command",
+            source_ref=f"smartctl -a /dev/sd{index}",
+            raw_content="PASSED",
+            ttl_seconds=ttl,
+        )
+    assert evidence.confidence_for_claim("disk healthy", base) == evidence.CONFIDENCE_MULTI
+
+    later = base + timedelta(seconds=5)
+    assert evidence.confidence_for_claim("disk healthy", later) == evidence.CONFIDENCE_SINGLE
+    index = evidence._CLAIM_INDEXES[evidence._evidence_path("trace-1")].index
+    assert len(index.live["disk healthy"]) == 1
+    assert len(index.records["disk healthy"]) == 3
+    # Asking about an earlier instant still sees the entries dropped from the live set.
+    assert evidence.confidence_for_claim("disk healthy", base) == evidence.CONFIDENCE_MULTI
+
+    monkeypatch.setattr(evidence, "_now", lambda: later)
+    evidence.record_evidence(
+        claim="disk healthy",
+        source_type="command",
+        source_ref="smartctl -a /dev/sd3",
+        raw_content="FAILED",
+    )
+    assert evidence._CLAIM_INDEXES[evidence._evidence_path("trace-1")].index is index
+    assert len(evidence.list_evidence("disk healthy")) == 4
+    assert evidence._evaluate_claim_records("disk healthy", later)[0] == "conflict"
+
+    evidence._evidence_path("trace-1").write_text("")
+    assert evidence.list_evidence("disk healthy") == []
+
+
+def test_claim_index_reads_an_unterminated_last_record(tmp_path, monkeypatch):
+    _setup_evidence(tmp_path, monkeypatch)
+    evidence.record_evidence(
+        claim="disk healthy",
+        source_type="command",
+        source_ref="smartctl -a /dev/sda",
+        raw_content="PASSED",
+    )
+    path = evidence._evidence_path("trace-1")
+    assert len(evidence.list_evidence("disk healthy")) == 1
+
+    # Another writer's record without its trailing newline still counts.
+    record = evidence.list_evidence("disk healthy")[0].to_dict()
+    record["evidence_id"] = "manual"
+    with path.open("a", encoding="utf-8") as handle:
+        handle.write(json.dumps(record, sort_keys=True))
+    assert [item.evidence_id for item in evidence.list_evidence("disk healthy")][-1] == "manual"
+
+    # Its newline arriving later does not index it a second time.
+    with path.open("a", encoding="utf-8") as handle:
+        handle.write("\n")
+    evidence.record_evidence(
+        claim="disk healthy",
+        source_type="command",
+        source_ref="smartctl -a /dev/sdb",
+        raw_content="PASSED",
+    )
+    assert len(evidence.list_evidence("disk healthy")) == 3
@@ -1,5 +1,7 @@
 from datetime import datetime, timezone
 
+import pytest
+
 import v2.core.causal_trace as causal_trace
 import v2.core.evidence as evidence
 import v2.core.introspection as introspection
@@ -109,3 +111,57 @@ def test_causal_trace_answers_match_nodes(tmp_path, monkeypatch):
     assert "evidence" in chain
     assert "decision" in chain
     assert "outcome" in chain
+
+
+def test_topological_order_breaks_ties_by_timestamp_then_id():
+    stamp = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+    def node(node_id, seconds):
+        return causal_trace.CausalNode(node_id, "ACTION", node_id, "task-1", None, None, stamp.replace(second=seconds))
+
+    nodes = [node("d", 0), node("c", 1), node("b", 1), node("a", 2), node("e", 0)]
+    edges = [
+        causal_trace.CausalEdge("d", "a", "caused_by"),
+        causal_trace.CausalEdge("d", "c", "caused_by"),
+        causal_trace.CausalEdge("e", "b", "caused_by"),
+    ]
+    ordered = causal_trace._topological_order(nodes, edges)
+    assert [n.node_id for n in ordered] == ["d", "e", "b", "c", "a"]
+
+    edges.append(causal_trace.CausalEdge("a", "d", "caused_by"))
+    assert causal_trace._topological_order(nodes, edges) is None
+
+
+def test_trace_index_follows_appends_and_rewrites(tmp_path, monkeypatch):
+    _setup_dirs(tmp_path, monkeypatch)
+    path = causal_trace.load_trace("trace-1")
+    cause = causal_trace.create_node("DECISION", "pick nginx", related_task_id="task-1")
+    effect = causal_trace.create_node("ACTION", "install nginx", related_task_id="task-1")
+    causal_trace.create_node("ACTION", "unrelated", related_task_id="task-2")
+    causal_trace.create_edge(cause.node_id, effect.node_id, "caused_by")
+
+    records = causal_trace.get_causal_trace(task_id="task-1")
+    assert records == [cause, effect, causal_trace.CausalEdge(cause.node_id, effect.node_id, "caused_by")]
+    index = causal_trace._TRACE_INDEXES[path].index
+
+    outcome = causal_trace.create_node("OUTCOME", "nginx serving", related_task_id="task-3")
+    causal_trace.create_edge(effect.node_id, outcome.node_id, "caused_by")
+    assert causal_trace._TRACE_INDEXES[path].index is index
+    assert outcome in causal_trace.get_causal_trace(task_id="task-1")
+    assert causal_trace.find_latest_node_id("OUTCOME", "nginx serving") == outcome.node_id
+
+    path.write_text("")
+    assert causal_trace.get_causal_trace(task_id="task-1") == []
+    assert causal_trace.find_latest_node_id("OUTCOME", "nginx serving") is None
+
+
+def test_malformed_trace_line_reports_a_stable_line_number(tmp_path, monkeypatch):
+    _setup_dirs(tmp_path, monkeypatch)
+    path = causal_trace.load_trace("trace-1")
+    causal_trace.create_node("DECISION", "pick nginx", related_task_id="task-1")
+    with path.open("a", encoding="utf-8") as handle:
+        handle.write("{not json\n")
+
+    for _ in range(2):
+        with pytest.raises(ValueError, match="line 2"):
+            causal_trace.get_causal_trace(task_id="task-1")
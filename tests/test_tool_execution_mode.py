@@ -6,6 +6,7 @@ def _reset_tem_state():
     runtime_mod._approved_tools.clear()
     runtime_mod._tool_approval_audit.clear()
     runtime_mod._registered_tools.clear()
+    runtime_mod._registered_tool_drafts.clear()
     runtime_mod._tool_registration_audit.clear()
     runtime_mod._pending_tool_executions.clear()
     runtime_mod._tool_execution_audit.clear()
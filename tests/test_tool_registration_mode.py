@@ -6,6 +6,7 @@ def _reset_trm_state():
     runtime_mod._approved_tools.clear()
     runtime_mod._tool_approval_audit.clear()
     runtime_mod._registered_tools.clear()
+    runtime_mod._registered_tool_drafts.clear()
     runtime_mod._tool_registration_audit.clear()
 
 
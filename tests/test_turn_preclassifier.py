@@ -0,0 +1,152 @@
+import ast
+import re
+from pathlib import Path
+
+import pytest
+
+import v2.core.causal_trace as causal_trace
+import v2.core.evidence as evidence
+import v2.core.runtime as runtime_mod
+import v2.core.task_graph as tg
+from v2.core.execution.execution_journal import ExecutionJournal
+from v2.core.sessions import SessionState, session_scope
+
+TESTS_DIR = Path(__file__).resolve().parent
+_VOLATILE = re.compile(
+    r"\d{4}-\d{2}-\d{2}T[\d:.+Z-]+|[0-9a-f]{8}-[0-9a-f-]{27}|[0-9a-f]{8,}|trace-\S+|\b\d{10,}\b"
+)
+
+
+def _turn_sequences():
+    """Utterance literals passed to run_turn/ask, per test function, in source order."""
+    sequences = []
+    for path in sorted(TESTS_DIR.glob("test_*.py")):
+        tree = ast.parse(path.read_text(encoding="utf-8"))
+        for node in ast.walk(tree):
+            if not isinstance(node, ast.FunctionDef):
+                continue
+            calls = []
+            for call in ast.walk(node):
+                if not (isinstance(call, ast.Call) and isinstance(call.func, ast.Attribute)):
+                    continue
+                if call.func.attr not in {"run_turn", "ask"}:
+                    continue
+                arg = call.args[0] if call.args else next(
+                    (kw.value for kw in call.keywords if kw.arg in {"user_input", "prompt"}), None
+                )
+                if isinstance(arg, ast.Constant) and isinstance(arg.value, str):
+                    calls.append((call.lineno, call.col_offset, arg.value))
+            if calls:
+                sequences.append((f"{path.name}::{node.name}", [text for *_, text in sorted(calls)]))
+    return sequences
+
+
+# Wordings the phase tests do not use, one per trigger-bearing predicate branch.
+EXTRA_UTTERANCES = (
+    "Objective: ship the landing page",
+    "the objective here is a faster build",
+    "I want to end up with a working demo",
+    "We must keep the API stable",
+    "Do not touch the database",
+    "keep it under 100 lines",
+    "No javascript please",
+    "Let's assume the server runs Debian",
+    "assume we have docker",
+    "Decision: use sqlite",
+    "lets go with option b",
+    "that's the plan",
+    "explain this as a product manager",
+    "switch into senior-engineer mode",
+    "from a researcher's perspective",
+    "summary and recommendation please",
+    "just tell me what to do",
+    "please soften the feedback",
+    "sound confident",
+    "I prefer markdown output",
+    "format as html",
+    "build me a homepage",
+)
+
+SEQUENCES = _turn_sequences()
+UTTERANCES = sorted({text for _, texts in SEQUENCES for text in texts} | set(EXTRA_UTTERANCES))
+
+
+class _EveryFamily:
+    def classify(self, utterance):
+        return frozenset(runtime_mod._CONVERSATION_LAYER_TRIGGERS)
+
+
+@pytest.fixture(autouse=True)
+def stub_llm(monkeypatch):
+    monkeypatch.setattr(runtime_mod.BillyRuntime, "_llm_answer", lambda self, prompt: "stub answer")
+
+
+def _signature(result):
+    if not isinstance(result, dict):
+        return _VOLATILE.sub("#", str(result))
+    return (
+        result.get("status"),
+        result.get("mode"),
+        result.get("interactive_prompt_type"),
+        _VOLATILE.sub("#", str(result.get("final_output"))),
+    )
+
+
+def _isolate_persistent_state(monkeypatch, state_dir):
+    for module, attr, name in (
+        (tg, "TASK_GRAPH_DIR", "task_graph"),
+        (evidence, "EVIDENCE_DIR", "evidence"),
+        (causal_trace, "CAUSAL_TRACE_DIR", "causal_traces"),
+    ):
+        monkeypatch.setattr(module, attr, state_dir / name)
+        (state_dir / name).mkdir(parents=True, exist_ok=True)
+        monkeypatch.setattr(module, "_CURRENT_TRACE_ID", None)
+    monkeypatch.setattr(tg, "_GRAPHS", {})
+    monkeypatch.setattr(runtime_mod, "_execution_journal", ExecutionJournal(str(state_dir / "executions")))
+
+
+def _replay(monkeypatch, texts, state_dir):
+    _isolate_persistent_state(monkeypatch, state_dir)
+    runtime = runtime_mod.BillyRuntime(config={}, aci_ledger_path=str(state_dir / "ledger.jsonl"))
+    signatures = []
+    with session_scope(SessionState()):
+        for index, text in enumerate(texts):
+            try:
+                result = runtime.run_turn(text, {"trace_id": f"trace-golden-{index}"})
+            except Exception as exc:
+                result = f"{type(exc).__name__}: {exc}"
+            signatures.append(_signature(result))
+    return signatures
+
+
+def test_corpus_covers_phase_tests():
+    assert len(SEQUENCES) > 100
+    assert any(name.startswith("test_phase") for name, _ in SEQUENCES)
+
+
+@pytest.mark.parametrize("utterance", UTTERANCES)
+def test_routes_of_absent_families_cannot_match(utterance):
+    families = runtime_mod._TURN_PRECLASSIFIER.classify(utterance)
+    normalized = utterance.strip()
+    for family, route in runtime_mod._CONVERSATION_LAYER_ROUTES:
+        if family is None or family in families:
+            continue
+        runtime = runtime_mod.BillyRuntime(config={})
+        assert getattr(runtime, route)(normalized, "trace-golden") is None, (family, route)
+
+
+@pytest.mark.parametrize("name,texts", SEQUENCES, ids=[name for name, _ in SEQUENCES])
+def test_turns_route_identically_with_and_without_preclassifier(monkeypatch, tmp_path, name, texts):
+    screened = _replay(monkeypatch, texts, tmp_path / "screened")
+    monkeypatch.setattr(runtime_mod, "_TURN_PRECLASSIFIER", _EveryFamily())
+    unscreened = _replay(monkeypatch, texts, tmp_path / "unscreened")
+
+    assert screened == unscreened
+
+
+def test_classifier_reports_overlapping_triggers():
+    families = runtime_mod._TURN_PRECLASSIFIER.classify("Let's  brainstorm STEP BY STEP about goals")
+
+    assert {"task_mode", "tone", "goal"} <= families
+    assert "website" not in families
+    assert runtime_mod._TURN_PRECLASSIFIER.classify("tell me about the weather") == frozenset()
@@ -1,4 +1,4 @@
-import asyncio, random, string
+import asyncio, random, string, threading
 import nest_asyncio
 
 nest_asyncio.apply()
@@ -40,6 +40,11 @@ class AgentContext:
     _contexts: dict[str, "AgentContext"] = {}
     _counter: int = 0
     _notification_manager = None
+    # Change counter for polling: bumped whenever a context's output() or the set of contexts changes
+    _version: int = 0
+    _version_lock = threading.Lock()
+    # Attributes that feed output(); assigning one marks the context changed
+    _OUTPUT_ATTRS = frozenset({"name", "paused", "created_at", "type", "last_message", "output_data"})
 
     def __init__(
         self,
@@ -82,8 +87,21 @@ class AgentContext:
         self.last_message = last_message or datetime.now(timezone.utc)
         self.data = data or {}
         self.output_data = output_data or {}
+        self.mark_changed()
 
+    def __setattr__(self, name: str, value: Any):
+        object.__setattr__(self, name, value)
+        if name in AgentContext._OUTPUT_ATTRS:
+            self.mark_changed()
 
+    def mark_changed(self):
+        with AgentContext._version_lock:
+            AgentContext._version += 1
+            object.__setattr__(self, "version", AgentContext._version)
+
+    @staticmethod
+    def current_version() -> int:
+        return AgentContext._version
 
     @staticmethod
     def get(id: str):
@@ -138,6 +156,8 @@ class AgentContext:
     @staticmethod
     def remove(id: str):
         context = AgentContext._contexts.pop(id, None)
+        if context:
+            context.mark_changed()
         if context and context.task:
             context.task.kill()
         return context
@@ -157,6 +177,7 @@ class AgentContext:
     def set_output_data(self, key: str, value: Any, recursive: bool = True):
         # recursive is not used now, prepared for context hierarchy
         self.output_data[key] = value
+        self.mark_changed()
 
     def output(self):
         return {
@@ -895,12 +916,14 @@ class Agent:
         from python.helpers.tool import Tool
 
         classes = []
+        # resolved classes are cached until the tool file changes
+        cache_key = (self.config.profile, name)
 
         # try agent tools first
         if self.config.profile:
             try:
-                classes = extract_tools.load_classes_from_file(
-                    "agents/" + self.config.profile + "/tools/" + name + ".py", Tool  # type: ignore[arg-type]
+                classes = extract_tools.load_classes_from_file_cached(
+                    "agents/" + self.config.profile + "/tools/" + name + ".py", Tool, cache_key=cache_key  # type: ignore[arg-type]
                 )
             except Exception:
                 pass
@@ -908,8 +931,8 @@ class Agent:
         # try default tools
         if not classes:
             try:
-                classes = extract_tools.load_classes_from_file(
-                    "python/tools/" + name + ".py", Tool  # type: ignore[arg-type]
+                classes = extract_tools.load_classes_from_file_cached(
+                    "python/tools/" + name + ".py", Tool, cache_key=cache_key  # type: ignore[arg-type]
                 )
             except Exception as e:
                 pass
@@ -1,3 +1,5 @@
+import uuid
+
 from python.helpers.api import ApiHandler, Request, Response
 
 from agent import AgentContext, AgentContextType
@@ -34,85 +36,19 @@ class Poll(ApiHandler):
         notification_manager = AgentContext.get_notification_manager()
         notifications = notification_manager.output(start=notifications_from)
 
-        # loop AgentContext._contexts
-
         # Get a task scheduler instance
         scheduler = TaskScheduler.get()
 
-        # Always reload the scheduler on each poll to ensure we have the latest task state
-        # await scheduler.reload() # does not seem to be needed
-
-        # loop AgentContext._contexts and divide into contexts and tasks
-
-        ctxs = []
-        tasks = []
-        processed_contexts = set()  # Track processed context IDs
-
-        all_ctxs = list(AgentContext._contexts.values())
-        # First, identify all tasks
-        for ctx in all_ctxs:
-            # Skip if already processed
-            if ctx.id in processed_contexts:
-                continue
-
-            # Skip BACKGROUND contexts as they should be invisible to users
-            if ctx.type == AgentContextType.BACKGROUND:
-                processed_contexts.add(ctx.id)
-                continue
-
-            # Create the base context data that will be returned
-            context_data = ctx.output()
-
-            context_task = scheduler.get_task_by_uuid(ctx.id)
-            # Determine if this is a task-dedicated context by checking if a task with this UUID exists
-            is_task_context = (
-                context_task is not None and context_task.context_id == ctx.id
-            )
-
-            if not is_task_context:
-                ctxs.append(context_data)
-            else:
-                # If this is a task, get task details from the scheduler
-                task_details = scheduler.serialize_task(ctx.id)
-                if task_details:
-                    # Add task details to context_data with the same field names
-                    # as used in scheduler endpoints to maintain UI compatibility
-                    context_data.update({
-                        "task_name": task_details.get("name"),  # name is for context, task_name for the task name
-                        "uuid": task_details.get("uuid"),
-                        "state": task_details.get("state"),
-                        "type": task_details.get("type"),
-                        "system_prompt": task_details.get("system_prompt"),
-                        "prompt": task_details.get("prompt"),
-                        "last_run": task_details.get("last_run"),
-                        "last_result": task_details.get("last_result"),
-                        "attachments": task_details.get("attachments", []),
-                        "context_id": task_details.get("context_id"),
-                    })
-
-                    # Add type-specific fields
-                    if task_details.get("type") == "scheduled":
-                        context_data["schedule"] = task_details.get("schedule")
-                    elif task_details.get("type") == "planned":
-                        context_data["plan"] = task_details.get("plan")
-                    else:
-                        context_data["token"] = task_details.get("token")
-
-                tasks.append(context_data)
-
-            # Mark as processed
-            processed_contexts.add(ctx.id)
-
-        # Sort tasks and chats by their creation date, descending
-        ctxs.sort(key=lambda x: x["created_at"], reverse=True)
-        tasks.sort(key=lambda x: x["created_at"], reverse=True)
+        # Chats and tasks lists: the client echoes contexts_version back, and only
+        # what changed since then is serialized and sent
+        contexts_version = f"{_EPOCH}:{AgentContext.current_version()}:{scheduler.version}:{timezone}"
+        sidebar = _sidebar(scheduler, timezone, contexts_version, input.get("contexts_version"))
 
         # data from this server
         return {
             "deselect_chat": ctxid and not context,
             "context": context.id if context else "",
-            "contexts": ctxs,
-            "tasks": tasks,
+            **sidebar,
             "logs": logs,
             "log_guid": context.log.guid if context else "",
             "log_version": len(context.log.updates) if context else 0,
@@ -123,3 +59,124 @@ class Poll(ApiHandler):
             "notifications_guid": notification_manager.guid,
             "notifications_version": len(notification_manager.updates),
         }
+
+
+# Versions restart with the process; the epoch keeps old clients' versions from matching
+_EPOCH = uuid.uuid4().hex[:8]
+
+# Serialized list entries by context id, reused until their inputs change:
+# id -> ((context version, scheduler version for tasks, timezone), is_task, entry)
+_entries: dict[str, tuple[tuple, bool, dict]] = {}
+
+
+def _sidebar(scheduler: TaskScheduler, timezone: str, contexts_version: str, client_version) -> dict:
+    if client_version == contexts_version:
+        # Nothing changed since the client's last poll
+        return {
+            "contexts_version": contexts_version,
+            "contexts_delta": True,
+            "contexts": [],
+            "tasks": [],
+            "context_ids": None,
+            "task_ids": None,
+        }
+
+    since = _parse_contexts_version(client_version, timezone)
+    global _entries
+    entries: dict[str, tuple[tuple, bool, dict]] = {}
+    ctxs = []
+    tasks = []
+    changed_ids = set()
+
+    for ctx in list(AgentContext._contexts.values()):
+        # Skip BACKGROUND contexts as they should be invisible to users
+        if ctx.type == AgentContextType.BACKGROUND or ctx.id in entries:
+            continue
+
+        cached = _entries.get(ctx.id)
+        context_task = scheduler.get_task_by_uuid(ctx.id)
+        # Determine if this is a task-dedicated context by checking if a task with this UUID exists
+        is_task_context = context_task is not None and context_task.context_id == ctx.id
+        key = (ctx.version, scheduler.version if is_task_context else None, timezone)
+        if cached is not None and cached[0] == key:
+            entry = cached[2]
+        else:
+            entry = _serialize_context(ctx, scheduler, is_task_context)
+        entries[ctx.id] = (key, is_task_context, entry)
+
+        (tasks if is_task_context else ctxs).append(entry)
+        if since is None:
+            continue
+        since_context, since_scheduler = since
+        if ctx.version > since_context or (is_task_context and scheduler.version != since_scheduler):
+            changed_ids.add(ctx.id)
+
+    _entries = entries
+
+    # Sort tasks and chats by their creation date, descending
+    ctxs.sort(key=lambda x: x["created_at"], reverse=True)
+    tasks.sort(key=lambda x: x["created_at"], reverse=True)
+
+    if since is None:
+        return {
+            "contexts_version": contexts_version,
+            "contexts_delta": False,
+            "contexts": ctxs,
+            "tasks": tasks,
+        }
+    return {
+        "contexts_version": contexts_version,
+        "contexts_delta": True,
+        "contexts": [entry for entry in ctxs if entry["id"] in changed_ids],
+        "tasks": [entry for entry in tasks if entry["id"] in changed_ids],
+        "context_ids": [entry["id"] for entry in ctxs],
+        "task_ids": [entry["id"] for entry in tasks],
+    }
+
+
+def _parse_contexts_version(value, timezone: str) -> tuple[int, int] | None:
+    """(context version, scheduler version) from a client's contexts_version, if usable for a delta."""
+    if not isinstance(value, str):
+        return None
+    parts = value.split(":", 3)
+    if len(parts) != 4 or parts[0] != _EPOCH or parts[3] != timezone:
+        return None
+    try:
+        return int(parts[1]), int(parts[2])
+    except ValueError:
+        return None
+
+
+def _serialize_context(ctx: AgentContext, scheduler: TaskScheduler, is_task_context: bool) -> dict:
+    # Create the base context data that will be returned
+    context_data = ctx.output()
+    if not is_task_context:
+        return context_data
+
+    # If this is a task, get task details from the scheduler
+    task_details = scheduler.serialize_task(ctx.id)
+    if task_details:
+        # Add task details to context_data with the same field names
+        # as used in scheduler endpoints to maintain UI compatibility
+        context_data.update({
+            "task_name": task_details.get("name"),  # name is for context, task_name for the task name
+            "uuid": task_details.get("uuid"),
+            "state": task_details.get("state"),
+            "type": task_details.get("type"),
+            "system_prompt": task_details.get("system_prompt"),
+            "prompt": task_details.get("prompt"),
+            "last_run": task_details.get("last_run"),
+            "last_result": task_details.get("last_result"),
+            "attachments": task_details.get("attachments", []),
+            "context_id": task_details.get("context_id"),
+        })
+
+        # Add type-specific fields
+        if task_details.get("type") == "scheduled":
+            context_data["schedule"] = task_details.get("schedule")
+        elif task_details.get("type") == "planned":
+            context_data["plan"] = task_details.get("plan")
+        else:
+            context_data["token"] = task_details.get("token")
+
+    return context_data
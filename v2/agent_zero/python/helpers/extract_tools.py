@@ -1,4 +1,4 @@
-import re, os, importlib, importlib.util, inspect
+import re, os, importlib, importlib.util, inspect, threading
 from types import ModuleType
 from typing import Any, Type, TypeVar
 from .dirty_json import DirtyJson
@@ -118,3 +118,29 @@ def load_classes_from_file(file: str, base_class: type[T], one_per_file: bool =
                 break
                 
     return classes
+
+
+# (cache key, abs path, base class, one_per_file) -> (file mtime_ns, classes)
+_file_classes_cache: dict[tuple, tuple[int, list[type]]] = {}
+_file_classes_cache_lock = threading.Lock()
+
+def load_classes_from_file_cached(file: str, base_class: type[T], one_per_file: bool = True, cache_key: tuple = ()) -> list[type[T]]:
+    """Like load_classes_from_file, but only imports the file again when its mtime changes."""
+    abs_path = get_abs_path(file)
+    mtime_ns = os.stat(abs_path).st_mtime_ns  # missing file raises, like the import would
+    key = (*cache_key, abs_path, base_class, one_per_file)
+
+    with _file_classes_cache_lock:
+        cached = _file_classes_cache.get(key)
+    if cached and cached[0] == mtime_ns:
+        return list(cached[1])
+
+    classes = load_classes_from_file(file, base_class, one_per_file)
+    with _file_classes_cache_lock:
+        _file_classes_cache[key] = (mtime_ns, classes)
+    return list(classes)
+
+def clear_classes_cache():
+    with _file_classes_cache_lock:
+        _file_classes_cache.clear()
+
@@ -277,6 +277,8 @@ class Log:
 
         self.updates += [item.no]
         self._update_progress_from_item(item)
+        if self.context:
+            self.context.mark_changed()
 
     def set_progress(self, progress: str, no: int = 0, active: bool = True):
         progress = self._mask_recursive(progress)
@@ -310,6 +312,8 @@ class Log:
         self.updates = []
         self.logs = []
         self.set_initial_progress()
+        if self.context:
+            self.context.mark_changed()
 
     def _update_progress_from_item(self, item: LogItem):
         if item.heading and item.update_progress != "none":
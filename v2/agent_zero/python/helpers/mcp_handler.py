@@ -17,6 +17,9 @@ from typing import (
 )
 import threading
 import asyncio
+import atexit
+import time
+import weakref
 from contextlib import AsyncExitStack
 from shutil import which
 from datetime import timedelta
@@ -24,6 +27,7 @@ import json
 from python.helpers import errors
 from python.helpers import settings
 
+import anyio
 import httpx
 
 from mcp import ClientSession, StdioServerParameters
@@ -252,8 +256,14 @@ class MCPServerRemote(BaseModel):
     ) -> CallToolResult:
         """Call a tool with the given input data"""
         with self.__lock:
-            # We already run in an event loop, dont believe Pylance
-            return await self.__client.call_tool(tool_name, input_data)  # type: ignore
+            client = self.__client
+        # do not hold the lock while the call runs, the client limits concurrency itself
+        return await client.call_tool(tool_name, input_data)  # type: ignore
+
+    def close_session(self) -> None:
+        """Close the persistent MCP session (reopened on next use)"""
+        with self.__lock:
+            self.__client.close_session()  # type: ignore
 
     def update(self, config: dict[str, Any]) -> "MCPServerRemote":
         with self.__lock:
@@ -280,6 +290,7 @@ class MCPServerRemote(BaseModel):
             return asyncio.run(self.__on_update())
 
     async def __on_update(self) -> "MCPServerRemote":
+        self.__client.close_session()  # type: ignore # config may have changed
         await self.__client.update_tools()  # type: ignore
         return self
 
@@ -331,8 +342,14 @@ class MCPServerLocal(BaseModel):
     ) -> CallToolResult:
         """Call a tool with the given input data"""
         with self.__lock:
-            # We already run in an event loop, dont believe Pylance
-            return await self.__client.call_tool(tool_name, input_data)  # type: ignore
+            client = self.__client
+        # do not hold the lock while the call runs, the client limits concurrency itself
+        return await client.call_tool(tool_name, input_data)  # type: ignore
+
+    def close_session(self) -> None:
+        """Close the persistent MCP session (reopened on next use)"""
+        with self.__lock:
+            self.__client.close_session()  # type: ignore
 
     def update(self, config: dict[str, Any]) -> "MCPServerLocal":
         with self.__lock:
@@ -357,6 +374,7 @@ class MCPServerLocal(BaseModel):
             return asyncio.run(self.__on_update())
 
     async def __on_update(self) -> "MCPServerLocal":
+        self.__client.close_session()  # type: ignore # config may have changed
         await self.__client.update_tools()  # type: ignore
         return self
 
@@ -465,6 +483,13 @@ class MCPConfig(BaseModel):
                 "servers": servers_data
             }  # Prepare data for re-initialization or update
 
+            # Replaced servers would otherwise keep their MCP sessions (and stdio processes) open
+            for server in instance.servers:
+                try:
+                    server.close_session()
+                except Exception:
+                    pass
+
             # Option 1: Re-initialize the existing instance (if __init__ is idempotent for other fields)
             instance.__init__(servers_list=servers_data)
 
@@ -782,10 +807,86 @@ class MCPConfig(BaseModel):
 T = TypeVar("T")
 
 
+# All pooled MCP sessions live on one background event loop. Sessions are bound
+# to the loop that opened them, while callers come from many loops (agent
+# contexts, asyncio.run in MCPServer*.update), so operations are submitted here.
+_session_loop: Optional[asyncio.AbstractEventLoop] = None
+_session_loop_lock = threading.Lock()
+_session_clients: "weakref.WeakSet[MCPClientBase]" = weakref.WeakSet()
+
+
+def _get_session_loop() -> asyncio.AbstractEventLoop:
+    global _session_loop
+    with _session_loop_lock:
+        if _session_loop is None or _session_loop.is_closed():
+            loop = asyncio.new_event_loop()
+            threading.Thread(
+                target=loop.run_forever, name="mcp-sessions", daemon=True
+            ).start()
+            _session_loop = loop
+        return _session_loop
+
+
+def _close_all_sessions() -> None:
+    loop = _session_loop
+    if loop is None or loop.is_closed():
+        return
+
+    async def close_all():
+        owners = [client._close_session() for client in list(_session_clients)]
+        await asyncio.gather(*owners, return_exceptions=True)
+
+    try:
+        asyncio.run_coroutine_threadsafe(close_all(), loop).result(timeout=5)
+    except Exception:
+        pass
+
+
+atexit.register(_close_all_sessions)
+
+
+def _unwrap_exception(e: BaseException) -> BaseException:
+    excs = getattr(e, "exceptions", None)  # Python 3.11+ ExceptionGroup
+    while excs:
+        e = excs[0]
+        excs = getattr(e, "exceptions", None)
+    return e
+
+
+class _PooledSession:
+    """An initialized ClientSession kept open by an owner task on the session loop."""
+
+    def __init__(self):
+        self.session: Optional[ClientSession] = None
+        self.stop = asyncio.Event()
+        self.owner: Optional[asyncio.Task] = None
+        self.in_flight = 0
+        self.last_used = time.monotonic()
+        self.suspect = False  # last operation failed, ping before reuse
+
+    @property
+    def alive(self) -> bool:
+        return (
+            self.session is not None
+            and not self.stop.is_set()
+            and self.owner is not None
+            and not self.owner.done()
+        )
+
+
 class MCPClientBase(ABC):
     # server: Union[MCPServerLocal, MCPServerRemote] # Defined in __init__
     # tools: List[dict[str, Any]] # Defined in __init__
-    # No self.session, self.exit_stack, self.stdio, self.write as persistent instance fields
+    # One persistent session per client, see _execute_with_session
+
+    # Pooled session tuning
+    SESSION_IDLE_TIMEOUT_SECONDS: ClassVar[float] = 300.0
+    SESSION_HEALTH_CHECK_SECONDS: ClassVar[float] = 30.0  # ping sessions idle longer than this before reuse
+    SESSION_PING_TIMEOUT_SECONDS: ClassVar[float] = 5.0
+    SESSION_MAX_CONCURRENCY: ClassVar[int] = 4
+    SESSION_CONNECT_ATTEMPTS: ClassVar[int] = 3
+    SESSION_BACKOFF_SECONDS: ClassVar[float] = 0.5
+    SESSION_BACKOFF_MAX_SECONDS: ClassVar[float] = 8.0
 
     __lock: ClassVar[threading.Lock] = threading.Lock()
 
@@ -795,6 +896,11 @@ class MCPClientBase(ABC):
         self.error: str = ""
         self.log: List[str] = []
         self.log_file: Optional[TextIO] = None
+        # session loop state, only touched from the session loop
+        self._session: Optional[_PooledSession] = None
+        self._session_lock: Optional[asyncio.Lock] = None
+        self._session_slots: Optional[asyncio.Semaphore] = None
+        _session_clients.add(self)
 
     # Protected method
     @abstractmethod
@@ -813,62 +919,181 @@ class MCPClientBase(ABC):
         read_timeout_seconds=60,
     ) -> T:
         """
-        Manages the lifecycle of an MCP session for a single operation.
-        Creates a temporary session, executes coro_func with it, and ensures cleanup.
+        Runs coro_func with this client's persistent MCP session.
+        The session is opened on first use (read_timeout_seconds applies to it),
+        health-checked before reuse, reopened with backoff when broken and closed
+        after SESSION_IDLE_TIMEOUT_SECONDS without use. At most
+        SESSION_MAX_CONCURRENCY operations run on it at once.
         """
         operation_name = coro_func.__name__  # For logging
-        # PrintStyle(font_color="cyan").print(f"MCPClientBase ({self.server.name}): Creating new session for operation '{operation_name}'...")
-        # Store the original exception outside the async block
-        original_exception = None
         try:
-            async with AsyncExitStack() as temp_stack:
-                try:
-
-                    stdio, write = await self._create_stdio_transport(temp_stack)
-                    # PrintStyle(font_color="cyan").print(f"MCPClientBase ({self.server.name} - {operation_name}): Transport created. Initializing session...")
-                    session = await temp_stack.enter_async_context(
-                        ClientSession(
-                            stdio,  # type: ignore
-                            write,  # type: ignore
-                            read_timeout_seconds=timedelta(
-                                seconds=read_timeout_seconds
-                            ),
-                        )
-                    )
-                    await session.initialize()
-
-                    result = await coro_func(session)
-
-                    return result
-                except Exception as e:
-                    # Store the original exception and raise a dummy exception
-                    excs = getattr(e, "exceptions", None)  # Python 3.11+ ExceptionGroup
-                    if excs:
-                        original_exception = excs[0]
-                    else:
-                        original_exception = e
-                    # Create a dummy exception to break out of the async block
-                    raise RuntimeError("Dummy exception to break out of async block")
+            future = asyncio.run_coroutine_threadsafe(
+                self._run_pooled(coro_func, read_timeout_seconds),
+                _get_session_loop(),
+            )
+            return await asyncio.wrap_future(future)
         except Exception as e:
-            # Check if this is our dummy exception
-            if original_exception is not None:
-                e = original_exception
-            # We have the original exception stored
+            e = _unwrap_exception(e)
             PrintStyle(
                 background_color="#AA4455", font_color="white", padding=False
             ).print(
                 f"MCPClientBase ({self.server.name} - {operation_name}): Error during operation: {type(e).__name__}: {e}"
             )
             raise e  # Re-raise the original exception
-        # finally:
-        #     PrintStyle(font_color="cyan").print(
-        #         f"MCPClientBase ({self.server.name} - {operation_name}): Session and transport will be closed by AsyncExitStack."
-        #     )
-        # This line should ideally be unreachable if the try/except/finally logic within the 'async with' is exhaustive.
-        # Adding it to satisfy linters that might not fully trace the raise/return paths through async context managers.
-        raise RuntimeError(
-            f"MCPClientBase ({self.server.name} - {operation_name}): _execute_with_session exited 'async with' block unexpectedly."
+
+    async def _run_pooled(
+        self,
+        coro_func: Callable[[ClientSession], Awaitable[T]],
+        read_timeout_seconds,
+    ) -> T:
+        if self._session_slots is None:
+            self._session_slots = asyncio.Semaphore(max(1, self.SESSION_MAX_CONCURRENCY))
+        async with self._session_slots:
+            for retry in (True, False):
+                pooled = await self._acquire_session(read_timeout_seconds)
+                pooled.in_flight += 1
+                try:
+                    return await coro_func(pooled.session)  # type: ignore
+                except (anyio.ClosedResourceError, anyio.BrokenResourceError):
+                    # the transport died before the request went out, safe to resend once
+                    self._discard_session(pooled)
+                    if not retry:
+                        raise
+                except Exception:
+                    # could be the tool or the transport; make the next use ping first
+                    pooled.suspect = True
+                    raise
+                finally:
+                    pooled.in_flight -= 1
+                    pooled.last_used = time.monotonic()
+            raise RuntimeError(
+                f"MCPClientBase ({self.server.name}): _run_pooled exited the retry loop unexpectedly."
+            )
+
+    async def _acquire_session(self, read_timeout_seconds) -> _PooledSession:
+        if self._session_lock is None:
+            self._session_lock = asyncio.Lock()
+        async with self._session_lock:
+            pooled = self._session
+            if pooled is not None:
+                if pooled.alive and await self._check_health(pooled):
+                    return pooled
+                self._discard_session(pooled)
+
+            attempts = max(1, self.SESSION_CONNECT_ATTEMPTS)
+            delay = self.SESSION_BACKOFF_SECONDS
+            for attempt in range(1, attempts + 1):
+                try:
+                    self._session = await self._open_session(read_timeout_seconds)
+                    return self._session
+                except ValueError:
+                    raise  # configuration problem, retrying will not help
+                except Exception as e:
+                    if attempt == attempts:
+                        raise
+                    e = _unwrap_exception(e)
+                    PrintStyle(font_color="orange").print(
+                        f"MCPClientBase ({self.server.name}): Connection attempt {attempt}/{attempts} failed: {type(e).__name__}: {e}. Retrying in {delay:.1f}s..."
+                    )
+                    await asyncio.sleep(delay)
+                    delay = min(delay * 2, self.SESSION_BACKOFF_MAX_SECONDS)
+            raise RuntimeError(
+                f"MCPClientBase ({self.server.name}): could not open a session."
+            )
+
+    async def _check_health(self, pooled: _PooledSession) -> bool:
+        if pooled.in_flight and not pooled.suspect:
+            return True
+        idle = time.monotonic() - pooled.last_used
+        if idle < self.SESSION_HEALTH_CHECK_SECONDS and not pooled.suspect:
+            return True
+        try:
+            await asyncio.wait_for(
+                pooled.session.send_ping(),  # type: ignore
+                timeout=self.SESSION_PING_TIMEOUT_SECONDS,
+            )
+        except Exception as e:
+            PrintStyle(font_color="orange").print(
+                f"MCPClientBase ({self.server.name}): Session health check failed ({type(_unwrap_exception(e)).__name__}), reconnecting..."
+            )
+            return False
+        pooled.suspect = False
+        pooled.last_used = time.monotonic()
+        return True
+
+    async def _open_session(self, read_timeout_seconds) -> _PooledSession:
+        pooled = _PooledSession()
+        ready: asyncio.Future = asyncio.get_running_loop().create_future()
+        pooled.owner = asyncio.create_task(
+            self._own_session(pooled, ready, read_timeout_seconds)
         )
+        try:
+            await asyncio.shield(ready)
+        except BaseException:
+            pooled.stop.set()
+            raise
+        return pooled
+
+    async def _own_session(
+        self, pooled: _PooledSession, ready: asyncio.Future, read_timeout_seconds
+    ) -> None:
+        # The transport and session context managers must be entered and exited
+        # by the same task, so this task holds them for the session's lifetime.
+        try:
+            async with AsyncExitStack() as stack:
+                stdio, write = await self._create_stdio_transport(stack)
+                session = await stack.enter_async_context(
+                    ClientSession(
+                        stdio,  # type: ignore
+                        write,  # type: ignore
+                        read_timeout_seconds=timedelta(seconds=read_timeout_seconds),
+                    )
+                )
+                await session.initialize()
+                pooled.session = session
+                pooled.last_used = time.monotonic()
+                ready.set_result(None)
+                await self._wait_while_active(pooled)
+        except Exception as e:
+            if not ready.done():
+                ready.set_exception(_unwrap_exception(e))
+        finally:
+            pooled.stop.set()
+            if self._session is pooled:
+                self._session = None
+            if not ready.done():
+                ready.cancel()
+
+    async def _wait_while_active(self, pooled: _PooledSession) -> None:
+        idle_timeout = self.SESSION_IDLE_TIMEOUT_SECONDS
+        while not pooled.stop.is_set():
+            remaining = idle_timeout - (time.monotonic() - pooled.last_used)
+            if remaining <= 0 and not pooled.in_flight:
+                return
+            try:
+                await asyncio.wait_for(pooled.stop.wait(), timeout=max(remaining, 0.1))
+            except asyncio.TimeoutError:
+                pass
+
+    def _discard_session(self, pooled: _PooledSession) -> None:
+        pooled.stop.set()
+        if self._session is pooled:
+            self._session = None
+
+    async def _close_session(self) -> None:
+        pooled = self._session
+        if pooled is None:
+            return
+        self._discard_session(pooled)
+        if pooled.owner is not None:
+            await asyncio.gather(pooled.owner, return_exceptions=True)
+
+    def close_session(self) -> None:
+        """Close the persistent session, if any. The next operation reconnects."""
+        loop = _session_loop
+        if loop is None or loop.is_closed():
+            return
+        asyncio.run_coroutine_threadsafe(self._close_session(), loop)
 
     async def update_tools(self) -> "MCPClientBase":
         # PrintStyle(font_color="cyan").print(f"MCPClientBase ({self.server.name}): Starting 'update_tools' operation...")
@@ -1,5 +1,5 @@
 from datetime import datetime
-from typing import Any, List, Sequence
+from typing import Any, Callable, List, Sequence
 from langchain.storage import InMemoryByteStore, LocalFileStore
 from langchain.embeddings import CacheBackedEmbeddings
 from python.helpers import guids
@@ -19,10 +19,27 @@ from langchain_community.vectorstores.utils import (
 from langchain_core.embeddings import Embeddings
 
 import os, json
+import asyncio
+import atexit
+import hashlib
+import pickle
+import shutil
+import threading
 
 import numpy as np
 
 from python.helpers.print_style import PrintStyle
+from python.helpers.memory_index import (
+    IndexConfig,
+    INDEX_FLAT,
+    build_index,
+    configure_search,
+    create_index,
+    index_kind,
+    needs_rebuild,
+    rebuild_index,
+    reconstruct_all,
+)
 from . import files
 from langchain_core.documents import Document
 from python.helpers import knowledge_import
@@ -39,6 +56,8 @@ logging.getLogger("langchain_core.vectorstores.base").setLevel(logging.ERROR)
 
 
 class MyFaiss(FAISS):
+    index_config: IndexConfig = IndexConfig()
+
     # override aget_by_ids
     def get_by_ids(self, ids: Sequence[str], /) -> List[Document]:
         # return all self.docstore._dict[id] in ids
@@ -50,9 +69,64 @@ class MyFaiss(FAISS):
     def get_all_docs(self):
         return self.docstore._dict  # type: ignore
 
+    def apply_index_config(self, config: IndexConfig | None = None) -> bool:
+        """Convert/train the live index to match config; returns True if it was rebuilt."""
+        if config is not None:
+            self.index_config = config
+        if not needs_rebuild(self.index, self.index_config):
+            configure_search(self.index, self.index_config)
+            return False
+        vectors = reconstruct_all(self.index)
+        self.index = build_index(vectors, self.index_config, self.index.d)
+        return True
+
+    # ANN indexes cannot remove by position, rebuild them from the surviving vectors instead
+    def delete(self, ids: list[str] | None = None, **kwargs: Any) -> bool | None:
+        if ids is None or index_kind(self.index) == INDEX_FLAT:
+            return super().delete(ids, **kwargs)
+        missing_ids = set(ids).difference(self.index_to_docstore_id.values())
+        if missing_ids:
+            raise ValueError(
+                f"Some specified ids do not exist in the current store. Ids not found: {missing_ids}"
+            )
+        id_set = set(ids)
+        keep = [
+            (i, doc_id)
+            for i, doc_id in sorted(self.index_to_docstore_id.items())
+            if doc_id not in id_set
+        ]
+        vectors = reconstruct_all(self.index)[[i for i, _ in keep]]
+        self.index = rebuild_index(self.index, vectors, self.index_config)
+        self.docstore.delete(ids)  # type: ignore
+        self.index_to_docstore_id = {pos: doc_id for pos, (_, doc_id) in enumerate(keep)}
+        return True
+
+
+MUTATION_LOG_FILE = "mutations.jsonl"
+# changes captured by a snapshot that is still being written
+FLUSHING_LOG_FILE = "mutations.flushing.jsonl"
+
+
+class _PendingSave:
+    """Write-coalescing state for one memory subdir."""
+
+    def __init__(self):
+        # guards the db and the mutation log together, held only in memory
+        self.lock = threading.RLock()
+        # serializes snapshot writes, never taken while holding lock
+        self.write_lock = threading.Lock()
+        self.mutations = 0
+        self.timer: threading.Timer | None = None
+
 
 class Memory:
 
+    # full FAISS snapshots (save_local) are coalesced: every change is appended
+    # to the mutation log right away, the snapshot is written after a quiet
+    # period or after this many changes, and on shutdown/reload
+    SAVE_DEBOUNCE_SECONDS = 5.0
+    SAVE_MAX_PENDING_MUTATIONS = 50
+
     class Area(Enum):
         MAIN = "main"
         FRAGMENTS = "fragments"
@@ -60,6 +134,7 @@ class Memory:
         INSTRUMENTS = "instruments"
 
     index: dict[str, "MyFaiss"] = {}
+    _pending_saves: dict[str, _PendingSave] = {}
 
     @staticmethod
     async def get(agent: Agent):
@@ -122,6 +197,7 @@ class Memory:
     async def reload(agent: Agent):
         memory_subdir = get_agent_memory_subdir(agent)
         if Memory.index.get(memory_subdir):
+            Memory.flush(memory_subdir)
             del Memory.index[memory_subdir]
         return await Memory.get(agent)
 
@@ -131,6 +207,7 @@ class Memory:
         model_config: models.ModelConfig,
         memory_subdir: str,
         in_memory=False,
+        index_config: IndexConfig | None = None,
     ) -> tuple[MyFaiss, bool]:
 
         PrintStyle.standard("Initializing VectorDB...")
@@ -138,6 +215,9 @@ class Memory:
         if log_item:
             log_item.stream(progress="\nInitializing VectorDB")
 
+        if index_config is None:
+            index_config = Memory._get_index_config()
+
         em_dir = files.get_abs_path(
             "memory/embeddings"
         )  # just caching, no need to parameterize
@@ -174,19 +254,13 @@ class Memory:
 
         # if db folder exists and is not empty:
         if os.path.exists(db_dir) and files.exists(db_dir, "index.faiss"):
-            db = MyFaiss.load_local(
-                folder_path=db_dir,
-                embeddings=embedder,
-                allow_dangerous_deserialization=True,
-                distance_strategy=DistanceStrategy.COSINE,
-                # normalize_L2=True,
-                relevance_score_fn=Memory._cosine_normalizer,
-            )  # type: ignore
+            db, snapshot_ok = Memory._load_db_file(memory_subdir, embedder)
 
-            # if there is a mismatch in embeddings used, re-index the whole DB
+            # if there is a mismatch in embeddings used, or index.faiss does not
+            # belong to index.pkl (torn snapshot), re-index the whole DB
             emb_ok = False
             emb_set_file = files.get_abs_path(db_dir, "embedding.json")
-            if files.exists(emb_set_file):
+            if snapshot_ok and files.exists(emb_set_file):
                 embedding_set = json.loads(files.read_file(emb_set_file))
                 if (
                     embedding_set["model_provider"] == model_config.provider
@@ -200,9 +274,13 @@ class Memory:
                 docs = db.get_all_docs()
                 db = None
 
+            # index type/params changed in settings - convert the loaded index
+            if db and db.apply_index_config(index_config):
+                Memory._save_db_file(db, memory_subdir)
+
         # DB not loaded, create one
         if not db:
-            index = faiss.IndexFlatIP(len(embedder.embed_query("example")))
+            index = create_index(len(embedder.embed_query("example")), index_config)
 
             db = MyFaiss(
                 embedding_function=embedder,
@@ -213,6 +291,7 @@ class Memory:
                 # normalize_L2=True,
                 relevance_score_fn=Memory._cosine_normalizer,
             )
+            db.index_config = index_config
 
             # insert docs if reindexing
             if docs:
@@ -220,6 +299,7 @@ class Memory:
                 if log_item:
                     log_item.stream(progress="\nIndexing memories")
                 db.add_documents(documents=list(docs.values()), ids=list(docs.keys()))
+                db.apply_index_config()
 
             # save DB
             Memory._save_db_file(db, memory_subdir)
@@ -237,6 +317,11 @@ class Memory:
 
             created = True
 
+        # apply changes made after the last snapshot
+        if Memory._replay_mutations(db, memory_subdir):
+            Memory._save_db_file(db, memory_subdir)
+            Memory._truncate_mutation_log(memory_subdir)
+
         return db, created
 
     def __init__(
@@ -355,7 +440,6 @@ class Memory:
         self, query: str, threshold: float, filter: str = ""
     ):
         k = 100
-        tot = 0
         removed = []
 
         while True:
@@ -373,16 +457,15 @@ class Memory:
             if document_ids:
                 # fnd = self.db.get(where={"id": {"$in": document_ids}})
                 # if fnd["ids"]: self.db.delete(ids=fnd["ids"])
-                # tot += len(fnd["ids"])
-                await self.db.adelete(ids=document_ids)
-                tot += len(document_ids)
+                await self._mutate(
+                    lambda ids=document_ids: self.db.delete(ids=ids),
+                    {"op": "delete", "ids": document_ids},
+                )
 
             # If fewer than K document IDs, break the loop
             if len(document_ids) < k:
                 break
 
-        if tot:
-            self._save_db()  # persist
         return removed
 
     async def delete_documents_by_ids(self, ids: list[str]):
@@ -392,10 +475,9 @@ class Memory:
         )  # existing docs to remove (prevents error)
         if rem_docs:
             rem_ids = [doc.metadata["id"] for doc in rem_docs]  # ids to remove
-            await self.db.adelete(ids=rem_ids)
-
-        if rem_docs:
-            self._save_db()  # persist
+            await self._mutate(
+                lambda: self.db.delete(ids=rem_ids), {"op": "delete", "ids": rem_ids}
+            )
         return rem_docs
 
     async def insert_text(self, text, metadata: dict = {}):
@@ -414,19 +496,184 @@ class Memory:
                 if not doc.metadata.get("area", ""):
                     doc.metadata["area"] = Memory.Area.MAIN.value
 
-            await self.db.aadd_documents(documents=docs, ids=ids)
-            self._save_db()  # persist
+            embedded = await self._embed_documents(docs)
+
+            def add():
+                self.db.add_embeddings(
+                    embedded, metadatas=[doc.metadata for doc in docs], ids=ids
+                )
+                self.db.apply_index_config()  # train IVF once enough vectors exist
+
+            await self._mutate(add, Memory._upsert_record(docs))
         return ids
 
     async def update_documents(self, docs: list[Document]):
         ids = [doc.metadata["id"] for doc in docs]
-        await self.db.adelete(ids=ids)  # delete originals
-        ins = await self.db.aadd_documents(documents=docs, ids=ids)  # add updated
-        self._save_db()  # persist
-        return ins
+        embedded = await self._embed_documents(docs)
 
-    def _save_db(self):
-        Memory._save_db_file(self.db, self.memory_subdir)
+        def replace():
+            self.db.delete(ids=ids)  # delete originals
+            ins = self.db.add_embeddings(  # add updated
+                embedded, metadatas=[doc.metadata for doc in docs], ids=ids
+            )
+            self.db.apply_index_config()
+            return ins
+
+        return await self._mutate(replace, Memory._upsert_record(docs))
+
+    async def _embed_documents(self, docs: list[Document]) -> list[tuple[str, list[float]]]:
+        # embed on the loop, outside the lock; only the index update is locked
+        texts = [doc.page_content for doc in docs]
+        vectors = await self.db.embedding_function.aembed_documents(texts)  # type: ignore
+        return list(zip(texts, vectors))
+
+    async def _mutate(self, apply: Callable[[], Any], record: dict):
+        # the lock may be held while a snapshot is copied, wait for it off the loop
+        return await asyncio.to_thread(self._apply_mutation, apply, record)
+
+    def _apply_mutation(self, apply: Callable[[], Any], record: dict):
+        # the db change and its log record happen under one lock, so a snapshot
+        # copy always matches the log it truncates
+        state = Memory._pending_state(self.memory_subdir)
+        with state.lock:
+            result = apply()
+            log_path = files.get_abs_path(abs_db_dir(self.memory_subdir), MUTATION_LOG_FILE)
+            with open(log_path, "a", encoding="utf-8") as f:
+                f.write(json.dumps(record, default=str) + "\n")
+                f.flush()
+                os.fsync(f.fileno())
+            state.mutations += 1
+            flush_now = state.mutations >= Memory.SAVE_MAX_PENDING_MUTATIONS
+            if state.timer:
+                state.timer.cancel()
+                state.timer = None
+            if not flush_now:
+                state.timer = threading.Timer(
+                    Memory.SAVE_DEBOUNCE_SECONDS,
+                    Memory._flush_pending,
+                    args=(self.memory_subdir, self.db),
+                )
+                state.timer.daemon = True
+                state.timer.start()
+        if flush_now:
+            Memory._flush_pending(self.memory_subdir, self.db)
+        return result
+
+    @staticmethod
+    def _pending_state(memory_subdir: str) -> _PendingSave:
+        return Memory._pending_saves.setdefault(memory_subdir, _PendingSave())
+
+    @staticmethod
+    def flush(memory_subdir: str | None = None):
+        # write pending snapshots now (all subdirs if none given)
+        subdirs = [memory_subdir] if memory_subdir else list(Memory._pending_saves)
+        for subdir in subdirs:
+            db = Memory.index.get(subdir)
+            if db is not None:
+                Memory._flush_pending(subdir, db)
+
+    @staticmethod
+    def _flush_pending(memory_subdir: str, db: MyFaiss):
+        state = Memory._pending_saves.get(memory_subdir)
+        if state is None:
+            return
+        with state.write_lock:
+            # copy the db in memory under the lock, write it to disk without it
+            with state.lock:
+                if state.timer:
+                    state.timer.cancel()
+                    state.timer = None
+                captured = state.mutations
+                if not captured:
+                    return
+                snapshot = Memory._snapshot_bytes(db)
+                Memory._rotate_mutation_log(memory_subdir)
+                state.mutations = 0
+            try:
+                Memory._write_snapshot(memory_subdir, *snapshot)
+            except Exception as e:
+                # the rotated log still holds every change, next flush retries
+                PrintStyle.error(f"Failed to save memory snapshot: {e}")
+                with state.lock:
+                    state.mutations += captured
+                return
+            flushing_path = files.get_abs_path(abs_db_dir(memory_subdir), FLUSHING_LOG_FILE)
+            if os.path.exists(flushing_path):
+                os.remove(flushing_path)
+
+    @staticmethod
+    def _upsert_record(docs: list[Document]) -> dict:
+        return {
+            "op": "upsert",
+            "docs": [
+                {"page_content": doc.page_content, "metadata": doc.metadata}
+                for doc in docs
+            ],
+        }
+
+    @staticmethod
+    def _rotate_mutation_log(memory_subdir: str):
+        # move the live log aside; it is dropped once the snapshot holding it is on disk
+        db_dir = abs_db_dir(memory_subdir)
+        log_path = files.get_abs_path(db_dir, MUTATION_LOG_FILE)
+        flushing_path = files.get_abs_path(db_dir, FLUSHING_LOG_FILE)
+        if not os.path.exists(log_path):
+            return
+        if not os.path.exists(flushing_path):
+            os.replace(log_path, flushing_path)
+            return
+        # an earlier snapshot failed, keep its changes ahead of the new ones
+        with open(log_path, "rb") as src, open(flushing_path, "ab") as dst:
+            shutil.copyfileobj(src, dst)
+            dst.flush()
+            os.fsync(dst.fileno())
+        os.remove(log_path)
+
+    @staticmethod
+    def _truncate_mutation_log(memory_subdir: str):
+        db_dir = abs_db_dir(memory_subdir)
+        for name in (FLUSHING_LOG_FILE, MUTATION_LOG_FILE):
+            log_path = files.get_abs_path(db_dir, name)
+            if os.path.exists(log_path):
+                os.remove(log_path)
+
+    @staticmethod
+    def _replay_mutations(db: MyFaiss, memory_subdir: str) -> int:
+        # upsert/delete-if-present is idempotent, so replaying a log that was
+        # partly captured by the snapshot still converges to the same state
+        db_dir = abs_db_dir(memory_subdir)
+        applied = 0
+        for name in (FLUSHING_LOG_FILE, MUTATION_LOG_FILE):
+            log_path = files.get_abs_path(db_dir, name)
+            if not os.path.exists(log_path):
+                continue
+            with open(log_path, "r", encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        record = json.loads(line)
+                    except json.JSONDecodeError:
+                        continue  # torn final line from a crash mid-append
+                    if record.get("op") == "upsert":
+                        docs = [
+                            Document(item["page_content"], metadata=item["metadata"])
+                            for item in record.get("docs", [])
+                        ]
+                        ids = [doc.metadata["id"] for doc in docs]
+                        existing = [id for id in ids if db.get_by_ids(id)]
+                        if existing:
+                            db.delete(ids=existing)
+                        if docs:
+                            db.add_documents(documents=docs, ids=ids)
+                    elif record.get("op") == "delete":
+                        existing = [id for id in record.get("ids", []) if db.get_by_ids(id)]
+                        if existing:
+                            db.delete(ids=existing)
+                    else:
+                        continue
+                    applied += 1
+        if applied:
+            db.apply_index_config()
+        return applied
 
     def _generate_doc_id(self):
         while True:
@@ -434,10 +681,61 @@ class Memory:
             if not self.db.get_by_ids(doc_id):  # check if exists
                 return doc_id
 
+    @staticmethod
+    def _get_index_config() -> IndexConfig:
+        from python.helpers import settings
+
+        return IndexConfig.from_settings(settings.get_settings())
+
+    @staticmethod
+    def _load_db_file(memory_subdir: str, embedder: Embeddings) -> tuple[MyFaiss, bool]:
+        # returns the db and whether index.faiss is the one index.pkl was written with
+        abs_dir = abs_db_dir(memory_subdir)
+        index_path = os.path.join(abs_dir, "index.faiss")
+        index = faiss.read_index(index_path)
+        with open(os.path.join(abs_dir, "index.pkl"), "rb") as f:
+            stored = pickle.load(f)
+        docstore, index_to_docstore_id = stored[0], stored[1]
+        consistent = True
+        if len(stored) > 2:  # snapshots written before the checksum have none
+            with open(index_path, "rb") as f:
+                consistent = hashlib.sha256(f.read()).hexdigest() == stored[2]["faiss_sha256"]
+        db = MyFaiss(
+            embedding_function=embedder,
+            index=index,
+            docstore=docstore,
+            index_to_docstore_id=index_to_docstore_id,
+            distance_strategy=DistanceStrategy.COSINE,
+            # normalize_L2=True,
+            relevance_score_fn=Memory._cosine_normalizer,
+        )
+        if not consistent:
+            PrintStyle.warning("Memory snapshot index.faiss does not match index.pkl, re-indexing")
+        return db, consistent
+
     @staticmethod
     def _save_db_file(db: MyFaiss, memory_subdir: str):
+        Memory._write_snapshot(memory_subdir, *Memory._snapshot_bytes(db))
+
+    @staticmethod
+    def _snapshot_bytes(db: MyFaiss) -> tuple[bytes, bytes]:
+        index_bytes = faiss.serialize_index(db.index).tobytes()
+        meta = {"faiss_sha256": hashlib.sha256(index_bytes).hexdigest()}
+        return index_bytes, pickle.dumps((db.docstore, db.index_to_docstore_id, meta))
+
+    @staticmethod
+    def _write_snapshot(memory_subdir: str, index_bytes: bytes, docstore_bytes: bytes):
         abs_dir = abs_db_dir(memory_subdir)
-        db.save_local(folder_path=abs_dir)
+        for name, data in (("index.faiss", index_bytes), ("index.pkl", docstore_bytes)):
+            with open(os.path.join(abs_dir, name + ".tmp"), "wb") as f:
+                f.write(data)
+                f.flush()
+                os.fsync(f.fileno())
+        # index.pkl is replaced last and carries the checksum of its index.faiss,
+        # a crash between the two renames is caught by _load_db_file, which then
+        # re-indexes the older docstore and replays both mutation logs over it
+        os.replace(os.path.join(abs_dir, "index.faiss.tmp"), os.path.join(abs_dir, "index.faiss"))
+        os.replace(os.path.join(abs_dir, "index.pkl.tmp"), os.path.join(abs_dir, "index.pkl"))
 
     @staticmethod
     def _get_comparator(condition: str):
@@ -488,10 +786,14 @@ def get_custom_knowledge_subdir_abs(agent: Agent) -> str:
 
 
 def reload():
-    # clear the memory index, this will force all DBs to reload
+    # persist pending changes, then clear the memory index, this will force all DBs to reload
+    Memory.flush()
     Memory.index = {}
 
 
+atexit.register(Memory.flush)
+
+
 def abs_db_dir(memory_subdir: str) -> str:
     # patch for projects, this way we don't need to re-work the structure of memory subdirs
     if memory_subdir.startswith("projects/"):
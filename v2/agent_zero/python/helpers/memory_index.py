@@ -0,0 +1,134 @@
+"""FAISS index construction for the memory vector DB.
+
+Supports three index types for inner-product (cosine) search:
+- flat: exact brute force (IndexFlatIP), the default
+- ivf:  IndexIVFFlat; starts as flat and is trained automatically once the
+        DB holds enough vectors to fit `nlist` centroids
+- hnsw: IndexHNSWFlat graph index, no training required
+
+IVF and HNSW do not support positional removal the way LangChain's FAISS
+wrapper expects, so callers rebuild them from surviving vectors on delete
+(see `rebuild_index` / `reconstruct_all`).
+"""
+
+from dataclasses import dataclass
+from typing import Any, Mapping
+
+import faiss
+import numpy as np
+
+INDEX_FLAT = "flat"
+INDEX_IVF = "ivf"
+INDEX_HNSW = "hnsw"
+INDEX_TYPES = (INDEX_FLAT, INDEX_IVF, INDEX_HNSW)
+
+# faiss warns below ~39 training points per centroid
+IVF_POINTS_PER_CENTROID = 39
+
+
+@dataclass(frozen=True)
+class IndexConfig:
+    index_type: str = INDEX_FLAT
+    ivf_nlist: int = 256
+    ivf_nprobe: int = 16
+    ivf_train_min_vectors: int = 0  # 0 = nlist * IVF_POINTS_PER_CENTROID
+    hnsw_m: int = 32
+    hnsw_ef_search: int = 64
+    hnsw_ef_construction: int = 64
+
+    def __post_init__(self):
+        if self.index_type not in INDEX_TYPES:
+            raise ValueError(f"Unknown memory index type: {self.index_type}")
+
+    @property
+    def train_threshold(self) -> int:
+        if self.ivf_train_min_vectors > 0:
+            return max(self.ivf_train_min_vectors, self.ivf_nlist)
+        return self.ivf_nlist * IVF_POINTS_PER_CENTROID
+
+    @staticmethod
+    def from_settings(settings: Mapping[str, Any]) -> "IndexConfig":
+        index_type = str(settings.get("memory_index_type", INDEX_FLAT) or INDEX_FLAT)
+        if index_type not in INDEX_TYPES:
+            index_type = INDEX_FLAT
+        default = IndexConfig()
+        return IndexConfig(
+            index_type=index_type,
+            ivf_nlist=int(settings.get("memory_index_ivf_nlist", default.ivf_nlist)),
+            ivf_nprobe=int(settings.get("memory_index_ivf_nprobe", default.ivf_nprobe)),
+            hnsw_m=int(settings.get("memory_index_hnsw_m", default.hnsw_m)),
+            hnsw_ef_search=int(settings.get("memory_index_hnsw_ef_search", default.hnsw_ef_search)),
+        )
+
+
+def index_kind(index: faiss.Index) -> str:
+    if isinstance(index, faiss.IndexHNSW):
+        return INDEX_HNSW
+    if faiss.try_extract_index_ivf(index) is not None:
+        return INDEX_IVF
+    return INDEX_FLAT
+
+
+def create_index(dim: int, config: IndexConfig) -> faiss.Index:
+    """Empty index for `config`. IVF starts flat until it can be trained."""
+    if config.index_type == INDEX_HNSW:
+        index = faiss.IndexHNSWFlat(dim, config.hnsw_m, faiss.METRIC_INNER_PRODUCT)
+        index.hnsw.efConstruction = config.hnsw_ef_construction
+        configure_search(index, config)
+        return index
+    return faiss.IndexFlatIP(dim)
+
+
+def configure_search(index: faiss.Index, config: IndexConfig) -> None:
+    kind = index_kind(index)
+    if kind == INDEX_HNSW:
+        index.hnsw.efSearch = config.hnsw_ef_search
+    elif kind == INDEX_IVF:
+        faiss.extract_index_ivf(index).nprobe = config.ivf_nprobe
+
+
+def reconstruct_all(index: faiss.Index) -> np.ndarray:
+    """All stored vectors in position order."""
+    if index.ntotal == 0:
+        return np.zeros((0, index.d), dtype=np.float32)
+    ivf = faiss.try_extract_index_ivf(index)
+    if ivf is not None:
+        ivf.make_direct_map()
+    return index.reconstruct_n(0, index.ntotal)
+
+
+def build_index(vectors: np.ndarray, config: IndexConfig, dim: int) -> faiss.Index:
+    """Index for `config` holding `vectors` at positions 0..n-1."""
+    vectors = np.ascontiguousarray(vectors, dtype=np.float32)
+    if config.index_type == INDEX_IVF and len(vectors) >= config.train_threshold:
+        quantizer = faiss.IndexFlatIP(dim)
+        index = faiss.IndexIVFFlat(quantizer, dim, config.ivf_nlist, faiss.METRIC_INNER_PRODUCT)
+        index.train(vectors)
+        configure_search(index, config)
+    else:
+        index = create_index(dim, config)
+    if len(vectors):
+        index.add(vectors)
+    return index
+
+
+def rebuild_index(index: faiss.Index, vectors: np.ndarray, config: IndexConfig) -> faiss.Index:
+    """Replacement for `index` holding only `vectors`; a trained IVF keeps its centroids."""
+    if index_kind(index) == INDEX_IVF and not needs_rebuild(index, config):
+        rebuilt = faiss.clone_index(index)
+        rebuilt.reset()
+        configure_search(rebuilt, config)
+        if len(vectors):
+            rebuilt.add(np.ascontiguousarray(vectors, dtype=np.float32))
+        return rebuilt
+    return build_index(vectors, config, index.d)
+
+
+def needs_rebuild(index: faiss.Index, config: IndexConfig) -> bool:
+    """True when the live index no longer matches `config` (type change or IVF ready to train)."""
+    kind = index_kind(index)
+    if config.index_type == INDEX_IVF:
+        if kind == INDEX_IVF:
+            return faiss.extract_index_ivf(index).nlist != config.ivf_nlist
+        return kind == INDEX_HNSW or index.ntotal >= config.train_threshold
+    return kind != config.index_type
@@ -1,10 +1,11 @@
+import functools
 import re
 import threading
 import time
 import os
 from io import StringIO
 from dataclasses import dataclass
-from typing import Dict, Optional, List, Literal, Set, Callable, Tuple, TYPE_CHECKING
+from typing import Dict, Optional, List, Literal, Callable, Tuple, TYPE_CHECKING
 from dotenv.parser import parse_stream
 from python.helpers.errors import RepairableException
 from python.helpers import files
@@ -35,13 +36,82 @@ class EnvLine:
     )
 
 
+class _SecretsAutomaton:
+    """Aho-Corasick automaton over secret values.
+
+    Per node: depth (length of the prefix it spells), match (the node of the
+    longest secret ending there, 0 = none; shorter ones follow via
+    match[fail[node]]) and live_depth, the length of the longest suffix that
+    can still grow into a longer secret.
+    """
+
+    def __init__(self, values: Tuple[str, ...]):
+        self.goto: List[Dict[str, int]] = [{}]
+        self.fail: List[int] = [0]
+        self.depth: List[int] = [0]
+        self.value: List[Optional[str]] = [None]
+
+        for val in values:
+            node = 0
+            for ch in val:
+                nxt = self.goto[node].get(ch)
+                if nxt is None:
+                    nxt = len(self.goto)
+                    self.goto[node][ch] = nxt
+                    self.goto.append({})
+                    self.fail.append(0)
+                    self.depth.append(self.depth[node] + 1)
+                    self.value.append(None)
+                node = nxt
+            self.value[node] = val
+
+        self.match: List[int] = [0] * len(self.goto)
+        self.live_depth: List[int] = [0] * len(self.goto)
+        # breadth-first, so fail targets are finished before their dependents
+        queue = list(self.goto[0].values())
+        for node in queue:
+            for ch, child in self.goto[node].items():
+                f = self.fail[node]
+                while f and ch not in self.goto[f]:
+                    f = self.fail[f]
+                self.fail[child] = self.goto[f].get(ch, 0)
+                queue.append(child)
+        for node in queue:
+            f = self.fail[node]
+            self.match[node] = node if self.value[node] is not None else self.match[f]
+            self.live_depth[node] = self.depth[node] if self.goto[node] else self.live_depth[f]
+
+    def step(self, state: int, ch: str) -> int:
+        goto, fail = self.goto, self.fail
+        while state and ch not in goto[state]:
+            state = fail[state]
+        return goto[state].get(ch, 0)
+
+    def prefix_depth(self, text: str) -> int:
+        """Length of the longest suffix of text that is a prefix of a secret."""
+        state = 0
+        for ch in text:
+            state = self.step(state, ch)
+        return self.depth[state]
+
+
+@functools.lru_cache(maxsize=16)
+def _secrets_automaton(values: Tuple[str, ...]) -> _SecretsAutomaton:
+    return _SecretsAutomaton(values)
+
+
 class StreamingSecretsFilter:
     """Stateful streaming filter that masks secrets on the fly.
 
     - Replaces full secret values with placeholders §§secret(KEY) when detected.
-    - Holds the longest suffix of the current buffer that matches any secret prefix
+      Overlapping secrets each get a placeholder, so no part of either leaks.
+    - Holds the longest suffix of the stream that could still grow into a secret
       (with minimum trigger length of 3) to avoid leaking partial secrets across chunks.
     - On finalize(), any unresolved partial is masked with '***'.
+
+    Matching uses an Aho-Corasick automaton shared by filters over the same
+    secrets; its state carries across chunks, so each chunk costs time linear
+    in its length regardless of the number of secrets.
     """
 
     def __init__(self, key_to_value: Dict[str, str], min_trigger: int = 3):
@@ -52,73 +122,87 @@ class StreamingSecretsFilter:
         }
         # Only keep non-empty values
         self.secret_values: List[str] = [v for v in self.value_to_key.keys() if v]
-        # Precompute all prefixes for quick suffix matching
-        self.prefixes: Set[str] = set()
-        for v in self.secret_values:
-            for i in range(self.min_trigger, len(v) + 1):
-                self.prefixes.add(v[:i])
         self.max_len: int = max((len(v) for v in self.secret_values), default=0)
+        self._automaton = _secrets_automaton(tuple(sorted(self.secret_values)))
 
         # Internal buffer of pending text that is not safe to flush yet
         self.pending: str = ""
+        self._reset_stream()
 
-    def _replace_full_values(self, text: str) -> str:
-        """Replace all full secret values with placeholders in the given text."""
-        # Sort by length desc to avoid partial overlaps
-        for val in sorted(self.secret_values, key=len, reverse=True):
-            if not val:
+    def _reset_stream(self) -> None:
+        self._state = 0
+        self._offset = 0  # stream position of pending[0]
+        self._replaced_until = 0  # stream position where the last replaced secret ends
+        self._matches: List[Tuple[int, int, str]] = []  # (start, end, value), stream positions
+
+    def _replace_matches(self, boundary: int) -> Tuple[str, int]:
+        """Replace matches starting before boundary. Returns the masked text from
+        the start of pending up to the stream position it covers."""
+        parts: List[str] = []
+        pos = self._offset
+        keep: List[Tuple[int, int, str]] = []
+        for start, end, val in sorted(self._matches, key=lambda m: (m[0], -m[1])):
+            if end <= self._replaced_until:
+                continue  # inside a secret already replaced
+            if start >= boundary:
+                keep.append((start, end, val))
                 continue
-            key = self.value_to_key.get(val, "")
-            if key:
-                text = text.replace(val, alias_for_key(key))
-        return text
-
-    def _longest_suffix_prefix(self, text: str) -> int:
-        """Return length of longest suffix of text that is a known secret prefix.
-        Returns 0 if none found (or only shorter than min_trigger)."""
-        max_check = min(len(text), self.max_len)
-        for length in range(max_check, self.min_trigger - 1, -1):
-            suffix = text[-length:]
-            if suffix in self.prefixes:
-                return length
-        return 0
+            # an overlapping secret replaces only its remainder; a secret can also
+            # begin in text flushed while shorter than min_trigger
+            start = max(start, pos)
+            parts.append(self.pending[pos - self._offset : start - self._offset])
+            parts.append(alias_for_key(self.value_to_key[val]))
+            pos = self._replaced_until = end
+        self._matches = [m for m in keep if m[1] > self._replaced_until]
+        return "".join(parts), pos
 
     def process_chunk(self, chunk: str) -> str:
         if not chunk:
             return ""
 
+        ac = self._automaton
+        state = self._state
+        pos = self._offset + len(self.pending)
+        for ch in chunk:
+            state = ac.step(state, ch)
+            pos += 1
+            node = ac.match[state]
+            while node:
+                self._matches.append((pos - ac.depth[node], pos, ac.value[node]))  # type: ignore[arg-type]
+                node = ac.match[ac.fail[node]]
+        self._state = state
         self.pending += chunk
 
-        # Replace any full secret occurrences first
-        self.pending = self._replace_full_values(self.pending)
-
-        # Determine the longest suffix that could still form a secret
-        hold_len = self._longest_suffix_prefix(self.pending)
-        if hold_len > 0:
-            # Flush everything except the hold suffix
-            emit = self.pending[:-hold_len]
-            self.pending = self.pending[-hold_len:]
-        else:
-            # Safe to flush everything
-            emit = self.pending
-            self.pending = ""
-
+        # Hold the longest suffix that could still grow into a secret
+        hold_len = ac.live_depth[state]
+        if hold_len < self.min_trigger:
+            hold_len = 0
+        boundary = pos - hold_len
+
+        emit, done = self._replace_matches(boundary)
+        cut = max(done, boundary)
+        emit += self.pending[done - self._offset : cut - self._offset]
+        self.pending = self.pending[cut - self._offset :]
+        self._offset = cut
         return emit
 
     def finalize(self) -> str:
         """Flush any remaining buffered text. If pending contains an unresolved partial
         (i.e., a prefix of a secret >= min_trigger), mask it with *** to avoid leaks."""
         if not self.pending:
+            self._reset_stream()
             return ""
 
-        hold_len = self._longest_suffix_prefix(self.pending)
-        if hold_len > 0:
-            safe = self.pending[:-hold_len]
+        result, done = self._replace_matches(self._offset + len(self.pending))
+        tail = self.pending[done - self._offset :]
+        hold_len = self._automaton.prefix_depth(tail)
+        if hold_len >= self.min_trigger:
             # Mask unresolved partial
-            result = safe + "***"
+            result += tail[:-hold_len] + "***"
         else:
-            result = self.pending
+            result += tail
         self.pending = ""
+        self._reset_stream()
         return result
 
 
@@ -74,6 +74,11 @@ class Settings(TypedDict):
     memory_memorize_enabled: bool
     memory_memorize_consolidation: bool
     memory_memorize_replace_threshold: float
+    memory_index_type: str
+    memory_index_ivf_nlist: int
+    memory_index_ivf_nprobe: int
+    memory_index_hnsw_m: int
+    memory_index_hnsw_ef_search: int
 
     api_keys: dict[str, str]
 
@@ -837,6 +842,61 @@ def convert_out(settings: Settings) -> SettingsOutput:
         }
     )
 
+    memory_fields.append(
+        {
+            "id": "memory_index_type",
+            "title": "Vector index type",
+            "description": "Flat is exact brute-force search. IVF and HNSW are approximate indexes that stay fast past a few hundred thousand memories at a small recall cost. IVF is trained automatically once enough memories exist.",
+            "type": "select",
+            "value": settings["memory_index_type"],
+            "options": [
+                {"value": "flat", "label": "Flat (exact)"},
+                {"value": "ivf", "label": "IVF (approximate, trained)"},
+                {"value": "hnsw", "label": "HNSW (approximate, graph)"},
+            ],
+        }
+    )
+
+    memory_fields.append(
+        {
+            "id": "memory_index_ivf_nlist",
+            "title": "IVF clusters (nlist)",
+            "description": "Number of IVF clusters. Training starts once the DB holds about 39 memories per cluster.",
+            "type": "number",
+            "value": settings["memory_index_ivf_nlist"],
+        }
+    )
+
+    memory_fields.append(
+        {
+            "id": "memory_index_ivf_nprobe",
+            "title": "IVF clusters searched (nprobe)",
+            "description": "Clusters visited per query. Higher improves recall and costs speed.",
+            "type": "number",
+            "value": settings["memory_index_ivf_nprobe"],
+        }
+    )
+
+    memory_fields.append(
+        {
+            "id": "memory_index_hnsw_m",
+            "title": "HNSW graph degree (M)",
+            "description": "Neighbours per node in the HNSW graph. Applies when the index is rebuilt.",
+            "type": "number",
+            "value": settings["memory_index_hnsw_m"],
+        }
+    )
+
+    memory_fields.append(
+        {
+            "id": "memory_index_hnsw_ef_search",
+            "title": "HNSW search breadth (efSearch)",
+            "description": "Candidate list size per HNSW query. Higher improves recall and costs speed.",
+            "type": "number",
+            "value": settings["memory_index_hnsw_ef_search"],
+        }
+    )
+
     memory_section: SettingsSection = {
         "id": "memory",
         "title": "Memory",
@@ -1504,6 +1564,11 @@ def get_default_settings() -> Settings:
         memory_memorize_enabled=True,
         memory_memorize_consolidation=True,
         memory_memorize_replace_threshold=0.9,
+        memory_index_type="flat",
+        memory_index_ivf_nlist=256,
+        memory_index_ivf_nprobe=16,
+        memory_index_hnsw_m=32,
+        memory_index_hnsw_ef_search=64,
         api_keys={},
         auth_login="",
         auth_password="",
@@ -1557,11 +1622,16 @@ def _apply_settings(previous: Settings | None):
                 whisper.preload, _settings["stt_model_size"]
             )  # TODO overkill, replace with background task
 
-        # force memory reload on embedding model change
+        # force memory reload on embedding model or vector index change
         if not previous or (
             _settings["embed_model_name"] != previous["embed_model_name"]
             or _settings["embed_model_provider"] != previous["embed_model_provider"]
             or _settings["embed_model_kwargs"] != previous["embed_model_kwargs"]
+            or any(
+                _settings[key] != previous.get(key)
+                for key in _settings
+                if key.startswith("memory_index_")
+            )
         ):
             from python.helpers.memory import reload as memory_reload
 
@@ -1,5 +1,6 @@
 import asyncio
 from datetime import datetime, timezone, timedelta
+import heapq
 import os
 import random
 import threading
@@ -181,6 +182,13 @@ class BaseTask(BaseModel):
     def check_schedule(self, frequency_seconds: float = 60.0) -> bool:
         return False
 
+    def get_due_from(self, frequency_seconds: float = 60.0) -> datetime | None:
+        """
+        Earliest time at which check_schedule() could next return True, or None if never.
+        The scheduler's due index only calls check_schedule() once this time has passed.
+        """
+        return None
+
     def get_next_run(self) -> datetime | None:
         return None
 
@@ -361,6 +369,22 @@ class ScheduledTask(BaseTask):
 
             return next_run_seconds < frequency_seconds
 
+    def get_due_from(self, frequency_seconds: float = 60.0) -> datetime | None:
+        with self._lock:
+            crontab = CronTab(crontab=self.schedule.to_crontab())  # type: ignore
+            task_timezone = pytz.timezone(self.schedule.timezone or Localization.get().get_timezone())
+
+            # check_schedule() looks back frequency_seconds, so the next fire time
+            # after that reference is the first moment it can match
+            reference_time = datetime.now(timezone.utc) - timedelta(seconds=frequency_seconds)
+            next_run_seconds: Optional[float] = crontab.next(  # type: ignore
+                now=reference_time.astimezone(task_timezone),
+                return_datetime=False
+            )  # type: ignore
+            if next_run_seconds is None:
+                return None
+            return reference_time + timedelta(seconds=next_run_seconds)
+
     def get_next_run(self) -> datetime | None:
         with self._lock:
             crontab = CronTab(crontab=self.schedule.to_crontab())  # type: ignore
@@ -418,6 +442,10 @@ class PlannedTask(BaseTask):
         with self._lock:
             return self.plan.should_launch() is not None
 
+    def get_due_from(self, frequency_seconds: float = 60.0) -> datetime | None:
+        with self._lock:
+            return self.plan.get_next_launch_time()
+
     def get_next_run(self) -> datetime | None:
         with self._lock:
             return self.plan.get_next_launch_time()
@@ -459,6 +487,14 @@ class PlannedTask(BaseTask):
         await super().on_error(error)
 
 
+def _file_stamp(path: str) -> tuple[int, int, int] | None:
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size, st.st_ino)
+
+
 class SchedulerTaskList(BaseModel):
     tasks: list[Annotated[Union[ScheduledTask, AdHocTask, PlannedTask], Field(discriminator="type")]] = Field(default_factory=list)
     # Singleton instance
@@ -475,26 +511,82 @@ class SchedulerTaskList(BaseModel):
                 cls.__instance = asyncio.run(cls(tasks=[]).save())
             else:
                 cls.__instance = cls.model_validate_json(read_file(path))
+                cls.__instance._file_stamp = _file_stamp(path)
         else:
-            asyncio.run(cls.__instance.reload())
+            # The in-memory list is authoritative; only pick up external edits
+            cls.__instance._reload_if_changed()
         return cls.__instance
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self._lock = threading.RLock()
+        # Bumped on every save and on every reload that picks up a changed file
+        self._version = 0
+        # (mtime_ns, size, inode) of tasks.json as last loaded or saved
+        self._file_stamp: tuple[int, int, int] | None = None
+        # Lookup indexes, rebuilt lazily when _version moves past _indexed_version
+        self._indexed_version = -1
+        self._by_uuid: dict[str, Union[ScheduledTask, AdHocTask, PlannedTask]] = {}
+        self._positions: dict[str, int] = {}
+        # min-heap of (due_from, seq, uuid) for tasks that can become due
+        self._due_heap: list[tuple[datetime, int, str]] = []
+        self._due_seq = 0
+
+    @property
+    def version(self) -> int:
+        return self._version
 
     async def reload(self) -> "SchedulerTaskList":
+        self._reload_if_changed()
+        return self
+
+    def _reload_if_changed(self) -> None:
         path = get_abs_path(SCHEDULER_FOLDER, "tasks.json")
         if exists(path):
             with self._lock:
+                stamp = _file_stamp(path)
+                if stamp is not None and stamp == self._file_stamp:
+                    # Unchanged since we last loaded or wrote it
+                    return
                 data = self.__class__.model_validate_json(read_file(path))
                 self.tasks.clear()
                 self.tasks.extend(data.tasks)
-        return self
+                self._file_stamp = stamp
+                self._version += 1
+
+    def _ensure_indexes(self) -> None:
+        with self._lock:
+            if self._indexed_version == self._version:
+                return
+            self._by_uuid = {}
+            self._positions = {}
+            for position, task in enumerate(self.tasks):
+                # first match wins, as with the linear scan this replaces
+                if task.uuid not in self._by_uuid:
+                    self._by_uuid[task.uuid] = task
+                    self._positions[task.uuid] = position
+            self._due_heap = []
+            for task in self._by_uuid.values():
+                self._push_due(task)
+            self._indexed_version = self._version
+
+    def _push_due(self, task: Union[ScheduledTask, AdHocTask, PlannedTask]) -> None:
+        try:
+            due_from = task.get_due_from()
+        except Exception:
+            # Let get_due_tasks() run check_schedule() and surface the error as before
+            due_from = datetime.now(timezone.utc)
+        if due_from is None:
+            return
+        if due_from.tzinfo is None:
+            due_from = pytz.timezone("UTC").localize(due_from)
+        self._due_seq += 1
+        heapq.heappush(self._due_heap, (due_from, self._due_seq, task.uuid))
 
     async def add_task(self, task: Union[ScheduledTask, AdHocTask, PlannedTask]) -> "SchedulerTaskList":
         with self._lock:
             self.tasks.append(task)
+            self._indexed_version = -1
             await self.save()
         return self
 
@@ -526,15 +618,12 @@ class SchedulerTaskList(BaseModel):
                     "ERROR: Found null token in JSON output for an adhoc task"
                 )
 
-            write_file(path, json_data)
-
-            # Debug: Verify after saving
-            if exists(path):
-                loaded_json = read_file(path)
-                if '"type": "adhoc"' in loaded_json and '"token": null' in loaded_json:
-                    PrintStyle(italic=True, font_color="red", padding=False).print(
-                        "ERROR: Null token persisted in JSON file for an adhoc task"
-                    )
+            # Write to a temp file and rename so readers never see a partial file
+            tmp_path = path + ".tmp"
+            write_file(tmp_path, json_data)
+            os.replace(tmp_path, path)
+            self._file_stamp = _file_stamp(path)
+            self._version += 1
 
         return self
 
@@ -557,8 +646,8 @@ class SchedulerTaskList(BaseModel):
             await self.reload()
 
             # Find the task
-            task = next((task for task in self.tasks if task.uuid == task_uuid and verify_func(task)), None)
-            if task is None:
+            task = self.get_task_by_uuid(task_uuid)
+            if task is None or not verify_func(task):
                 return None
 
             # Apply the updates via the provided function
@@ -584,14 +673,28 @@ class SchedulerTaskList(BaseModel):
     async def get_due_tasks(self) -> list[Union[ScheduledTask, AdHocTask, PlannedTask]]:
         with self._lock:
             await self.reload()
-            return [
-                task for task in self.tasks
-                if task.check_schedule() and task.state == TaskState.IDLE
-            ]
+            self._ensure_indexes()
+
+            # Only tasks whose due_from has passed can match check_schedule()
+            now = datetime.now(timezone.utc)
+            candidates = []
+            while self._due_heap and self._due_heap[0][0] <= now:
+                _, _, task_uuid = heapq.heappop(self._due_heap)
+                task = self._by_uuid.get(task_uuid)
+                if task is not None:
+                    candidates.append(task)
+
+            due = []
+            for task in sorted(candidates, key=lambda task: self._positions[task.uuid]):
+                if task.check_schedule() and task.state == TaskState.IDLE:
+                    due.append(task)
+                self._push_due(task)
+            return due
 
     def get_task_by_uuid(self, task_uuid: str) -> Union[ScheduledTask, AdHocTask, PlannedTask] | None:
         with self._lock:
-            return next((task for task in self.tasks if task.uuid == task_uuid), None)
+            self._ensure_indexes()
+            return self._by_uuid.get(task_uuid)
 
     def get_task_by_name(self, name: str) -> Union[ScheduledTask, AdHocTask, PlannedTask] | None:
         with self._lock:
@@ -604,12 +707,14 @@ class SchedulerTaskList(BaseModel):
     async def remove_task_by_uuid(self, task_uuid: str) -> "SchedulerTaskList":
         with self._lock:
             self.tasks = [task for task in self.tasks if task.uuid != task_uuid]
+            self._indexed_version = -1
             await self.save()
         return self
 
     async def remove_task_by_name(self, name: str) -> "SchedulerTaskList":
         with self._lock:
             self.tasks = [task for task in self.tasks if task.name != name]
+            self._indexed_version = -1
             await self.save()
         return self
 
@@ -639,6 +744,11 @@ class TaskScheduler:
     def get_tasks(self) -> list[Union[ScheduledTask, AdHocTask, PlannedTask]]:
         return self._tasks.get_tasks()
 
+    @property
+    def version(self) -> int:
+        """Changes whenever the task list is saved or reloaded with new content."""
+        return self._tasks.version
+
     def get_tasks_by_context_id(self, context_id: str, only_running: bool = False) -> list[Union[ScheduledTask, AdHocTask, PlannedTask]]:
         return self._tasks.get_tasks_by_context_id(context_id, only_running)
 
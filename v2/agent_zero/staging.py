@@ -12,6 +12,7 @@ import subprocess
 import hashlib
 import uuid
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, Any, Optional, List, Tuple
@@ -46,6 +47,10 @@ EVENT_TYPES.extend([
 # Repository URL for Agent Zero
 AGENT_ZERO_REPO = "https://github.com/frdel/agent-zero.git"
 
+# Checksum tuning: read size per hasher update and hashing threads
+CHECKSUM_CHUNK_SIZE = 1024 * 1024
+CHECKSUM_WORKERS = 8
+
 # Manifest schema for artifacts
 MANIFEST_SCHEMA = {
     "$schema": "https://json-schema.org/draft/2020-12/schema",
@@ -299,12 +304,41 @@ def create_virtualenv(temp_path: Path) -> None:
         raise DependencyError(f"Dependency installation failed: {str(e)}")
 
 
-def compute_checksums(temp_path: Path) -> Tuple[Dict[str, str], str]:
+def _hash_file(file_path: Path) -> Optional[str]:
+    """SHA256 of a file, or None if it can't be read."""
+    hasher = hashlib.sha256()
+    try:
+        with open(file_path, 'rb') as f:
+            for chunk in iter(lambda: f.read(CHECKSUM_CHUNK_SIZE), b''):
+                hasher.update(chunk)
+    except Exception:
+        return None
+    return hasher.hexdigest()
+
+
+def _stat_fingerprint(file_path: Path) -> Optional[Tuple[int, int, int]]:
+    try:
+        st = os.stat(file_path)
+    except OSError:
+        return None
+    return (st.st_size, st.st_mtime_ns, st.st_ino)
+
+
+def compute_checksums(
+    temp_path: Path,
+    stat_cache: Optional[Dict[str, Tuple[int, int, int, str]]] = None
+) -> Tuple[Dict[str, str], str]:
     """
     Compute SHA256 checksums for all files in the directory.
     
+    Files are hashed on a thread pool (hashlib releases the GIL on large
+    updates); checksums keep os.walk order so the manifest is unchanged.
+    
     Args:
         temp_path: Path to directory
+        stat_cache: Optional relative path -> (size, mtime_ns, inode, sha256)
+            from a previous run over the same tree. Files whose fingerprint
+            still matches are not re-read; the cache is updated in place.
         
     Returns:
         Tuple of (file_checksums dict, tree_hash)
@@ -313,9 +347,9 @@ def compute_checksums(temp_path: Path) -> Tuple[Dict[str, str], str]:
         ChecksumError: If checksum computation fails
     """
     try:
-        file_checksums = {}
+        relative_paths = []
         
-        # Walk all files and compute checksums
+        # Walk all files; hashing happens afterwards
         for root, dirs, files in os.walk(temp_path):
             # Skip .git directory
             if '.git' in dirs:
@@ -323,19 +357,30 @@ def compute_checksums(temp_path: Path) -> Tuple[Dict[str, str], str]:
             
             for file in files:
                 file_path = Path(root) / file
-                relative_path = file_path.relative_to(temp_path)
-                
-                # Compute SHA256
-                hasher = hashlib.sha256()
-                try:
-                    with open(file_path, 'rb') as f:
-                        for chunk in iter(lambda: f.read(4096), b''):
-                            hasher.update(chunk)
-                    
-                    file_checksums[str(relative_path)] = hasher.hexdigest()
-                except Exception as e:
-                    # Skip files that can't be read
-                    continue
+                relative_paths.append(str(file_path.relative_to(temp_path)))
+        
+        def checksum(relative_path: str) -> Optional[str]:
+            file_path = temp_path / relative_path
+            if stat_cache is None:
+                return _hash_file(file_path)
+            fingerprint = _stat_fingerprint(file_path)
+            cached = stat_cache.get(relative_path)
+            if fingerprint is not None and cached is not None and tuple(cached[:3]) == fingerprint:
+                return cached[3]
+            digest = _hash_file(file_path)
+            if digest is not None and fingerprint is not None:
+                stat_cache[relative_path] = fingerprint + (digest,)
+            return digest
+        
+        with ThreadPoolExecutor(max_workers=CHECKSUM_WORKERS) as pool:
+            digests = list(pool.map(checksum, relative_paths))
+        
+        # Skip files that can't be read
+        file_checksums = {
+            relative_path: digest
+            for relative_path, digest in zip(relative_paths, digests)
+            if digest is not None
+        }
         
         # Compute tree hash (SHA256 of sorted file hashes)
         sorted_hashes = sorted(file_checksums.items())
@@ -0,0 +1,76 @@
+"""
+Tests for the mtime-keyed class cache used by Agent.get_tool.
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+
+extract_tools = pytest.importorskip("python.helpers.extract_tools")
+
+
+class BaseTool:
+    pass
+
+
+TOOL_SOURCE = """
+from {module} import BaseTool
+
+
+class {name}(BaseTool):
+    pass
+"""
+
+
+def _write_tool(path, name, mtime_ns):
+    path.write_text(TOOL_SOURCE.format(module=__name__, name=name))
+    os.utime(path, ns=(mtime_ns, mtime_ns))
+
+
+@pytest.fixture(autouse=True)
+def _clear_cache():
+    extract_tools.clear_classes_cache()
+    yield
+    extract_tools.clear_classes_cache()
+
+
+def test_cached_lookup_skips_reimport(tmp_path):
+    tool_file = tmp_path / "echo.py"
+    _write_tool(tool_file, "Echo", 1_000_000_000)
+
+    first = extract_tools.load_classes_from_file_cached(str(tool_file), BaseTool, cache_key=("", "echo"))
+    second = extract_tools.load_classes_from_file_cached(str(tool_file), BaseTool, cache_key=("", "echo"))
+
+    assert [cls.__name__ for cls in first] == ["Echo"]
+    # a re-import would produce a new class object
+    assert second[0] is first[0]
+
+
+def test_modified_file_is_reimported(tmp_path):
+    tool_file = tmp_path / "echo.py"
+    _write_tool(tool_file, "Echo", 1_000_000_000)
+    first = extract_tools.load_classes_from_file_cached(str(tool_file), BaseTool, cache_key=("", "echo"))
+
+    _write_tool(tool_file, "EchoV2", 2_000_000_000)
+    second = extract_tools.load_classes_from_file_cached(str(tool_file), BaseTool, cache_key=("", "echo"))
+
+    assert first[0].__name__ == "Echo"
+    assert second[0].__name__ == "EchoV2"
+
+
+def test_cache_is_keyed_per_profile(tmp_path):
+    tool_file = tmp_path / "echo.py"
+    _write_tool(tool_file, "Echo", 1_000_000_000)
+
+    default = extract_tools.load_classes_from_file_cached(str(tool_file), BaseTool, cache_key=("", "echo"))
+    profiled = extract_tools.load_classes_from_file_cached(str(tool_file), BaseTool, cache_key=("dev", "echo"))
+
+    assert default[0] is not profiled[0]
+
+
+def test_missing_file_raises(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        extract_tools.load_classes_from_file_cached(str(tmp_path / "missing.py"), BaseTool)
@@ -0,0 +1,115 @@
+"""
+Tests for the persistent MCP client session: one stdio server process is
+reused across operations, and replaced after an idle timeout.
+"""
+
+import asyncio
+import os
+import sys
+import textwrap
+import time
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+pytest.importorskip("mcp")
+mcp_handler = pytest.importorskip("python.helpers.mcp_handler")
+
+
+DUMMY_SERVER = textwrap.dedent(
+    """
+    import os
+    import sys
+
+    from mcp.server.fastmcp import FastMCP
+
+    with open(sys.argv[1], "a") as f:
+        f.write(f"{os.getpid()}\\n")
+
+    server = FastMCP("dummy")
+
+
+    @server.tool()
+    def echo(text: str) -> str:
+        return text
+
+
+    server.run("stdio")
+    """
+)
+
+
+@pytest.fixture
+def dummy_server(tmp_path):
+    script = tmp_path / "dummy_mcp_server.py"
+    script.write_text(DUMMY_SERVER)
+    spawn_log = tmp_path / "spawns.log"
+
+    servers = []
+
+    def make():
+        server = mcp_handler.MCPServerLocal(
+            {
+                "name": "dummy",
+                "command": sys.executable,
+                "args": [str(script), str(spawn_log)],
+            }
+        )
+        servers.append(server)
+        return server
+
+    def spawns():
+        if not spawn_log.exists():
+            return 0
+        return len(spawn_log.read_text().splitlines())
+
+    yield make, spawns
+
+    for server in servers:
+        server.close_session()
+
+
+def _text(result):
+    return result.content[0].text
+
+
+def test_server_spawned_once_across_calls(dummy_server):
+    make, spawns = dummy_server
+    server = make()
+    assert server.has_tool("echo")
+
+    for i in range(10):
+        # each asyncio.run is a fresh event loop, like separate agent contexts
+        result = asyncio.run(server.call_tool("echo", {"text": f"hello {i}"}))
+        assert _text(result) == f"hello {i}"
+
+    assert spawns() == 1
+
+
+def test_concurrent_calls_share_session(dummy_server):
+    make, spawns = dummy_server
+    server = make()
+
+    async def run_many():
+        return await asyncio.gather(
+            *(server.call_tool("echo", {"text": str(i)}) for i in range(20))
+        )
+
+    results = asyncio.run(run_many())
+
+    assert [_text(r) for r in results] == [str(i) for i in range(20)]
+    assert spawns() == 1
+
+
+def test_idle_session_is_closed_and_reopened(dummy_server, monkeypatch):
+    monkeypatch.setattr(mcp_handler.MCPClientBase, "SESSION_IDLE_TIMEOUT_SECONDS", 0.2)
+    make, spawns = dummy_server
+    server = make()
+    assert spawns() == 1
+
+    time.sleep(0.6)
+    result = asyncio.run(server.call_tool("echo", {"text": "again"}))
+
+    assert _text(result) == "again"
+    assert spawns() == 2
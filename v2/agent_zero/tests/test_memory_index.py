@@ -0,0 +1,83 @@
+"""
+Tests for memory vector index construction (flat / IVF / HNSW).
+"""
+
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+faiss = pytest.importorskip("faiss")
+np = pytest.importorskip("numpy")
+
+from python.helpers.memory_index import (  # noqa: E402
+    INDEX_FLAT,
+    INDEX_HNSW,
+    INDEX_IVF,
+    IndexConfig,
+    build_index,
+    create_index,
+    index_kind,
+    needs_rebuild,
+    rebuild_index,
+    reconstruct_all,
+)
+
+
+def _vectors(count, dim=16, seed=0):
+    rng = np.random.default_rng(seed)
+    vectors = rng.standard_normal((count, dim)).astype(np.float32)
+    return vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+
+
+def test_from_settings_falls_back_to_flat_for_unknown_type():
+    assert IndexConfig.from_settings({"memory_index_type": "bogus"}).index_type == INDEX_FLAT
+    config = IndexConfig.from_settings({"memory_index_type": "hnsw", "memory_index_hnsw_ef_search": 99})
+    assert config.index_type == INDEX_HNSW
+    assert config.hnsw_ef_search == 99
+
+
+def test_ivf_starts_flat_and_trains_once_threshold_is_reached():
+    config = IndexConfig(index_type=INDEX_IVF, ivf_nlist=4, ivf_train_min_vectors=40)
+    index = create_index(16, config)
+    assert index_kind(index) == INDEX_FLAT
+
+    index.add(_vectors(39))
+    assert needs_rebuild(index, config) is False
+    index.add(_vectors(1, seed=1))
+    assert needs_rebuild(index, config) is True
+
+    trained = build_index(reconstruct_all(index), config, 16)
+    assert index_kind(trained) == INDEX_IVF
+    assert trained.ntotal == 40
+    assert faiss.extract_index_ivf(trained).nprobe == config.ivf_nprobe
+
+
+def test_rebuild_keeps_positions_and_ivf_training():
+    config = IndexConfig(index_type=INDEX_IVF, ivf_nlist=4, ivf_train_min_vectors=40)
+    data = _vectors(60)
+    index = build_index(data, config, 16)
+    keep = [i for i in range(60) if i % 3]
+
+    rebuilt = rebuild_index(index, reconstruct_all(index)[keep], config)
+    assert index_kind(rebuilt) == INDEX_IVF
+    assert rebuilt.ntotal == len(keep)
+    np.testing.assert_allclose(reconstruct_all(rebuilt), data[keep], atol=1e-6)
+
+
+def test_hnsw_index_finds_exact_neighbour():
+    config = IndexConfig(index_type=INDEX_HNSW, hnsw_m=8, hnsw_ef_search=32)
+    data = _vectors(200)
+    index = build_index(data, config, 16)
+    assert index_kind(index) == INDEX_HNSW
+    assert index.hnsw.efSearch == 32
+    _, ids = index.search(data[:5], 1)
+    assert ids[:, 0].tolist() == [0, 1, 2, 3, 4]
+
+
+def test_type_change_requires_rebuild():
+    index = build_index(_vectors(10), IndexConfig(), 16)
+    assert needs_rebuild(index, IndexConfig(index_type=INDEX_HNSW)) is True
+    assert needs_rebuild(index, IndexConfig()) is False
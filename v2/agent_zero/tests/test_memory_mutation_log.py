@@ -0,0 +1,169 @@
+"""
+Tests for memory persistence: changes go to a mutation log right away and
+are folded into the FAISS snapshot later; a restart replays the log.
+"""
+
+import asyncio
+import hashlib
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+faiss = pytest.importorskip("faiss")
+np = pytest.importorskip("numpy")
+pytest.importorskip("langchain_community")
+memory = pytest.importorskip("python.helpers.memory")
+
+from langchain_community.docstore.in_memory import InMemoryDocstore  # noqa: E402
+from langchain_community.vectorstores.utils import DistanceStrategy  # noqa: E402
+from langchain_core.documents import Document  # noqa: E402
+from langchain_core.embeddings import Embeddings  # noqa: E402
+
+from python.helpers.memory_index import IndexConfig, create_index, reconstruct_all  # noqa: E402
+
+Memory = memory.Memory
+SUBDIR = "test"
+DIM = 8
+
+
+class _HashEmbeddings(Embeddings):
+    def embed_documents(self, texts):
+        return [self.embed_query(text) for text in texts]
+
+    def embed_query(self, text):
+        seed = int(hashlib.sha256(text.encode()).hexdigest()[:8], 16)
+        vector = np.random.default_rng(seed).standard_normal(DIM).astype(np.float32)
+        return (vector / np.linalg.norm(vector)).tolist()
+
+
+def _new_db():
+    return memory.MyFaiss(
+        embedding_function=_HashEmbeddings(),
+        index=create_index(DIM, IndexConfig()),
+        docstore=InMemoryDocstore(),
+        index_to_docstore_id={},
+        distance_strategy=DistanceStrategy.COSINE,
+        relevance_score_fn=Memory._cosine_normalizer,
+    )
+
+
+def _docs(db):
+    docs = {id: (doc.page_content, doc.metadata) for id, doc in db.get_all_docs().items()}
+    # every position must hold the vector of the document it points at
+    vectors = reconstruct_all(db.index)
+    assert len(vectors) == len(docs) == len(db.index_to_docstore_id)
+    embedder = _HashEmbeddings()
+    for position, id in db.index_to_docstore_id.items():
+        expected = embedder.embed_query(docs[id][0])
+        assert np.allclose(vectors[position], expected, atol=1e-6)
+    return docs
+
+
+def _log_path(name=memory.MUTATION_LOG_FILE):
+    return os.path.join(memory.abs_db_dir(SUBDIR), name)
+
+
+def _restart():
+    db, consistent = Memory._load_db_file(SUBDIR, _HashEmbeddings())
+    assert consistent
+    Memory._replay_mutations(db, SUBDIR)
+    return db
+
+
+@pytest.fixture
+def store(tmp_path, monkeypatch):
+    monkeypatch.setattr(memory, "abs_db_dir", lambda subdir: str(tmp_path / subdir))
+    monkeypatch.setattr(Memory, "SAVE_DEBOUNCE_SECONDS", 3600.0)
+    monkeypatch.setattr(Memory, "_pending_saves", {})
+    monkeypatch.setattr(Memory, "index", {})
+    os.makedirs(tmp_path / SUBDIR)
+    db = _new_db()
+    Memory._save_db_file(db, SUBDIR)
+    yield Memory(db, memory_subdir=SUBDIR)
+    for state in Memory._pending_saves.values():
+        if state.timer:
+            state.timer.cancel()
+
+
+def test_crash_before_snapshot_replays_to_the_same_docs(store):
+    ids = asyncio.run(store.insert_documents([Document(f"note {i}") for i in range(3)]))
+    updated = Document("note 1, revised", metadata=dict(store.get_document_by_id(ids[1]).metadata))
+    asyncio.run(store.update_documents([updated]))
+    asyncio.run(store.delete_documents_by_ids([ids[2]]))
+
+    with open(_log_path()) as f:
+        assert len(f.readlines()) == 3
+
+    restarted = _restart()
+    assert _docs(restarted) == _docs(store.db)
+    assert restarted.get_by_ids(ids[1])[0].page_content == "note 1, revised"
+    assert not restarted.get_by_ids(ids[2])
+
+
+def test_replay_is_idempotent_and_skips_a_torn_final_line(store):
+    ids = asyncio.run(store.insert_documents([Document("alpha"), Document("beta")]))
+    metadata = dict(store.get_document_by_id(ids[0]).metadata)
+    with open(_log_path(), "a") as f:
+        # upsert of an id the log already created, delete of an id never stored
+        f.write(memory.json.dumps(Memory._upsert_record([Document("alpha 2", metadata=metadata)])) + "\n")
+        f.write(memory.json.dumps({"op": "delete", "ids": ["missing"]}) + "\n")
+        f.write('{"op": "upsert", "do')
+
+    restarted = _restart()
+    once = _docs(restarted)
+    Memory._replay_mutations(restarted, SUBDIR)
+    assert _docs(restarted) == once
+    assert once[ids[0]][0] == "alpha 2"
+    assert once[ids[1]][0] == "beta"
+    assert len(once) == 2
+
+
+def test_snapshot_is_written_after_max_pending_mutations(store, monkeypatch):
+    monkeypatch.setattr(Memory, "SAVE_MAX_PENDING_MUTATIONS", 3)
+    for i in range(3):
+        asyncio.run(store.insert_text(f"fact {i}"))
+
+    assert not os.path.exists(_log_path())
+    assert not os.path.exists(_log_path(memory.FLUSHING_LOG_FILE))
+    assert Memory._pending_saves[SUBDIR].timer is None
+    snapshot, consistent = Memory._load_db_file(SUBDIR, _HashEmbeddings())
+    assert consistent
+    assert _docs(snapshot) == _docs(store.db)
+
+
+def test_flush_writes_the_snapshot_and_drops_the_log(store):
+    Memory.index[SUBDIR] = store.db
+    asyncio.run(store.insert_text("remember me"))
+    assert os.path.exists(_log_path())
+
+    Memory.flush(SUBDIR)
+
+    assert not os.path.exists(_log_path())
+    assert Memory._pending_saves[SUBDIR].mutations == 0
+    snapshot, consistent = Memory._load_db_file(SUBDIR, _HashEmbeddings())
+    assert consistent
+    assert _docs(snapshot) == _docs(store.db)
+
+
+def test_torn_snapshot_is_detected_and_rebuilt_from_docstore_and_logs(store):
+    Memory.index[SUBDIR] = store.db
+    asyncio.run(store.insert_text("first"))
+    Memory.flush(SUBDIR)
+    asyncio.run(store.insert_text("second"))
+
+    # crash between the renames: index.faiss is new, index.pkl is still the old one
+    index_bytes, _ = Memory._snapshot_bytes(store.db)
+    with open(os.path.join(memory.abs_db_dir(SUBDIR), "index.faiss"), "wb") as f:
+        f.write(index_bytes)
+
+    loaded, consistent = Memory._load_db_file(SUBDIR, _HashEmbeddings())
+    assert not consistent
+
+    rebuilt = _new_db()
+    docs = loaded.get_all_docs()
+    rebuilt.add_documents(documents=list(docs.values()), ids=list(docs.keys()))
+    Memory._replay_mutations(rebuilt, SUBDIR)
+    assert _docs(rebuilt) == _docs(store.db)
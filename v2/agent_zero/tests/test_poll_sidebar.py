@@ -0,0 +1,144 @@
+"""
+Tests for the poll endpoint's chat/task delta protocol: a client that echoes
+contexts_version back only receives the entries that changed since.
+"""
+
+import os
+import sys
+from datetime import datetime, timezone
+from types import SimpleNamespace
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+poll = pytest.importorskip("python.api.poll")
+
+from agent import AgentContext  # noqa: E402
+
+TIMEZONE = "UTC"
+
+
+class _Scheduler:
+    def __init__(self):
+        self.version = 0
+        self.tasks = {}
+
+    def add(self, uuid, name):
+        self.tasks[uuid] = SimpleNamespace(uuid=uuid, name=name, context_id=uuid)
+        self.version += 1
+
+    def save(self):
+        self.version += 1
+
+    def get_task_by_uuid(self, uuid):
+        return self.tasks.get(uuid)
+
+    def serialize_task(self, uuid):
+        task = self.tasks[uuid]
+        return {"name": task.name, "uuid": uuid, "type": "adhoc", "token": "1", "context_id": uuid}
+
+
+def _context(id, day):
+    return AgentContext(config=None, id=id, agent0=object(), created_at=datetime(2026, 1, day, tzinfo=timezone.utc))
+
+
+def _poll(scheduler, client_version=None, timezone=TIMEZONE):
+    version = f"{poll._EPOCH}:{AgentContext.current_version()}:{scheduler.version}:{timezone}"
+    return poll._sidebar(scheduler, timezone, version, client_version)
+
+
+def _ids(entries):
+    return [entry["id"] for entry in entries]
+
+
+@pytest.fixture
+def scheduler(monkeypatch):
+    monkeypatch.setattr(AgentContext, "_contexts", {})
+    monkeypatch.setattr(poll, "_entries", {})
+    scheduler = _Scheduler()
+    _context("chat-a", 1)
+    _context("chat-b", 2)
+    _context("task-c", 3)
+    scheduler.add("task-c", "nightly")
+    return scheduler
+
+
+def test_first_poll_returns_the_full_lists(scheduler):
+    sidebar = _poll(scheduler)
+
+    assert sidebar["contexts_delta"] is False
+    assert _ids(sidebar["contexts"]) == ["chat-b", "chat-a"]
+    assert _ids(sidebar["tasks"]) == ["task-c"]
+    assert sidebar["tasks"][0]["task_name"] == "nightly"
+    assert "context_ids" not in sidebar
+
+
+def test_unchanged_version_returns_nothing(scheduler):
+    version = _poll(scheduler)["contexts_version"]
+    sidebar = _poll(scheduler, version)
+
+    assert sidebar["contexts_delta"] is True
+    assert sidebar["contexts_version"] == version
+    assert sidebar["contexts"] == [] and sidebar["tasks"] == []
+    assert sidebar["context_ids"] is None and sidebar["task_ids"] is None
+
+
+def test_log_update_resends_only_that_context(scheduler):
+    version = _poll(scheduler)["contexts_version"]
+    AgentContext.get("chat-a").log.log(type="info", heading="working")
+
+    sidebar = _poll(scheduler, version)
+    assert sidebar["contexts_delta"] is True
+    assert _ids(sidebar["contexts"]) == ["chat-a"]
+    assert sidebar["contexts"][0]["log_version"] == 1
+    assert sidebar["tasks"] == []
+    assert sidebar["context_ids"] == ["chat-b", "chat-a"]
+    assert sidebar["task_ids"] == ["task-c"]
+
+
+def test_set_output_data_resends_only_that_context(scheduler):
+    version = _poll(scheduler)["contexts_version"]
+    AgentContext.get("chat-b").set_output_data("project", "demo")
+
+    sidebar = _poll(scheduler, version)
+    assert _ids(sidebar["contexts"]) == ["chat-b"]
+    assert sidebar["contexts"][0]["project"] == "demo"
+
+
+def test_removed_context_drops_out_of_context_ids(scheduler):
+    version = _poll(scheduler)["contexts_version"]
+    AgentContext.remove("chat-a")
+
+    sidebar = _poll(scheduler, version)
+    assert sidebar["contexts_version"] != version
+    assert sidebar["contexts"] == []
+    assert sidebar["context_ids"] == ["chat-b"]
+
+
+def test_scheduler_save_resends_only_task_entries(scheduler):
+    version = _poll(scheduler)["contexts_version"]
+    scheduler.tasks["task-c"].name = "weekly"
+    scheduler.save()
+
+    sidebar = _poll(scheduler, version)
+    assert sidebar["contexts"] == []
+    assert _ids(sidebar["tasks"]) == ["task-c"]
+    assert sidebar["tasks"][0]["task_name"] == "weekly"
+
+
+@pytest.mark.parametrize("foreign", ["epoch", "timezone", "garbage"])
+def test_foreign_version_falls_back_to_the_full_lists(scheduler, foreign):
+    version = _poll(scheduler)["contexts_version"]
+    AgentContext.get("chat-a").set_output_data("touched", True)
+    if foreign == "epoch":
+        client_version = "deadbeef" + version[len(poll._EPOCH):]
+    elif foreign == "timezone":
+        client_version = version[: -len(TIMEZONE)] + "Europe/Prague"
+    else:
+        client_version = "not-a-version"
+
+    sidebar = _poll(scheduler, client_version)
+    assert sidebar["contexts_delta"] is False
+    assert _ids(sidebar["contexts"]) == ["chat-b", "chat-a"]
+    assert _ids(sidebar["tasks"]) == ["task-c"]
@@ -0,0 +1,139 @@
+"""
+Tests for SchedulerTaskList's in-memory indexes: get_due_tasks() must select
+exactly what the former linear check_schedule() scan selected.
+"""
+
+import asyncio
+import os
+import sys
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+pytest.importorskip("crontab")
+task_scheduler = pytest.importorskip("python.helpers.task_scheduler")
+
+from python.helpers.task_scheduler import (  # noqa: E402
+    AdHocTask,
+    PlannedTask,
+    ScheduledTask,
+    SchedulerTaskList,
+    TaskPlan,
+    TaskSchedule,
+    TaskState,
+)
+
+START = datetime(2026, 3, 2, 12, 58, 0, tzinfo=timezone.utc)
+
+
+class _Clock(datetime):
+    current = START
+
+    @classmethod
+    def now(cls, tz=None):
+        return cls.current.astimezone(tz) if tz else cls.current.replace(tzinfo=None)
+
+
+def _scheduled(name, minute="0", hour="13"):
+    schedule = TaskSchedule(minute=minute, hour=hour, day="*", month="*", weekday="*", timezone="UTC")
+    return ScheduledTask(name=name, system_prompt="", prompt="", schedule=schedule)
+
+
+def _planned(name, *todo):
+    return PlannedTask(name=name, system_prompt="", prompt="", plan=TaskPlan.create(todo=list(todo)))
+
+
+def _scan(task_list):
+    # the selection get_due_tasks() made before the due index existed
+    return [task for task in task_list.tasks if task.check_schedule() and task.state == TaskState.IDLE]
+
+
+def _assert_matches_scan(task_list, at):
+    _Clock.current = at
+    due = asyncio.run(task_list.get_due_tasks())
+    expected = _scan(task_list)
+    assert [task.uuid for task in due] == [task.uuid for task in expected], at
+    return [task.name for task in due]
+
+
+@pytest.fixture
+def task_list(tmp_path, monkeypatch):
+    monkeypatch.setattr(task_scheduler, "get_abs_path", lambda *parts: str(tmp_path.joinpath(*parts)))
+    monkeypatch.setattr(task_scheduler, "datetime", _Clock)
+    _Clock.current = START
+    return asyncio.run(SchedulerTaskList(tasks=[]).save())
+
+
+def test_cron_task_is_due_within_the_look_back_window(task_list):
+    asyncio.run(task_list.add_task(_scheduled("hourly")))
+    asyncio.run(task_list.add_task(_scheduled("later", hour="15")))
+
+    assert _assert_matches_scan(task_list, START) == []
+    assert _assert_matches_scan(task_list, START.replace(hour=13, minute=0, second=20)) == ["hourly"]
+    # still inside the 60s look-back, the scan selected it again
+    assert _assert_matches_scan(task_list, START.replace(hour=13, minute=0, second=50)) == ["hourly"]
+    assert _assert_matches_scan(task_list, START.replace(hour=13, minute=1, second=10)) == []
+    assert _assert_matches_scan(task_list, START.replace(hour=15, minute=0, second=5)) == ["later"]
+
+
+def test_running_task_is_rekeyed_and_selected_once_idle(task_list):
+    task = _scheduled("busy")
+    asyncio.run(task_list.add_task(task))
+    task.update(state=TaskState.RUNNING)
+
+    assert _assert_matches_scan(task_list, START.replace(hour=13, minute=0, second=10)) == []
+    task.update(state=TaskState.IDLE)
+    assert _assert_matches_scan(task_list, START.replace(hour=13, minute=0, second=40)) == ["busy"]
+
+
+def test_planned_task_follows_todo_changes_made_through_update(task_list):
+    task = _planned("plan", START.replace(hour=14, minute=0))
+    asyncio.run(task_list.add_task(task))
+
+    assert _assert_matches_scan(task_list, START.replace(hour=13, minute=30)) == []
+    asyncio.run(
+        task_list.update_task_by_uuid(task.uuid, lambda t: t.plan.add_todo(START.replace(hour=13, minute=45)))
+    )
+    assert _assert_matches_scan(task_list, START.replace(hour=13, minute=50)) == ["plan"]
+
+    asyncio.run(task_list.update_task_by_uuid(task.uuid, lambda t: t.plan.set_in_progress(t.plan.todo[0])))
+    assert _assert_matches_scan(task_list, START.replace(hour=13, minute=55)) == []
+    assert _assert_matches_scan(task_list, START.replace(hour=14, minute=0, second=1)) == ["plan"]
+
+
+def test_external_edit_of_tasks_json_is_picked_up(task_list):
+    asyncio.run(task_list.add_task(_scheduled("original", hour="20")))
+
+    edited = SchedulerTaskList(tasks=list(task_list.tasks) + [_scheduled("external", hour="13")])
+    path = task_scheduler.get_abs_path(task_scheduler.SCHEDULER_FOLDER, "tasks.json")
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(edited.model_dump_json(indent=2))
+
+    assert _assert_matches_scan(task_list, START.replace(hour=13, minute=0, second=30)) == ["external"]
+    assert [task.name for task in task_list.tasks] == ["original", "external"]
+
+
+def test_ad_hoc_tasks_are_never_selected(task_list):
+    adhoc = AdHocTask(name="manual", system_prompt="", prompt="")
+    asyncio.run(task_list.add_task(adhoc))
+    asyncio.run(task_list.add_task(_scheduled("hourly")))
+
+    assert _assert_matches_scan(task_list, START.replace(hour=13, minute=0, second=10)) == ["hourly"]
+    assert _assert_matches_scan(task_list, START.replace(hour=13, minute=30)) == []
+    assert adhoc.uuid not in {entry[2] for entry in task_list._due_heap}
+
+
+def test_get_task_by_uuid_after_add_and_remove(task_list):
+    first, second = _scheduled("first"), _planned("second", START + timedelta(days=1))
+    asyncio.run(task_list.add_task(first))
+    assert task_list.get_task_by_uuid(first.uuid) is first
+    assert task_list.get_task_by_uuid(second.uuid) is None
+
+    asyncio.run(task_list.add_task(second))
+    assert task_list.get_task_by_uuid(second.uuid) is second
+
+    asyncio.run(task_list.remove_task_by_uuid(first.uuid))
+    assert task_list.get_task_by_uuid(first.uuid) is None
+    assert task_list.get_task_by_uuid(second.uuid) is second
@@ -0,0 +1,96 @@
+"""
+Tests for staging checksum computation.
+
+The parallel hashing path must produce the same manifest content, in the
+same order, as hashing each file serially while walking the tree.
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+import sys
+
+# Add project root to Python path to allow relative imports
+sys.path.insert(0, str(Path(__file__).resolve().parents[3]))
+
+from v2.agent_zero import staging
+
+
+def serial_checksums(temp_path: Path):
+    """The original single-threaded walk-and-hash."""
+    file_checksums = {}
+    for root, dirs, files in os.walk(temp_path):
+        if '.git' in dirs:
+            dirs.remove('.git')
+        for file in files:
+            file_path = Path(root) / file
+            hasher = hashlib.sha256()
+            try:
+                with open(file_path, 'rb') as f:
+                    for chunk in iter(lambda: f.read(4096), b''):
+                        hasher.update(chunk)
+                file_checksums[str(file_path.relative_to(temp_path))] = hasher.hexdigest()
+            except Exception:
+                continue
+    tree_data = json.dumps(sorted(file_checksums.items()), sort_keys=True)
+    return file_checksums, hashlib.sha256(tree_data.encode()).hexdigest()
+
+
+class TestComputeChecksums(unittest.TestCase):
+    """Tests for compute_checksums."""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.root = Path(self.temp_dir.name)
+        for index in range(40):
+            directory = self.root / f"pkg{index % 5}" / f"mod{index % 3}"
+            directory.mkdir(parents=True, exist_ok=True)
+            (directory / f"file{index}.py").write_bytes(os.urandom(index * 997))
+        (self.root / "large.bin").write_bytes(os.urandom(3 * staging.CHECKSUM_CHUNK_SIZE + 17))
+        (self.root / ".git").mkdir()
+        (self.root / ".git" / "HEAD").write_text("ref: refs/heads/main\n")
+        (self.root / "dangling").symlink_to(self.root / "missing")
+        log_patch = mock.patch.object(staging, "log_event")
+        log_patch.start()
+        self.addCleanup(log_patch.stop)
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_matches_serial_manifest_bytes(self):
+        """Test the manifest checksums section is byte-identical to the serial walk."""
+        expected_files, expected_tree = serial_checksums(self.root)
+        file_checksums, tree_hash = staging.compute_checksums(self.root)
+
+        self.assertEqual(tree_hash, expected_tree)
+        self.assertEqual(
+            json.dumps(file_checksums, indent=2),
+            json.dumps(expected_files, indent=2)
+        )
+        self.assertNotIn("dangling", file_checksums)
+        self.assertFalse(any(path.startswith(".git") for path in file_checksums))
+
+    def test_stat_cache_skips_unchanged_files(self):
+        """Test files with a matching (size, mtime, inode) are not re-read."""
+        stat_cache = {}
+        first = staging.compute_checksums(self.root, stat_cache=stat_cache)
+        self.assertEqual(len(stat_cache), len(first[0]))
+
+        changed = self.root / "pkg0" / "mod0" / "file0.py"
+        changed.write_bytes(b"changed")
+        with mock.patch.object(staging, "_hash_file", wraps=staging._hash_file) as hash_file:
+            second = staging.compute_checksums(self.root, stat_cache=stat_cache)
+
+        rehashed = {call.args[0] for call in hash_file.call_args_list}
+        # The dangling symlink has no fingerprint, so it is always retried.
+        self.assertEqual(rehashed, {changed, self.root / "dangling"})
+        self.assertEqual(second, serial_checksums(self.root))
+        self.assertNotEqual(second[1], first[1])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,78 @@
+"""
+Tests for StreamingSecretsFilter masking across chunk boundaries.
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+
+secrets = pytest.importorskip("python.helpers.secrets")
+StreamingSecretsFilter = secrets.StreamingSecretsFilter
+
+
+def _stream(key_to_value, chunks):
+    f = StreamingSecretsFilter(key_to_value)
+    return "".join(f.process_chunk(chunk) for chunk in chunks) + f.finalize()
+
+
+def test_secret_in_one_chunk_is_replaced():
+    assert _stream({"api_key": "sk-12345"}, ["token sk-12345 end"]) == "token §§secret(API_KEY) end"
+
+
+def test_secret_split_across_chunks_is_held_and_replaced():
+    f = StreamingSecretsFilter({"api_key": "sk-12345"})
+
+    assert f.process_chunk("token sk-1") == "token "
+    assert f.process_chunk("23") == ""
+    assert f.process_chunk("45 end") == "§§secret(API_KEY) end"
+    assert f.finalize() == ""
+
+
+def test_no_chunking_leaks_a_secret():
+    key_to_value = {"a": "hunter2", "b": "correcthorse", "c": "horsebattery"}
+    text = "pw hunter2, phrase correcthorsebattery staple, hunter hunter2"
+
+    for size in range(1, len(text) + 1):
+        chunks = [text[i : i + size] for i in range(0, len(text), size)]
+        out = _stream(key_to_value, chunks)
+        assert " staple, hunter " in out
+        for value in key_to_value.values():
+            # at most the first min_trigger - 1 characters can slip out
+            assert value[2:] not in out
+
+
+def test_overlapping_secrets_leak_nothing():
+    out = _stream({"a": "abcdef", "b": "defghi"}, ["xx abcdefghi yy"])
+
+    assert out == "xx §§secret(A)§§secret(B) yy"
+
+
+def test_longer_secret_sharing_a_prefix_wins():
+    key_to_value = {"short": "token", "long": "token-extended"}
+
+    assert _stream(key_to_value, ["a token-ext", "ended b"]) == "a §§secret(LONG) b"
+    assert _stream(key_to_value, ["a token-ex", "it b"]) == "a §§secret(SHORT)-exit b"
+
+
+def test_unresolved_partial_is_masked_on_finalize():
+    assert _stream({"api_key": "sk-12345"}, ["value sk-12"]) == "value ***"
+
+
+def test_secret_started_below_trigger_masks_the_remainder():
+    f = StreamingSecretsFilter({"api_key": "sk-12345"})
+
+    # "sk" is shorter than min_trigger, so it is not held back
+    assert f.process_chunk("value sk") == "value sk"
+    assert f.process_chunk("-12345 end") == "§§secret(API_KEY) end"
+    assert f.finalize() == ""
+
+
+def test_filter_reusable_after_finalize():
+    f = StreamingSecretsFilter({"api_key": "sk-12345"})
+    f.process_chunk("sk-123")
+    f.finalize()
+
+    assert f.process_chunk("sk-12345 ok") == "§§secret(API_KEY) ok"
@@ -9,10 +9,14 @@ import shutil
 import unittest
 from pathlib import Path
 import sys
+import threading
+import time
+from unittest import mock
 
 # Add project root to Python path to allow relative imports
 sys.path.insert(0, str(Path(__file__).resolve().parents[3]))
 
+from v2.agent_zero import validator as validator_module
 from v2.agent_zero.validator import (
     ArtifactValidator,
     validate_artifact,
@@ -211,6 +215,83 @@ class TestArtifactValidator(unittest.TestCase):
             self.assertIsInstance(check_result["ms"], (int, float))
             self.assertGreaterEqual(check_result["ms"], 0)
 
+    def test_checks_run_concurrently(self):
+        """Test 11: Total latency follows the slowest check, not the sum."""
+        artifact_path = create_mock_artifact()
+        self.test_artifacts.append(artifact_path)
+        validator = ArtifactValidator(artifact_path, "v0.9.8")
+
+        def slow(check):
+            def run():
+                time.sleep(0.3)
+                return check()
+            return run
+
+        for name in ("run_check_integrity", "run_check_config", "run_check_tools", "run_check_prompts"):
+            setattr(validator, name, slow(getattr(validator, name)))
+
+        started = time.monotonic()
+        report = validator.validate_all()
+        elapsed = time.monotonic() - started
+
+        self.assertLess(elapsed, 0.9)
+        self.assertEqual(list(report["checks"]), [
+            "structural_integrity",
+            "import_sanity",
+            "config_parsing",
+            "tool_registry",
+            "prompt_assets",
+            "memory_initialization"
+        ])
+        self.assertTrue(report["checks"]["prompt_assets"]["passed"])
+
+    def test_check_timeout_from_worker_thread(self):
+        """Test 12: Per-check deadlines work off the main thread."""
+        artifact_path = create_mock_artifact()
+        self.test_artifacts.append(artifact_path)
+        validator = ArtifactValidator(artifact_path, "v0.9.8")
+        release = threading.Event()
+        validator.run_check_memory = lambda: release.wait(5) and {}
+        reports = []
+
+        with mock.patch.object(validator_module, "CHECK_TIMEOUT", 0.2):
+            worker = threading.Thread(target=lambda: reports.append(validator.validate_all()))
+            worker.start()
+            worker.join(5)
+        release.set()
+
+        self.assertEqual(len(reports), 1)
+        report = reports[0]
+        self.assertEqual(report["status"], "FAILED")
+        memory = report["checks"]["memory_initialization"]
+        self.assertFalse(memory["passed"])
+        self.assertIn("timed out", memory["error"])
+        self.assertTrue(report["checks"]["structural_integrity"]["passed"])
+
+    def test_hung_checks_finish_within_one_check_timeout(self):
+        """Test 13: Several hung checks cost one CHECK_TIMEOUT, not one each."""
+        artifact_path = create_mock_artifact()
+        self.test_artifacts.append(artifact_path)
+        validator = ArtifactValidator(artifact_path, "v0.9.8")
+        release = threading.Event()
+        hang = lambda: release.wait(5) and {}
+        validator.run_check_config = hang
+        validator.run_check_tools = hang
+        validator.run_check_memory = hang
+
+        try:
+            with mock.patch.object(validator_module, "CHECK_TIMEOUT", 0.3):
+                started = time.monotonic()
+                report = validator.validate_all()
+                elapsed = time.monotonic() - started
+        finally:
+            release.set()
+
+        self.assertLess(elapsed, 0.3 * 2)
+        for name in ("config_parsing", "tool_registry", "memory_initialization"):
+            self.assertEqual(report["checks"][name]["error"], "Check timed out after 0.3s")
+        self.assertTrue(report["checks"]["prompt_assets"]["passed"])
+
 
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
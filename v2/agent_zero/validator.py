@@ -11,9 +11,10 @@ import subprocess
 import hashlib
 import time
 import shutil
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, Any, Optional, List, Tuple
+from typing import Callable, Dict, Any, Optional, List, Tuple
 
 from .audit import log_event, EVENT_TYPES
 from .state_machine import AgentZeroStateMachine, State, ReasonCode
@@ -32,6 +33,8 @@ EVENT_TYPES.extend([
 # Timeouts
 CHECK_TIMEOUT = 10  # seconds per individual check
 SUITE_TIMEOUT = 30  # seconds for entire validation suite
+# Checks run concurrently under one shared deadline, so a suite lasts at most
+# CHECK_TIMEOUT; keep CHECK_TIMEOUT <= SUITE_TIMEOUT to honour the suite budget.
 
 # Check result schema
 CHECK_RESULT_SCHEMA = {
@@ -187,37 +190,59 @@ class ArtifactValidator:
         if not artifact_path.exists():
             raise ArtifactNotFoundError(f"Artifact not found: {artifact_path}")
     
-    def _run_with_timeout(self, func, timeout: int = CHECK_TIMEOUT) -> Any:
+    def _run_checks(self, checks: Dict[str, Callable[[], Dict[str, Any]]]) -> Dict[str, Dict[str, Any]]:
         """
-        Run a function with a timeout.
+        Run checks concurrently, each bounded by CHECK_TIMEOUT.
+        
+        Every check starts at once and shares one deadline, so the suite as a
+        whole also finishes within CHECK_TIMEOUT (and so within SUITE_TIMEOUT).
+        The deadline is enforced on the futures rather than with signal.alarm,
+        so this works from any thread. A check that overruns is reported as
+        timed out and left to finish in the background.
         
         Args:
-            func: Function to run
-            timeout: Timeout in seconds
+            checks: Check name -> check function, in report order
             
         Returns:
-            Function result
-            
-        Raises:
-            ValidationTimeoutError: If function times out
+            Dict: Check name -> check result, in the same order
         """
-        import signal
-        
-        def timeout_handler(signum, frame):
-            raise ValidationTimeoutError(f"Check timed out after {timeout}s")
+        started = time.monotonic()
+        deadline = started + CHECK_TIMEOUT
         
-        # Set timeout handler
-        old_handler = signal.signal(signal.SIGALRM, timeout_handler)
-        signal.alarm(timeout)
+        pool = ThreadPoolExecutor(max_workers=len(checks), thread_name_prefix="a0-validator")
+        futures = {name: pool.submit(func) for name, func in checks.items()}
+        results = {}
         
         try:
-            result = func()
-            signal.alarm(0)  # Cancel alarm
-            return result
-        except ValidationTimeoutError:
-            raise
+            for check_name, future in futures.items():
+                try:
+                    results[check_name] = future.result(timeout=max(0.0, deadline - time.monotonic()))
+                except FutureTimeoutError:
+                    results[check_name] = {
+                        "passed": False,
+                        "ms": int((time.monotonic() - started) * 1000),
+                        "error": f"Check timed out after {CHECK_TIMEOUT}s",
+                        "details": {}
+                    }
+                except ValidationTimeoutError as e:
+                    results[check_name] = {
+                        "passed": False,
+                        "ms": CHECK_TIMEOUT * 1000,
+                        "error": str(e),
+                        "details": {}
+                    }
+                except Exception as e:
+                    results[check_name] = {
+                        "passed": False,
+                        "ms": 0,
+                        "error": f"Unexpected error: {str(e)}",
+                        "details": {}
+                    }
         finally:
-            signal.signal(signal.SIGALRM, old_handler)
+            # Don't wait for overrunning checks; threads can't be interrupted
+            pool.shutdown(wait=False, cancel_futures=True)
+        
+        return results
     
     def run_check_integrity(self) -> Dict[str, Any]:
         """
@@ -646,22 +671,7 @@ class ArtifactValidator:
             raise ValidationError(f"Unknown check: {check_name}")
 
         # Run the check
-        try:
-            result = check_func()
-        except ValidationTimeoutError as e:
-            result = {
-                "passed": False,
-                "ms": CHECK_TIMEOUT * 1000,
-                "error": str(e),
-                "details": {}
-            }
-        except Exception as e:
-            result = {
-                "passed": False,
-                "ms": 0,
-                "error": f"Unexpected error: {str(e)}",
-                "details": {}
-            }
+        result = self._run_checks({check_name: check_func})[check_name]
 
         self.elapsed_ms = int((time.time() - self.start_time) * 1000)
 
@@ -716,37 +726,8 @@ class ArtifactValidator:
             "memory_initialization": self.run_check_memory
         }
         
-        results = {}
-        
-        for check_name, check_func in checks.items():
-            try:
-                # Check if we've exceeded suite timeout
-                if time.time() - self.start_time > SUITE_TIMEOUT:
-                    results[check_name] = {
-                        "passed": False,
-                        "ms": 0,
-                        "error": "Suite timeout exceeded",
-                        "details": {}
-                    }
-                    break
-                
-                # Run check
-                results[check_name] = check_func()
-                
-            except ValidationTimeoutError as e:
-                results[check_name] = {
-                    "passed": False,
-                    "ms": CHECK_TIMEOUT * 1000,
-                    "error": str(e),
-                    "details": {}
-                }
-            except Exception as e:
-                results[check_name] = {
-                    "passed": False,
-                    "ms": 0,
-                    "error": f"Unexpected error: {str(e)}",
-                    "details": {}
-                }
+        # Checks are independent; run them together under per-check deadlines
+        results = self._run_checks(checks)
         
         self.elapsed_ms = int((time.time() - self.start_time) * 1000)
         
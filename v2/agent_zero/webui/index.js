@@ -253,6 +253,9 @@ function setConnectionStatus(connected) {
 let lastLogVersion = 0;
 let lastLogGuid = "";
 let lastSpokenNo = 0;
+// Chats/tasks lists as of lastContextsVersion; poll only sends what changed since
+let lastContextsVersion = "";
+let sidebarEntries = new Map();
 
 export async function poll() {
   let updated = false;
@@ -266,6 +269,7 @@ export async function poll() {
       notifications_from: notificationStore.lastNotificationVersion || 0,
       context: context || null,
       timezone: timezone,
+      contexts_version: lastContextsVersion || null,
     });
 
     // Check if the response is valid
@@ -328,13 +332,14 @@ export async function poll() {
     // Update status icon state
     setConnectionStatus(true);
 
-    // Update chats list using store
-    let contexts = response.contexts || [];
-    chatsStore.applyContexts(contexts);
-
-    // Update tasks list using store
-    let tasks = response.tasks || [];
-    tasksStore.applyTasks(tasks);
+    // Update chats and tasks lists using stores, unless nothing changed
+    if (response.contexts_version !== lastContextsVersion) {
+      const { contexts, tasks } = mergeSidebarEntries(response);
+      chatsStore.applyContexts(contexts);
+      tasksStore.applyTasks(tasks);
+      lastContextsVersion = response.contexts_version || "";
+    }
+    const contexts = chatsStore.contexts;
 
     // Make sure the active context is properly selected in both lists
     if (context) {
@@ -389,6 +394,21 @@ export async function poll() {
 }
 globalThis.poll = poll;
 
+// Full lists replace the cache; deltas carry changed entries plus the ordered ids of all of them
+function mergeSidebarEntries(response) {
+  const changed = [...(response.contexts || []), ...(response.tasks || [])];
+  if (!response.contexts_delta) {
+    sidebarEntries = new Map(changed.map((entry) => [entry.id, entry]));
+    return { contexts: response.contexts || [], tasks: response.tasks || [] };
+  }
+  for (const entry of changed) sidebarEntries.set(entry.id, entry);
+  const pick = (ids) => (ids || []).map((id) => sidebarEntries.get(id)).filter(Boolean);
+  const contexts = pick(response.context_ids);
+  const tasks = pick(response.task_ids);
+  sidebarEntries = new Map([...contexts, ...tasks].map((entry) => [entry.id, entry]));
+  return { contexts, tasks };
+}
+
 function afterMessagesUpdate(logs) {
   if (localStorage.getItem("speech") == "true") {
     speakMessages(logs);
@@ -1,11 +1,21 @@
+import asyncio
+import json
+import logging
 import os
 import time
-from typing import List, Optional, Any, Dict
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional, Any, AsyncIterator, Callable, Dict
 
-from fastapi import FastAPI, HTTPException, APIRouter
+from fastapi import FastAPI, HTTPException, APIRouter, Header, Response
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 
+from v2.core import llm_api
 from v2.core.runtime import BillyRuntime
+from v2.core.sessions import Session, SessionRegistry
+
+logger = logging.getLogger(__name__)
 
 # Optional Agent Zero adapters
 from adapter_impl.agentzero_adapter import (
@@ -62,6 +72,47 @@ ROOT_PATH = os.getenv(
 
 runtime = BillyRuntime(config=None)
 
+# ----------------------------
+# Sessions + worker pool
+# ----------------------------
+# Clients pick a session with the X-Session-Id header or a session_id body
+# field; requests without one share the default session (and `runtime`).
+# Turns of one session run one at a time, different sessions in parallel on
+# a bounded pool of worker threads.
+SESSION_HEADER = "X-Session-Id"
+API_WORKERS = max(1, int(os.getenv("BILLY_API_WORKERS", "8")))
+MAX_SESSIONS = max(1, int(os.getenv("BILLY_MAX_SESSIONS", "256")))
+SESSION_IDLE_TIMEOUT_SECONDS = float(os.getenv("BILLY_SESSION_IDLE_TIMEOUT_SECONDS", "3600"))
+
+sessions = SessionRegistry(
+    runtime_factory=lambda: BillyRuntime(config=runtime.config),
+    default_runtime=runtime,
+    max_sessions=MAX_SESSIONS,
+    idle_timeout_seconds=SESSION_IDLE_TIMEOUT_SECONDS,
+)
+_runtime_pool = ThreadPoolExecutor(max_workers=API_WORKERS, thread_name_prefix="billy-runtime")
+
+
+def _resolve_session(body_session_id: Optional[str], header_session_id: Optional[str]) -> Session:
+    try:
+        return sessions.get(body_session_id or header_session_id)
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc))
+
+
+async def _run_in_session(session: Session, fn: Callable[..., Any], *args: Any) -> Any:
+    # Queue on the event loop so only turns that can run occupy a pool worker.
+    await session.acquire_turn()
+    loop = asyncio.get_running_loop()
+    try:
+        future = loop.run_in_executor(_runtime_pool, session.run, fn, *args)
+    except BaseException:
+        session.release_turn()
+        raise
+    # Released when the worker is done, even if this request is cancelled first.
+    future.add_done_callback(lambda _: session.release_turn())
+    return await asyncio.shield(future)
+
 # -----------------------------------------------------------------------------
 # Optional Agent Zero integration
 # -----------------------------------------------------------------------------
@@ -128,6 +179,7 @@ if ENABLE_AGENT_ZERO_INTEGRATION:
 # ----------------------------
 class AskRequest(BaseModel):
     prompt: str
+    session_id: Optional[str] = None
 
 
 @app.get("/health")
@@ -141,11 +193,14 @@ def health():
 
 
 @app.post("/ask")
-def ask(req: AskRequest):
-    result = runtime.run_turn(
-        user_input=req.prompt,
-        session_context={},
-    )
+async def ask(
+    req: AskRequest,
+    response: Response,
+    x_session_id: Optional[str] = Header(default=None),
+):
+    session = _resolve_session(req.session_id, x_session_id)
+    response.headers[SESSION_HEADER] = session.session_id
+    result = await _run_in_session(session, session.runtime.run_turn, req.prompt, {})
     return result
 
 
@@ -160,11 +215,14 @@ class ChatMessage(BaseModel):
 class ChatCompletionRequest(BaseModel):
     model: Optional[str] = "billy-v2"
     messages: List[ChatMessage]
+    stream: Optional[bool] = False
+    session_id: Optional[str] = None
 
 
 class CompletionRequest(BaseModel):
     model: Optional[str] = "billy-v2"
     prompt: str
+    session_id: Optional[str] = None
 
 
 @app.get("/v1/models")
@@ -181,20 +239,131 @@ def v1_models():
     }
 
 
-@app.post("/v1/chat/completions")
-def v1_chat_completions(req: ChatCompletionRequest):
-    prompt = next(
-        (m.content for m in reversed(req.messages) if m.role == "user"),
+def _last_user_prompt(messages: List[ChatMessage]) -> str:
+    return next(
+        (m.content for m in reversed(messages) if m.role == "user"),
         "",
     )
 
-    answer = runtime.ask(prompt)
+
+def _sse(payload: Dict[str, Any] | str) -> str:
+    data = payload if isinstance(payload, str) else json.dumps(payload)
+    return f"data: {data}\n\n"
+
+
+def _ask_with_usage(session: Session, prompt: str, on_delta=None) -> tuple:
+    with llm_api.track_usage() as usage:
+        answer = session.runtime.ask(prompt, on_delta=on_delta)
+    return answer, usage
+
+
+async def _stream_chat_completion(
+    prompt: str, model: str, session: Optional[Session] = None
+) -> AsyncIterator[str]:
+    """
+    Yields SSE chat.completion.chunk frames: the role, answer deltas as the
+    runtime produces them, the remainder of the final answer, then a usage
+    chunk and [DONE]. If the turn fails, or the final answer does not start
+    with the text already streamed, an error frame replaces the stop and
+    usage chunks.
+    """
+    completion_id = f"chatcmpl-{uuid.uuid4().hex}"
+    created = int(time.time())
+    loop = asyncio.get_running_loop()
+    events: "asyncio.Queue[tuple]" = asyncio.Queue()
+    session = session or sessions.default
+
+    def on_delta(delta: str) -> None:
+        loop.call_soon_threadsafe(events.put_nowait, ("delta", delta))
+
+    def chunk(delta: Dict[str, Any], finish_reason: Optional[str] = None) -> str:
+        return _sse(
+            {
+                "id": completion_id,
+                "object": "chat.completion.chunk",
+                "created": created,
+                "model": model,
+                "choices": [{"index": 0, "delta": delta, "finish_reason": finish_reason}],
+            }
+        )
+
+    # Deltas are queued by the worker before the turn completes, so "done"
+    # always follows the last of them.
+    turn = asyncio.ensure_future(_run_in_session(session, _ask_with_usage, session, prompt, on_delta))
+    turn.add_done_callback(lambda _: events.put_nowait(("done",)))
+    yield chunk({"role": "assistant", "content": ""})
+
+    streamed: List[str] = []
+    while True:
+        event = await events.get()
+        if event[0] == "delta":
+            streamed.append(event[1])
+            yield chunk({"content": event[1]})
+            continue
+        if turn.exception() is not None:
+            logger.warning("Streaming chat completion failed: %s", turn.exception())
+            yield _sse({"error": {"message": str(turn.exception()), "type": "server_error"}})
+            break
+
+        answer, usage = turn.result()
+        sent = "".join(streamed)
+        if not answer.startswith(sent):
+            # The client already holds text the final answer does not start
+            # with; appending to it cannot produce the answer, so fail the
+            # stream instead of ending it as a normal "stop".
+            logger.warning("Streamed text is not a prefix of the final answer.")
+            yield _sse(
+                {
+                    "error": {
+                        "message": "streamed text diverged from the final answer",
+                        "type": "server_error",
+                    }
+                }
+            )
+            break
+        rest = answer[len(sent):]
+        if rest:
+            yield chunk({"content": rest})
+        yield chunk({}, finish_reason="stop")
+        yield _sse(
+            {
+                "id": completion_id,
+                "object": "chat.completion.chunk",
+                "created": created,
+                "model": model,
+                "choices": [],
+                "usage": dict(usage),
+            }
+        )
+        break
+    yield _sse("[DONE]")
+
+
+@app.post("/v1/chat/completions")
+async def v1_chat_completions(
+    req: ChatCompletionRequest,
+    response: Response,
+    x_session_id: Optional[str] = Header(default=None),
+):
+    prompt = _last_user_prompt(req.messages)
+    model = req.model or "billy-v2"
+    session = _resolve_session(req.session_id, x_session_id)
+
+    if req.stream:
+        return StreamingResponse(
+            _stream_chat_completion(prompt, model, session),
+            media_type="text/event-stream",
+            headers={"Cache-Control": "no-cache", SESSION_HEADER: session.session_id},
+        )
+
+    response.headers[SESSION_HEADER] = session.session_id
+    answer, usage = await _run_in_session(session, _ask_with_usage, session, prompt)
 
     return {
         "id": "chatcmpl-billyv2",
         "object": "chat.completion",
         "created": int(time.time()),
-        "model": req.model or "billy-v2",
+        "model": model,
         "choices": [
             {
                 "index": 0,
@@ -205,20 +374,19 @@ def v1_chat_completions(req: ChatCompletionRequest):
                 "finish_reason": "stop",
             }
         ],
-        "usage": {
-            "prompt_tokens": 0,
-            "completion_tokens": 0,
-            "total_tokens": 0,
-        },
+        "usage": dict(usage),
     }
 
 
 @app.post("/v1/completions")
-def v1_completions(req: CompletionRequest):
-    result = runtime.run_turn(
-        user_input=req.prompt,
-        session_context={},
-    )
+async def v1_completions(
+    req: CompletionRequest,
+    response: Response,
+    x_session_id: Optional[str] = Header(default=None),
+):
+    session = _resolve_session(req.session_id, x_session_id)
+    response.headers[SESSION_HEADER] = session.session_id
+    result = await _run_in_session(session, session.runtime.run_turn, req.prompt, {})
 
     text: str = ""
     if isinstance(result, dict):
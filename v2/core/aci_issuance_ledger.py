@@ -4,12 +4,13 @@ from __future__ import annotations
 
 import hashlib
 import json
-from copy import deepcopy
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Dict, List, Sequence, Tuple
 
+from v2.core.jsonl_tail import JsonlTailIndex
+
 REVOCATION_CONTRACT_NAME = "revocation_record.v1"
 SUPERSESSION_CONTRACT_NAME = "supersession_record.v1"
 _RECORD_TYPE_ISSUANCE = "issuance"
@@ -129,30 +130,112 @@ class LedgerAppendResult:
     reason_code: str
 
 
+@dataclass
+class _LedgerIndex:
+    """In-process view of ledger.jsonl, kept current by JsonlTailIndex."""
+
+    record_count: int = 0
+    revocation_count: int = 0
+    supersession_count: int = 0
+    artifact_offsets: Dict[str, int] = field(default_factory=dict)
+    revocation_offsets: Dict[str, int] = field(default_factory=dict)
+    supersession_offsets: Dict[str, int] = field(default_factory=dict)
+    phase_offsets: Dict[int, List[int]] = field(default_factory=dict)
+    lineage_offsets: Dict[str, List[int]] = field(default_factory=dict)
+    transition_keys: set = field(default_factory=set)
+    revocations_by_artifact: Dict[str, List[str]] = field(default_factory=dict)
+    supersession_by_artifact: Dict[str, Tuple[str, str]] = field(default_factory=dict)
+
+
 class ACIIssuanceLedger:
-    """Append-only ledger for issued governance artifacts."""
+    """Append-only ledger for issued governance artifacts.
+
+    Lookups are served from an offset index that is built once and extended by
+    tail-reading the file whenever its signature moves past the indexed point.
+    """
 
     def __init__(self, ledger_path: str | Path):
         self.ledger_path = Path(ledger_path)
         self.ledger_path.parent.mkdir(parents=True, exist_ok=True)
         if not self.ledger_path.exists():
             self.ledger_path.write_text("", encoding="utf-8")
+        self._tail = JsonlTailIndex(self.ledger_path, _LedgerIndex, self._index_line)
 
-    def _read_records(self) -> List[Dict[str, Any]]:
-        records: List[Dict[str, Any]] = []
-        if not self.ledger_path.exists():
-            return records
-        for line in self.ledger_path.read_text(encoding="utf-8").splitlines():
-            payload = line.strip()
-            if not payload:
-                continue
-            try:
-                item = json.loads(payload)
-            except json.JSONDecodeError:
-                continue
-            if isinstance(item, dict):
-                records.append(item)
-        return records
+    def _refresh_index(self) -> _LedgerIndex:
+        try:
+            index = self._tail.get()
+        except OSError:
+            index = self._tail.index
+        return index if index is not None else _LedgerIndex()
+
+    def _index_line(self, index: _LedgerIndex, raw: bytes, offset: int, line_num: int) -> None:
+        payload = raw.strip()
+        if not payload:
+            return
+        try:
+            item = json.loads(payload.decode("utf-8"))
+        except (UnicodeDecodeError, json.JSONDecodeError):
+            return
+        if not isinstance(item, dict):
+            return
+        index.record_count += 1
+        transition_key = str(item.get("transition_key", ""))
+        if transition_key:
+            index.transition_keys.add(transition_key)
+        record_type = str(item.get("record_type", ""))
+        if record_type == _RECORD_TYPE_REVOCATION:
+            index.revocation_count += 1
+            index.revocation_offsets.setdefault(str(item.get("revocation_id", "")), offset)
+            index.revocations_by_artifact.setdefault(str(item.get("revoked_artifact_id", "")), []).append(
+                str(item.get("revocation_id", ""))
+            )
+        elif record_type == _RECORD_TYPE_SUPERSESSION:
+            index.supersession_count += 1
+            index.supersession_offsets.setdefault(str(item.get("supersession_id", "")), offset)
+            index.supersession_by_artifact.setdefault(
+                str(item.get("superseded_artifact_id", "")),
+                (str(item.get("supersession_id", "")), str(item.get("replacement_artifact_id", ""))),
+            )
+        if not self._is_issuance_record(item):
+            return
+        index.artifact_offsets.setdefault(str(item.get("artifact_id", "")), offset)
+        try:
+            phase_id = int(item.get("phase_id", -1))
+        except (TypeError, ValueError):
+            phase_id = -1
+        index.phase_offsets.setdefault(phase_id, []).append(offset)
+        refs = item.get("lineage_refs", [])
+        if isinstance(refs, list):
+            for ref in dict.fromkeys(x for x in refs if isinstance(x, str)):
+                index.lineage_offsets.setdefault(ref, []).append(offset)
+
+    def _read_record_at(self, offset: int) -> Dict[str, Any] | None:
+        try:
+            with self.ledger_path.open("rb") as handle:
+                handle.seek(offset)
+                raw = handle.readline()
+            item = json.loads(raw.decode("utf-8"))
+        except (OSError, UnicodeDecodeError, json.JSONDecodeError):
+            return None
+        return item if isinstance(item, dict) else None
+
+    def _read_records_at(self, offsets: Sequence[int]) -> List[Dict[str, Any]]:
+        out: List[Dict[str, Any]] = []
+        if not offsets:
+            return out
+        try:
+            with self.ledger_path.open("rb") as handle:
+                for offset in offsets:
+                    handle.seek(offset)
+                    try:
+                        item = json.loads(handle.readline().decode("utf-8"))
+                    except (UnicodeDecodeError, json.JSONDecodeError):
+                        continue
+                    if isinstance(item, dict):
+                        out.append(item)
+        except OSError:
+            return []
+        return out
 
     def _append_record(self, record: Dict[str, Any]) -> LedgerAppendResult:
         try:
@@ -161,83 +244,54 @@ class ACIIssuanceLedger:
                 handle.write("\n")
         except OSError:
             return LedgerAppendResult(ok=False, record=None, reason_code="ISSUANCE_LEDGER_APPEND_FAILED")
+        self._refresh_index()
         return LedgerAppendResult(ok=True, record=record, reason_code="ISSUED")
 
-    def _next_artifact_id(self, phase_id: int, records: Sequence[Dict[str, Any]]) -> str:
-        return f"artifact-p{int(phase_id):02d}-{len(records) + 1:08d}"
+    def _next_artifact_id(self, phase_id: int) -> str:
+        return f"artifact-p{int(phase_id):02d}-{self._refresh_index().record_count + 1:08d}"
 
-    def _next_revocation_id(self, records: Sequence[Dict[str, Any]]) -> str:
-        count = sum(1 for item in records if str(item.get("record_type", "")) == _RECORD_TYPE_REVOCATION)
-        return f"revocation-{count + 1:08d}"
+    def _next_revocation_id(self) -> str:
+        return f"revocation-{self._refresh_index().revocation_count + 1:08d}"
 
-    def _next_supersession_id(self, records: Sequence[Dict[str, Any]]) -> str:
-        count = sum(1 for item in records if str(item.get("record_type", "")) == _RECORD_TYPE_SUPERSESSION)
-        return f"supersession-{count + 1:08d}"
+    def _next_supersession_id(self) -> str:
+        return f"supersession-{self._refresh_index().supersession_count + 1:08d}"
 
     def _is_issuance_record(self, record: Dict[str, Any]) -> bool:
         record_type = str(record.get("record_type", _RECORD_TYPE_ISSUANCE))
         return record_type == _RECORD_TYPE_ISSUANCE and bool(str(record.get("artifact_id", "")).strip())
 
     def lookup_by_artifact_id(self, artifact_id: str) -> Dict[str, Any] | None:
-        target = str(artifact_id)
-        for item in self._read_records():
-            if not self._is_issuance_record(item):
-                continue
-            if str(item.get("artifact_id", "")) == target:
-                return deepcopy(item)
-        return None
+        offset = self._refresh_index().artifact_offsets.get(str(artifact_id))
+        if offset is None:
+            return None
+        return self._read_record_at(offset)
 
     def lookup_by_revocation_id(self, revocation_id: str) -> Dict[str, Any] | None:
-        target = str(revocation_id)
-        for item in self._read_records():
-            if str(item.get("record_type", "")) != _RECORD_TYPE_REVOCATION:
-                continue
-            if str(item.get("revocation_id", "")) == target:
-                return deepcopy(item)
-        return None
+        offset = self._refresh_index().revocation_offsets.get(str(revocation_id))
+        if offset is None:
+            return None
+        return self._read_record_at(offset)
 
     def lookup_by_supersession_id(self, supersession_id: str) -> Dict[str, Any] | None:
-        target = str(supersession_id)
-        for item in self._read_records():
-            if str(item.get("record_type", "")) != _RECORD_TYPE_SUPERSESSION:
-                continue
-            if str(item.get("supersession_id", "")) == target:
-                return deepcopy(item)
-        return None
+        offset = self._refresh_index().supersession_offsets.get(str(supersession_id))
+        if offset is None:
+            return None
+        return self._read_record_at(offset)
 
     def lookup_by_phase_id(self, phase_id: int) -> List[Dict[str, Any]]:
-        target = int(phase_id)
-        return [
-            deepcopy(item)
-            for item in self._read_records()
-            if self._is_issuance_record(item) and int(item.get("phase_id", -1)) == target
-        ]
+        index = self._refresh_index()
+        return self._read_records_at(list(index.phase_offsets.get(int(phase_id), [])))
 
     def lookup_by_lineage_reference(self, artifact_id: str) -> List[Dict[str, Any]]:
-        target = str(artifact_id)
-        out: List[Dict[str, Any]] = []
-        for item in self._read_records():
-            if not self._is_issuance_record(item):
-                continue
-            refs = [str(x) for x in item.get("lineage_refs", []) if isinstance(x, str)]
-            if target in refs:
-                out.append(deepcopy(item))
-        return out
+        index = self._refresh_index()
+        return self._read_records_at(list(index.lineage_offsets.get(str(artifact_id), [])))
 
     def get_artifact_status(self, artifact_id: str) -> Dict[str, Any]:
         target = str(artifact_id)
-        revocation_ids: List[str] = []
-        supersession_id = ""
-        replacement_artifact_id = ""
-        for item in self._read_records():
-            record_type = str(item.get("record_type", ""))
-            if record_type == _RECORD_TYPE_REVOCATION:
-                if str(item.get("revoked_artifact_id", "")) == target:
-                    revocation_ids.append(str(item.get("revocation_id", "")))
-            elif record_type == _RECORD_TYPE_SUPERSESSION:
-                if str(item.get("superseded_artifact_id", "")) == target and not supersession_id:
-                    supersession_id = str(item.get("supersession_id", ""))
-                    replacement_artifact_id = str(item.get("replacement_artifact_id", ""))
+        index = self._refresh_index()
+        with self._tail.lock:
+            revocation_ids = list(index.revocations_by_artifact.get(target, []))
+            supersession_id, replacement_artifact_id = index.supersession_by_artifact.get(target, ("", ""))
         return {
             "revoked": bool(revocation_ids) or bool(supersession_id),
             "revocation_ids": [item for item in revocation_ids if item],
@@ -254,8 +308,7 @@ class ACIIssuanceLedger:
         return replacement or None
 
     def has_transition_key(self, transition_key: str) -> bool:
-        target = str(transition_key)
-        return any(str(item.get("transition_key", "")) == target for item in self._read_records())
+        return str(transition_key) in self._refresh_index().transition_keys
 
     def validate_lineage(
         self,
@@ -298,16 +351,14 @@ class ACIIssuanceLedger:
         if not valid_lineage:
             return LedgerAppendResult(ok=False, record=None, reason_code=lineage_code)
 
-        records = self._read_records()
         transition_key = _compute_transition_key(
             phase_id=phase_id,
             contract_name=contract_name,
             environment_id=environment_id,
             lineage_refs=lineage_refs,
         )
-        for item in records:
-            if str(item.get("transition_key", "")) == transition_key:
-                return LedgerAppendResult(ok=False, record=None, reason_code="ISSUANCE_DUPLICATE_FOR_LINEAGE")
+        if self.has_transition_key(transition_key):
+            return LedgerAppendResult(ok=False, record=None, reason_code="ISSUANCE_DUPLICATE_FOR_LINEAGE")
 
         composed = compose_issued_artifact(
             phase_id=phase_id,
@@ -320,7 +371,7 @@ class ACIIssuanceLedger:
 
         record = {
             "record_type": _RECORD_TYPE_ISSUANCE,
-            "artifact_id": self._next_artifact_id(phase_id, records),
+            "artifact_id": self._next_artifact_id(phase_id),
             "phase_id": int(phase_id),
             "contract_name": str(contract_name),
             "issuer_identity_id": str(issuer_identity_id),
@@ -360,7 +411,6 @@ class ACIIssuanceLedger:
         if self.is_artifact_revoked(target_id):
             return LedgerAppendResult(ok=False, record=None, reason_code="REVOCATION_ALREADY_REVOKED")
 
-        records = self._read_records()
         transition_key = _digest(
             {
                 "record_type": _RECORD_TYPE_REVOCATION,
@@ -393,7 +443,7 @@ class ACIIssuanceLedger:
             "record_type": _RECORD_TYPE_REVOCATION,
             "phase_id": int(target.get("phase_id", 0)),
             "contract_name": REVOCATION_CONTRACT_NAME,
-            "revocation_id": self._next_revocation_id(records),
+            "revocation_id": self._next_revocation_id(),
             "revoked_artifact_id": target_id,
             "revocation_reason": reason,
             "revoked_at": now,
@@ -445,7 +495,6 @@ class ACIIssuanceLedger:
         if self.get_supersession_replacement(old_id) is not None:
             return LedgerAppendResult(ok=False, record=None, reason_code="SUPERSESSION_ALREADY_EXISTS")
 
-        records = self._read_records()
         transition_key = _digest(
             {
                 "record_type": _RECORD_TYPE_SUPERSESSION,
@@ -479,7 +528,7 @@ class ACIIssuanceLedger:
             "record_type": _RECORD_TYPE_SUPERSESSION,
             "phase_id": old_phase,
             "contract_name": SUPERSESSION_CONTRACT_NAME,
-            "supersession_id": self._next_supersession_id(records),
+            "supersession_id": self._next_supersession_id(),
             "superseded_artifact_id": old_id,
             "replacement_artifact_id": new_id,
             "superseded_at": now,
@@ -1,13 +1,16 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import List, Optional, Union
+from typing import Dict, List, Optional, Tuple, Union
+import heapq
 import json
+import threading
 import uuid
 
 from v2.core.guardrails.invariants import assert_trace_id
+from v2.core.jsonl_tail import JsonlTailIndex
 from v2.core import evidence as evidence_store
 
 _V2_ROOT = Path(__file__).resolve().parents[1]
@@ -139,47 +142,38 @@ def get_causal_trace(
     task_id: Optional[str] = None,
     plan_id: Optional[str] = None,
 ) -> List[Union[CausalNode, CausalEdge]]:
-    path = _require_path(allow_missing=True)
-    if not path or not path.exists():
-        return []
-    nodes: List[CausalNode] = []
-    edges: List[CausalEdge] = []
-    for record in _iter_records(path):
-        if isinstance(record, CausalNode):
-            nodes.append(record)
-        else:
-            edges.append(record)
-
-    if not task_id and not plan_id:
-        return nodes + edges
-
-    filtered_nodes = [
-        node
-        for node in nodes
-        if (task_id and node.related_task_id == task_id)
-        or (plan_id and node.related_plan_id == plan_id)
-    ]
-    node_ids = {node.node_id for node in filtered_nodes}
-    filtered_edges = [edge for edge in edges if edge.from_node_id in node_ids or edge.to_node_id in node_ids]
-
-    related_node_ids = set(node_ids)
-    for edge in filtered_edges:
-        related_node_ids.add(edge.from_node_id)
-        related_node_ids.add(edge.to_node_id)
-
-    expanded_nodes = [node for node in nodes if node.node_id in related_node_ids]
-    return expanded_nodes + filtered_edges
+    tail = _trace_index(_require_path(allow_missing=True))
+    with tail.lock:
+        index = tail.get()
+        if index is None:
+            return []
+        if not task_id and not plan_id:
+            return list(index.nodes) + list(index.edges)
+
+        node_ids: set[str] = set()
+        if task_id:
+            node_ids.update(index.node_ids_by_task.get(task_id, ()))
+        if plan_id:
+            node_ids.update(index.node_ids_by_plan.get(plan_id, ()))
+        edge_positions = sorted({pos for node_id in node_ids for pos in index.edges_by_node.get(node_id, ())})
+        filtered_edges = [index.edges[pos] for pos in edge_positions]
+
+        related_node_ids = set(node_ids)
+        for edge in filtered_edges:
+            related_node_ids.add(edge.from_node_id)
+            related_node_ids.add(edge.to_node_id)
+
+        node_positions = sorted(
+            pos for node_id in related_node_ids for pos in index.node_positions.get(node_id, ())
+        )
+        return [index.nodes[pos] for pos in node_positions] + filtered_edges
 
 
 def find_latest_node_id(node_type: str, description: str) -> Optional[str]:
-    path = _require_path(allow_missing=True)
-    if not path or not path.exists():
-        return None
-    latest: Optional[CausalNode] = None
-    for record in _iter_records(path):
-        if isinstance(record, CausalNode) and record.node_type == node_type and record.description == description:
-            if not latest or record.timestamp > latest.timestamp:
-                latest = record
+    tail = _trace_index(_require_path(allow_missing=True))
+    with tail.lock:
+        index = tail.get()
+        latest = index.latest_nodes.get((node_type, description)) if index else None
     return latest.node_id if latest else None
 
 
@@ -207,32 +201,49 @@ def explain_causal_chain(task_id: str) -> Optional[List[str]]:
     for node in nodes:
         if node.node_type != "EVIDENCE" and inbound[node.node_id] == 0:
             return None
-    # Topological order for causal chain, deterministic by timestamp then id.
-    graph = {node.node_id: [] for node in nodes}
-    indegree = {node.node_id: 0 for node in nodes}
+    ordered = _topological_order(nodes, edges)
+    if ordered is None:
+        return None
+    return [node.description for node in ordered]
+
+
+def _topological_order(nodes: List[CausalNode], edges: List[CausalEdge]) -> Optional[List[CausalNode]]:
+    """
+    Kahn's algorithm, deterministic by (timestamp, node_id) among ready nodes.
+
+    The sequence number keeps ties in the order nodes became ready, which is
+    what the stable re-sort of a list queue produced. Returns None on a cycle.
+    """
+    by_id: dict[str, CausalNode] = {}
+    for node in nodes:
+        by_id.setdefault(node.node_id, node)
+    graph: dict[str, List[str]] = {node_id: [] for node_id in by_id}
+    indegree = {node_id: 0 for node_id in by_id}
     for edge in edges:
         if edge.from_node_id in graph and edge.to_node_id in graph:
             graph[edge.from_node_id].append(edge.to_node_id)
             indegree[edge.to_node_id] += 1
 
-    queue = sorted(
-        [node for node in nodes if indegree[node.node_id] == 0],
-        key=lambda n: (n.timestamp, n.node_id),
-    )
+    queue: List[tuple] = []
+    for seq, node in enumerate(nodes):
+        if indegree[node.node_id] == 0:
+            queue.append((node.timestamp, node.node_id, seq, node))
+    heapq.heapify(queue)
+    seq = len(nodes)
     ordered: List[CausalNode] = []
     while queue:
-        current = queue.pop(0)
+        current = heapq.heappop(queue)[3]
         ordered.append(current)
         for neighbor in graph[current.node_id]:
             indegree[neighbor] -= 1
             if indegree[neighbor] == 0:
-                next_node = next(n for n in nodes if n.node_id == neighbor)
-                queue.append(next_node)
-                queue.sort(key=lambda n: (n.timestamp, n.node_id))
+                next_node = by_id[neighbor]
+                heapq.heappush(queue, (next_node.timestamp, next_node.node_id, seq, next_node))
+                seq += 1
 
     if len(ordered) != len(nodes):
         return None
-    return [node.description for node in ordered]
+    return ordered
 
 
 def _trace_path(trace_id: str) -> Path:
@@ -256,22 +267,76 @@ def _append_line(path: Path, payload: dict) -> None:
         handle.write(line + "\n")
 
 
-def _iter_records(path: Path):
-    with path.open("r", encoding="utf-8") as handle:
-        for line_num, line in enumerate(handle, start=1):
-            stripped = line.strip()
-            if not stripped:
-                continue
-            try:
-                data = json.loads(stripped)
-            except json.JSONDecodeError as exc:
-                raise ValueError(f"Invalid causal record at line {line_num}.") from exc
-            if data.get("record_type") == "node":
-                yield CausalNode.from_dict(data)
-            elif data.get("record_type") == "edge":
-                yield CausalEdge.from_dict(data)
-            else:
-                raise ValueError(f"Invalid causal record at line {line_num}.")
+@dataclass
+class _TraceIndex:
+    """
+    Adjacency index for one causal trace file, kept current by JsonlTailIndex.
+
+    nodes and edges keep file order; the lookup maps hold positions into
+    them (or node ids), so a task's chain is gathered without scanning the
+    rest of the trace.
+    """
+
+    nodes: List[CausalNode] = field(default_factory=list)
+    edges: List[CausalEdge] = field(default_factory=list)
+    node_positions: Dict[str, List[int]] = field(default_factory=dict)
+    node_ids_by_task: Dict[str, set] = field(default_factory=dict)
+    node_ids_by_plan: Dict[str, set] = field(default_factory=dict)
+    edges_by_node: Dict[str, List[int]] = field(default_factory=dict)
+    latest_nodes: Dict[Tuple[str, str], CausalNode] = field(default_factory=dict)
+
+
+_INDEX_LOCK = threading.Lock()
+_TRACE_INDEXES: Dict[Path, JsonlTailIndex[_TraceIndex]] = {}
+
+
+def _trace_index(path: Path) -> JsonlTailIndex[_TraceIndex]:
+    with _INDEX_LOCK:
+        tail = _TRACE_INDEXES.get(path)
+        if tail is None:
+            tail = _TRACE_INDEXES[path] = JsonlTailIndex(path, _TraceIndex, _index_line)
+        return tail
+
+
+def _index_line(index: _TraceIndex, raw: bytes, offset: int, line_num: int) -> None:
+    record = _parse_record(raw, line_num)
+    if record is not None:
+        _index_record(index, record)
+
+
+def _index_record(index: _TraceIndex, record: Union[CausalNode, CausalEdge]) -> None:
+    if isinstance(record, CausalEdge):
+        position = len(index.edges)
+        index.edges.append(record)
+        index.edges_by_node.setdefault(record.from_node_id, []).append(position)
+        if record.to_node_id != record.from_node_id:
+            index.edges_by_node.setdefault(record.to_node_id, []).append(position)
+        return
+    index.node_positions.setdefault(record.node_id, []).append(len(index.nodes))
+    index.nodes.append(record)
+    if record.related_task_id:
+        index.node_ids_by_task.setdefault(record.related_task_id, set()).add(record.node_id)
+    if record.related_plan_id:
+        index.node_ids_by_plan.setdefault(record.related_plan_id, set()).add(record.node_id)
+    key = (record.node_type, record.description)
+    latest = index.latest_nodes.get(key)
+    if not latest or record.timestamp > latest.timestamp:
+        index.latest_nodes[key] = record
+
+
+def _parse_record(raw: bytes, line_num: int) -> Optional[Union[CausalNode, CausalEdge]]:
+    stripped = raw.strip()
+    if not stripped:
+        return None
+    try:
+        data = json.loads(stripped)
+    except json.JSONDecodeError as exc:
+        raise ValueError(f"Invalid causal record at line {line_num}.") from exc
+    if data.get("record_type") == "node":
+        return CausalNode.from_dict(data)
+    if data.get("record_type") == "edge":
+        return CausalEdge.from_dict(data)
+    raise ValueError(f"Invalid causal record at line {line_num}.")
 
 
 def _validate_node(node: CausalNode) -> None:
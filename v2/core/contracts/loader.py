@@ -1,36 +1,86 @@
+import copy
+import threading
+
 import yaml
-from jsonschema import validate, ValidationError
+from jsonschema import validators, ValidationError
+from jsonschema.exceptions import best_match
 from pathlib import Path
 
 
 BASE_DIR = Path(__file__).resolve().parents[2]
 CONTRACTS_DIR = BASE_DIR / "docs" / "contracts" / "schemas"
 
+# Parsed schemas and compiled validators, keyed by (path, mtime_ns) so an
+# edited schema file is picked up without a process restart.
+_SCHEMA_CACHE: dict = {}
+_VALIDATOR_CACHE: dict = {}
+_CACHE_LOCK = threading.Lock()
+
 
 class ContractViolation(Exception):
     pass
 
 
-def load_schema(name: str) -> dict:
+def _schema_key(name: str) -> tuple:
     schema_path = CONTRACTS_DIR / name
-    if not schema_path.exists():
+    try:
+        mtime_ns = schema_path.stat().st_mtime_ns
+    except OSError:
         raise ContractViolation(f"Missing required contract schema: {schema_path}")
+    return (str(schema_path), mtime_ns)
+
+
+def _load_cached_schema(key: tuple) -> dict:
+    with _CACHE_LOCK:
+        schema = _SCHEMA_CACHE.get(key)
+    if schema is not None:
+        return schema
+    with open(key[0], "r") as f:
+        schema = yaml.safe_load(f)
+    with _CACHE_LOCK:
+        for stale in [k for k in _SCHEMA_CACHE if k[0] == key[0]]:
+            _SCHEMA_CACHE.pop(stale, None)
+            _VALIDATOR_CACHE.pop(stale, None)
+        _SCHEMA_CACHE[key] = schema
+    return schema
+
+
+def load_schema(name: str) -> dict:
+    return copy.deepcopy(_load_cached_schema(_schema_key(name)))
+
+
+def get_validator(name: str):
+    key = _schema_key(name)
+    with _CACHE_LOCK:
+        validator = _VALIDATOR_CACHE.get(key)
+    if validator is not None:
+        return validator
+    schema = _load_cached_schema(key)
+    cls = validators.validator_for(schema)
+    cls.check_schema(schema)
+    validator = cls(schema)
+    with _CACHE_LOCK:
+        _VALIDATOR_CACHE[key] = validator
+    return validator
+
 
-    with open(schema_path, "r") as f:
-        return yaml.safe_load(f)
+def clear_schema_cache() -> None:
+    with _CACHE_LOCK:
+        _SCHEMA_CACHE.clear()
+        _VALIDATOR_CACHE.clear()
+
+
+def _first_error(name: str, instance: dict) -> ValidationError | None:
+    return best_match(get_validator(name).iter_errors(instance))
 
 
 def validate_tool_spec(tool_spec: dict) -> None:
-    schema = load_schema("tool-spec.schema.yaml")
-    try:
-        validate(instance=tool_spec, schema=schema)
-    except ValidationError as e:
-        raise ContractViolation(f"ToolSpec validation failed: {e.message}")
+    error = _first_error("tool-spec.schema.yaml", tool_spec)
+    if error is not None:
+        raise ContractViolation(f"ToolSpec validation failed: {error.message}")
 
 
 def validate_trace_event(event: dict) -> None:
-    schema = load_schema("trace-event.schema.yaml")
-    try:
-        validate(instance=event, schema=schema)
-    except ValidationError as e:
-        raise ContractViolation(f"TraceEvent validation failed: {e.message}")
+    error = _first_error("trace-event.schema.yaml", event)
+    if error is not None:
+        raise ContractViolation(f"TraceEvent validation failed: {error.message}")
@@ -1,15 +1,18 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime, timezone, timedelta
 from pathlib import Path
-from typing import List, Literal, Optional
+from typing import Dict, List, Literal, Optional, Tuple
 import hashlib
+import heapq
 import json
+import threading
 import uuid
 
 from v2.core.contracts.loader import ContractViolation
 from v2.core.guardrails.invariants import assert_trace_id
+from v2.core.jsonl_tail import JsonlTailIndex
 
 _V2_ROOT = Path(__file__).resolve().parents[1]
 
@@ -159,10 +162,12 @@ def has_evidence(claim: str) -> bool:
 def list_evidence(claim: str) -> List[Evidence]:
     if not claim:
         raise ValueError("Claim is required.")
-    path = _require_path(allow_missing=True)
-    if not path or not path.exists():
-        return []
-    return [record for record in _iter_records(path) if record.claim == claim]
+    tail = _claim_index(_require_path(allow_missing=True))
+    with tail.lock:
+        index = tail.get()
+        if index is None:
+            return []
+        return list(index.records.get(claim, ()))
 
 
 def assert_claim_known(claim: str) -> None:
@@ -228,21 +233,6 @@ def _append_line(path: Path, payload: dict) -> None:
         handle.write(line + "\n")
 
 
-def _iter_records(path: Path):
-    with path.open("r", encoding="utf-8") as handle:
-        for line_num, line in enumerate(handle, start=1):
-            stripped = line.strip()
-            if not stripped:
-                continue
-            try:
-                data = json.loads(stripped)
-            except json.JSONDecodeError as exc:
-                raise ValueError(f"Invalid evidence record at line {line_num}.") from exc
-            if not isinstance(data, dict):
-                raise ValueError(f"Invalid evidence record at line {line_num}.")
-            yield Evidence.from_dict(data)
-
-
 def _hash_content(raw_content: str) -> str:
     return hashlib.sha256(raw_content.encode("utf-8")).hexdigest()
 
@@ -298,19 +288,23 @@ def _apply_expiry(evidence: Evidence) -> Evidence:
 
 
 def _evaluate_claim_records(claim: str, now: datetime) -> tuple[str, List[Evidence]]:
-    records = list_evidence(claim)
-    if not records:
-        return "missing", []
-    expected_scope = _scope_from_claim(claim)
-    valid_records: List[Evidence] = []
-    for record in records:
-        scope = record.scope or _scope_from_claim(record.claim)
-        if scope != expected_scope:
+    tail = _claim_index(_require_path(allow_missing=True))
+    with tail.lock:
+        index = tail.get()
+        if index is None or not index.records.get(claim):
+            return "missing", []
+        if index.scope_mismatches.get(claim):
             return "scope", []
-        record_with_expiry = _apply_expiry(record) if record.expires_at is None else record
-        if not is_evidence_valid(record_with_expiry, now):
-            continue
-        valid_records.append(record_with_expiry)
+        if now >= index.expired_through:
+            _expire_through(index, now)
+            valid_records = list(index.live.get(claim, ()))
+        else:
+            # Queried behind the expiry watermark: the dropped entries may
+            # still be valid at this instant, so judge every record.
+            valid_records = [
+                record for record in map(_with_expiry, index.records[claim])
+                if is_evidence_valid(record, now)
+            ]
     if not valid_records:
         return "stale", []
     hashes = {record.content_hash for record in valid_records}
@@ -319,6 +313,85 @@ def _evaluate_claim_records(claim: str, now: datetime) -> tuple[str, List[Eviden
     return "ok", valid_records
 
 
+@dataclass
+class _ClaimIndex:
+    """
+    Claim -> records for one evidence file, kept current by JsonlTailIndex.
+
+    records keeps every record in file order (what list_evidence returns);
+    live keeps the not-yet-expired ones, with expiry applied. The expiry heap
+    holds (expires_at, seq, claim, evidence_id) so that advancing the clock
+    drops every decayed entry at once instead of re-checking TTLs per query.
+    """
+
+    seq: int = 0
+    records: Dict[str, List[Evidence]] = field(default_factory=dict)
+    live: Dict[str, List[Evidence]] = field(default_factory=dict)
+    scope_mismatches: Dict[str, int] = field(default_factory=dict)
+    expiry_heap: List[Tuple[datetime, int, str, str]] = field(default_factory=list)
+    expired_through: datetime = datetime.min.replace(tzinfo=timezone.utc)
+
+
+_INDEX_LOCK = threading.Lock()
+_CLAIM_INDEXES: Dict[Path, JsonlTailIndex[_ClaimIndex]] = {}
+
+
+def _claim_index(path: Path) -> JsonlTailIndex[_ClaimIndex]:
+    with _INDEX_LOCK:
+        tail = _CLAIM_INDEXES.get(path)
+        if tail is None:
+            tail = _CLAIM_INDEXES[path] = JsonlTailIndex(path, _ClaimIndex, _index_line)
+        return tail
+
+
+def _index_line(index: _ClaimIndex, raw: bytes, offset: int, line_num: int) -> None:
+    stripped = raw.strip()
+    if not stripped:
+        return
+    try:
+        data = json.loads(stripped)
+    except json.JSONDecodeError as exc:
+        raise ValueError(f"Invalid evidence record at line {line_num}.") from exc
+    if not isinstance(data, dict):
+        raise ValueError(f"Invalid evidence record at line {line_num}.")
+    _index_record(index, Evidence.from_dict(data))
+
+
+def _index_record(index: _ClaimIndex, record: Evidence) -> None:
+    claim = record.claim
+    index.records.setdefault(claim, []).append(record)
+    if (record.scope or _scope_from_claim(claim)) != _scope_from_claim(claim):
+        index.scope_mismatches[claim] = index.scope_mismatches.get(claim, 0) + 1
+    record_with_expiry = _with_expiry(record)
+    if record_with_expiry.expires_at < index.expired_through:
+        return
+    index.live.setdefault(claim, []).append(record_with_expiry)
+    index.seq += 1
+    heapq.heappush(
+        index.expiry_heap,
+        (record_with_expiry.expires_at, index.seq, claim, record_with_expiry.evidence_id),
+    )
+
+
+def _expire_through(index: _ClaimIndex, now: datetime) -> None:
+    heap = index.expiry_heap
+    expired: Dict[str, set] = {}
+    while heap and heap[0][0] < now:
+        _, _, claim, evidence_id = heapq.heappop(heap)
+        expired.setdefault(claim, set()).add(evidence_id)
+    for claim, evidence_ids in expired.items():
+        remaining = [record for record in index.live[claim] if record.evidence_id not in evidence_ids]
+        if remaining:
+            index.live[claim] = remaining
+        else:
+            del index.live[claim]
+    index.expired_through = now
+
+
+def _with_expiry(record: Evidence) -> Evidence:
+    return _apply_expiry(record) if record.expires_at is None else record
+
+
 def _now() -> datetime:
     return datetime.now(timezone.utc)
 
@@ -1,7 +1,10 @@
 import json
+import threading
 from pathlib import Path
 from datetime import datetime
 
+from v2.core.jsonl_tail import JsonlTailIndex
+
 _V2_ROOT = Path(__file__).resolve().parents[2]
 
 
@@ -14,6 +17,8 @@ class ExecutionJournal:
         self.base_dir = Path(base_dir) if base_dir is not None else (_V2_ROOT / "var" / "executions")
         self.base_dir.mkdir(parents=True, exist_ok=True)
         self.records_path = self.base_dir / "journal.jsonl"
+        self._lock = threading.Lock()
+        self._resolutions: JsonlTailIndex[dict[str, list[dict]]] | None = None
 
     def append(self, record: dict) -> None:
         self.records_path.parent.mkdir(parents=True, exist_ok=True)
@@ -21,6 +26,24 @@ class ExecutionJournal:
             f.write(json.dumps(record))
             f.write("\n")
 
+    def resolution_records(self, task_id: str) -> list[dict]:
+        """
+        Terminal resolution payloads for task_id, in journal order.
+        """
+        tail = self._resolution_index()
+        with tail.lock:
+            resolutions = tail.get()
+            if resolutions is None:
+                return []
+            return [dict(payload) for payload in resolutions.get(task_id, [])]
+
+    def _resolution_index(self) -> JsonlTailIndex[dict[str, list[dict]]]:
+        # records_path may be pointed elsewhere after construction
+        with self._lock:
+            if self._resolutions is None or self._resolutions.path != self.records_path:
+                self._resolutions = JsonlTailIndex(self.records_path, dict, _index_resolution_line)
+            return self._resolutions
+
     def build_resolution_record(
         self,
         trace_id: str,
@@ -99,3 +122,18 @@ class ExecutionJournal:
                 "timestamp": datetime.utcnow().isoformat() + "Z",
             }
         }
+
+
+def _index_resolution_line(resolutions: dict[str, list[dict]], raw: bytes, offset: int, line_num: int) -> None:
+    if not raw.strip():
+        return
+    try:
+        record = json.loads(raw)
+    except Exception:
+        return
+    if not isinstance(record, dict):
+        return
+    payload = record.get("resolution")
+    if not payload or payload.get("terminal") is not True:
+        return
+    resolutions.setdefault(payload.get("task_id"), []).append(payload)
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from typing import Any, Dict, List, Optional, Tuple
@@ -17,6 +18,7 @@ from v2.core.evidence import record_evidence
 ALLOWED_SCOPES = {"host", "services", "containers", "filesystem", "network"}
 DEFAULT_SCOPE = ["host", "services", "containers", "filesystem", "network"]
 DEFAULT_TTL_SECONDS = 300
+COMMAND_TIMEOUT_SECONDS = 3
 READONLY_COMMANDS = {
     "uptime",
     "systemctl",
@@ -72,26 +74,23 @@ def collect_environment_snapshot(scope: List[str]) -> EnvironmentSnapshot:
         collected_at=datetime.now(timezone.utc),
     )
 
-    if "host" in scope:
-        host = _probe_host()
-        snapshot.host = host
-        _record_section_evidence("host", host)
-    if "services" in scope:
-        services = _probe_services()
-        snapshot.services = services
-        _record_section_evidence("services", services)
-    if "containers" in scope:
-        containers = _probe_containers()
-        snapshot.containers = containers
-        _record_section_evidence("containers", containers)
-    if "filesystem" in scope:
-        filesystem = _probe_filesystem()
-        snapshot.filesystem = filesystem
-        _record_section_evidence("filesystem", filesystem)
-    if "network" in scope:
-        network = _probe_network()
-        snapshot.network = network
-        _record_section_evidence("network", network)
+    # Probes are read-only and independent, so they run side by side; results
+    # are consumed in section order, so the snapshot, the evidence log and
+    # which IntrospectionError surfaces are the same as probing one by one.
+    probes = {
+        "host": _probe_host,
+        "services": _probe_services,
+        "containers": _probe_containers,
+        "filesystem": _probe_filesystem,
+        "network": _probe_network,
+    }
+    sections = [section for section in DEFAULT_SCOPE if section in scope]
+    with ThreadPoolExecutor(max_workers=len(sections), thread_name_prefix="introspection") as pool:
+        futures = [(section, pool.submit(probes[section])) for section in sections]
+        for section, future in futures:
+            data = future.result()
+            setattr(snapshot, section, data)
+            _record_section_evidence(section, data)
 
     return snapshot
 
@@ -108,11 +107,11 @@ def _probe_host() -> Dict[str, Any]:
 
 
 def _probe_services() -> Dict[str, Any]:
-    systemd_ok, systemd_out = _run_command(
-        ["systemctl", "list-units", "--type=service", "--all", "--no-pager", "--no-legend"]
+    (systemd_ok, systemd_out), (ps_ok, ps_out), (ss_ok, ss_out) = _run_commands(
+        ["systemctl", "list-units", "--type=service", "--all", "--no-pager", "--no-legend"],
+        ["ps", "-eo", "pid,comm"],
+        ["ss", "-lntu"],
     )
-    ps_ok, ps_out = _run_command(["ps", "-eo", "pid,comm"])
-    ss_ok, ss_out = _run_command(["ss", "-lntu"])
     return {
         "systemd_available": systemd_ok,
         "systemd_units": _split_lines(systemd_out) if systemd_ok else [],
@@ -168,8 +167,7 @@ def _probe_network() -> Dict[str, Any]:
     ip_cmd = ["ip", "-o", "addr", "show"]
     if not shutil.which("ip"):
         ip_cmd = ["ifconfig", "-a"]
-    ip_ok, ip_out = _run_command(ip_cmd)
-    ss_ok, ss_out = _run_command(["ss", "-lntu"])
+    (ip_ok, ip_out), (ss_ok, ss_out) = _run_commands(ip_cmd, ["ss", "-lntu"])
     return {
         "interfaces": _split_lines(ip_out) if ip_ok else [],
         "listening_sockets": _split_lines(ss_out) if ss_ok else [],
@@ -189,7 +187,13 @@ def _record_section_evidence(section: str, data: Dict[str, Any]) -> None:
         )
 
 
-def _run_command(command: List[str], timeout: int = 3) -> Tuple[bool, str]:
+def _run_commands(*commands: List[str]) -> List[Tuple[bool, str]]:
+    """Runs the commands concurrently; results (and the first error) follow argument order."""
+    with ThreadPoolExecutor(max_workers=len(commands)) as pool:
+        return list(pool.map(_run_command, commands))
+
+
+def _run_command(command: List[str], timeout: int = COMMAND_TIMEOUT_SECONDS) -> Tuple[bool, str]:
     try:
         result = subprocess.run(
             command,
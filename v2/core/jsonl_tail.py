@@ -0,0 +1,114 @@
+from __future__ import annotations
+
+from pathlib import Path
+from typing import BinaryIO, Callable, Generic, Optional, Tuple, TypeVar
+import json
+import os
+import threading
+
+T = TypeVar("T")
+
+
+class JsonlTailIndex(Generic[T]):
+    """
+    In-memory index of an append-only JSONL file, extended by tailing appends.
+
+    new_index() returns an empty index; index_line(index, raw, offset,
+    line_num) folds one line into it, raw being the line's bytes as read
+    (newline included when present) and line_num its 1-based position. The
+    file is re-read only when its (inode, size, mtime_ns) signature moves,
+    and then only from the first byte not yet indexed.
+
+    An unterminated final line is indexed as soon as it parses as JSON, as a
+    full read of the file would; one that does not parse yet is taken to be
+    an append in progress and left for a later refresh. The newline that
+    eventually completes it is not counted as a line of its own.
+
+    Appends are told apart from rewrites by the last indexed line, which must
+    still end at the indexed offset with the same bytes. A file that was
+    replaced, truncated or rewritten in place (even one that kept its inode
+    and grew) is indexed again from the start.
+
+    Hold lock while reading the index returned by get().
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        new_index: Callable[[], T],
+        index_line: Callable[[T, bytes, int, int], None],
+    ):
+        self.path = Path(path)
+        self.lock = threading.RLock()
+        self._new_index = new_index
+        self._index_line = index_line
+        self._reset()
+
+    def get(self) -> Optional[T]:
+        """
+        Bring the index up to date with the file.
+
+        Returns:
+            The index, or None when the file does not exist
+        """
+        with self.lock:
+            try:
+                if _signature(self.path.stat()) == self._signature:
+                    return self.index
+                with self.path.open("rb") as handle:
+                    signature = _signature(os.fstat(handle.fileno()))
+                    if self._signature is not None and not self._continues(handle, signature):
+                        self._reset()
+                    self._read(handle)
+            except FileNotFoundError:
+                self._reset()
+                return None
+            # Only set once every line read so far was accepted, so a line
+            # index_line rejected is read (and rejected) again next time.
+            self._signature = signature
+            return self.index
+
+    def _reset(self) -> None:
+        self.index = self._new_index()
+        self._signature: Optional[Tuple[int, int, int]] = None
+        self._offset = 0
+        self._line_num = 0
+        self._last_line = b""
+        self._partial = False
+
+    def _continues(self, handle: BinaryIO, signature: Tuple[int, int, int]) -> bool:
+        inode, size, _ = signature
+        if inode != self._signature[0] or size < self._offset:
+            return False
+        handle.seek(self._offset - len(self._last_line))
+        if handle.read(len(self._last_line)) != self._last_line:
+            return False
+        # A line indexed before its newline arrived may only be followed by
+        # that newline; anything else means the line itself was rewritten.
+        return not (self._partial and handle.readline().strip())
+
+    def _read(self, handle: BinaryIO) -> None:
+        handle.seek(self._offset)
+        for raw in handle:
+            if self._partial:
+                self._last_line += raw
+            else:
+                if not raw.endswith(b"\n") and not _parses(raw):
+                    break
+                self._index_line(self.index, raw, self._offset, self._line_num + 1)
+                self._line_num += 1
+                self._last_line = raw
+            self._offset += len(raw)
+            self._partial = not raw.endswith(b"\n")
+
+
+def _signature(stat: os.stat_result) -> Tuple[int, int, int]:
+    return (stat.st_ino, stat.st_size, stat.st_mtime_ns)
+
+
+def _parses(raw: bytes) -> bool:
+    try:
+        json.loads(raw)
+    except (UnicodeDecodeError, ValueError):
+        return False
+    return True
@@ -1,24 +1,47 @@
+import logging
 import os
+import threading
+from contextlib import contextmanager
+from contextvars import ContextVar
 from openai import OpenAI
-from typing import List, Dict
+import httpx
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
 
-def get_completion(messages: List[Dict[str, str]], config: dict) -> str:
+logger = logging.getLogger(__name__)
+
+# Connection defaults; each can be overridden per model config.
+DEFAULT_TIMEOUT_SECONDS = 120.0
+DEFAULT_CONNECT_TIMEOUT_SECONDS = 10.0
+DEFAULT_MAX_CONNECTIONS = 20
+DEFAULT_MAX_KEEPALIVE_CONNECTIONS = 10
+
+_clients: Dict[Tuple, OpenAI] = {}
+_clients_lock = threading.Lock()
+
+# Token usage accumulated by track_usage() for completions made in its context.
+_usage_tracker: ContextVar[Optional[Dict[str, int]]] = ContextVar("llm_usage_tracker", default=None)
+
+
+class CompletionInterrupted(RuntimeError):
     """
-    Calls an OpenAI-compatible API based on the provided configuration.
-    Supports "openai", "openrouter", and "ollama" providers.
+    A streamed completion failed after some of its text reached on_delta.
+    """
+
+
+def _resolve_provider(config: dict) -> Tuple[str, str, str, str]:
+    """
+    Returns (provider, service_name, base_url, api_key) for the configuration.
     """
-    # --- Determine Provider and Credentials ---
     provider = config.get("provider", "openai") # Default to 'openai' if not specified
     service_name = provider.capitalize()
 
     api_key = config.get("api_key") # Explicit key in config takes highest priority
     base_url = config.get("base_url")
-    model_name = config.get("model_name")
 
     if provider == "ollama":
         # Ollama doesn't need a key, but the client library requires a non-empty string.
         if not api_key:
-            api_key = "ollama" 
+            api_key = "ollama"
         if not base_url:
             # Use the default Ollama URL if not specified
             base_url = "https://ollama.barn.workshop.home"
@@ -35,6 +58,126 @@ def get_completion(messages: List[Dict[str, str]], config: dict) -> str:
             api_key = os.environ.get("OPENAI_API_KEY")
         service_name = "OpenAI"
 
+    return provider, service_name, base_url, api_key
+
+
+def _connection_settings(config: dict) -> Tuple[float, float, int, int]:
+    return (
+        float(config.get("timeout_seconds", DEFAULT_TIMEOUT_SECONDS)),
+        float(config.get("connect_timeout_seconds", DEFAULT_CONNECT_TIMEOUT_SECONDS)),
+        int(config.get("max_connections", DEFAULT_MAX_CONNECTIONS)),
+        int(config.get("max_keepalive_connections", DEFAULT_MAX_KEEPALIVE_CONNECTIONS)),
+    )
+
+
+def get_client(provider: str, base_url: str | None, api_key: str, config: dict | None = None) -> OpenAI:
+    """
+    Returns the shared client for (provider, base_url, api_key), creating it on first use.
+    Reusing the client keeps its HTTP connection pool (and TLS/keep-alive state) warm.
+    """
+    settings = _connection_settings(config or {})
+    key = (provider, base_url, api_key, settings)
+    with _clients_lock:
+        client = _clients.get(key)
+        if client is None:
+            timeout, connect_timeout, max_connections, max_keepalive = settings
+            client_timeout = httpx.Timeout(timeout, connect=connect_timeout)
+            http_client = httpx.Client(
+                timeout=client_timeout,
+                limits=httpx.Limits(
+                    max_connections=max_connections,
+                    max_keepalive_connections=max_keepalive,
+                ),
+            )
+            client = OpenAI(
+                base_url=base_url,
+                api_key=api_key,
+                timeout=client_timeout,
+                http_client=http_client,
+            )
+            _clients[key] = client
+        return client
+
+
+def close_clients() -> None:
+    """
+    Closes and forgets every pooled client (shutdown / tests).
+    """
+    with _clients_lock:
+        clients = list(_clients.values())
+        _clients.clear()
+    for client in clients:
+        try:
+            client.close()
+        except Exception:
+            logger.debug("Failed to close LLM client", exc_info=True)
+
+
+@contextmanager
+def track_usage() -> Iterator[Dict[str, int]]:
+    """
+    Sums the provider-reported token usage of every completion made in this context.
+    """
+    usage = {"prompt_tokens": 0, "completion_tokens": 0, "total_tokens": 0}
+    token = _usage_tracker.set(usage)
+    try:
+        yield usage
+    finally:
+        _usage_tracker.reset(token)
+
+
+def _record_usage(usage) -> None:
+    tracker = _usage_tracker.get()
+    if tracker is None or usage is None:
+        return
+    for key in tracker:
+        tracker[key] += int(getattr(usage, key, 0) or 0)
+
+
+def _stream_content(client: OpenAI, model_name: str, messages: List[Dict[str, str]], on_delta: Callable[[str], None]) -> str:
+    parts: List[str] = []
+    stream = client.chat.completions.create(
+        model=model_name,
+        messages=messages,
+        stream=True,
+        stream_options={"include_usage": True},
+    )
+    try:
+        for chunk in stream:
+            if chunk.choices:
+                delta = chunk.choices[0].delta.content
+                if delta:
+                    parts.append(delta)
+                    on_delta(delta)
+            _record_usage(getattr(chunk, "usage", None))
+    except Exception as e:
+        if not parts:
+            raise
+        # Deltas already went out, so the text so far must not pass for the
+        # whole answer, and neither may a substitute error message.
+        raise CompletionInterrupted(f"Completion stream interrupted: {e}") from e
+    finally:
+        stream.close()
+    return "".join(parts)
+
+
+def get_completion(
+    messages: List[Dict[str, str]],
+    config: dict,
+    on_delta: Optional[Callable[[str], None]] = None,
+) -> str:
+    """
+    Calls an OpenAI-compatible API based on the provided configuration.
+    Supports "openai", "openrouter", and "ollama" providers.
+
+    With on_delta, the completion is streamed and on_delta receives each text
+    delta as it arrives; the full text is still returned. If the stream fails
+    after a delta was delivered, CompletionInterrupted is raised.
+    """
+    # --- Determine Provider and Credentials ---
+    provider, service_name, base_url, api_key = _resolve_provider(config)
+    model_name = config.get("model_name")
+
     if not api_key:
         raise ValueError(
             f"API key for provider '{provider}' not found. Please set it "
@@ -44,22 +187,27 @@ def get_completion(messages: List[Dict[str, str]], config: dict) -> str:
         raise ValueError(f"model_name not specified in config.yaml for provider '{provider}'.")
 
     # --- Call the API ---
-    print(f" Calling {service_name} at {base_url} with model: {model_name}...")
+    logger.debug("Calling %s at %s with model: %s", service_name, base_url, model_name)
 
     try:
-        client = OpenAI(base_url=base_url, api_key=api_key)
-
-        response = client.chat.completions.create(
-            model=model_name,
-            messages=messages
-        )
+        client = get_client(provider, base_url, api_key, config)
 
-        content = response.choices[0].message.content
-        print(f"✅ {service_name} response received.")
+        if on_delta is not None:
+            content = _stream_content(client, model_name, messages, on_delta)
+        else:
+            response = client.chat.completions.create(
+                model=model_name,
+                messages=messages
+            )
+            _record_usage(response.usage)
+            content = response.choices[0].message.content
+        logger.debug("%s response received.", service_name)
         return content
 
+    except CompletionInterrupted:
+        raise
     except Exception as e:
-        print(f"❌ Error calling {service_name} API: {e}")
+        logger.warning("Error calling %s API: %s", service_name, e)
         return (
             f"I encountered an error trying to connect to {service_name}. "
             "Please check the server, model name, and network."
@@ -1,4 +1,6 @@
 import json
+import os
+import threading
 import uuid
 from pathlib import Path
 from datetime import datetime
@@ -6,12 +8,39 @@ from v2.core.contracts.loader import ContractViolation, validate_trace_event
 
 _V2_ROOT = Path(__file__).resolve().parents[2]
 
+SCOPE_INDEX_FILENAME = "_scope_index.jsonl"
+
+
+def _posting_key(key: str, value) -> tuple | None:
+    """
+    Postings are keyed on the value itself, so values that compare equal (1, 1.0
+    and True) share one, as they matched under _scope_match's !=. Unhashable
+    values (lists, dicts) get no posting; queries on them fall back to a scan.
+    """
+    try:
+        hash(value)
+    except TypeError:
+        return None
+    return (key, value)
+
 
 class FileMemoryStore:
+    """
+    One JSON file per memory entry, plus an append-only scope index
+    (_scope_index.jsonl) mirrored in memory as (scope key, value) -> entry ids.
+    Queries intersect the postings for the requested scope and only load the
+    matching entry files. The index is loaded on first use, and rebuilt when
+    missing or out of step with the entry files on disk.
+    """
+
     def __init__(self, base_dir: str | None = None, trace_sink=None):
         self.base_dir = Path(base_dir) if base_dir is not None else (_V2_ROOT / "var" / "memory")
         self.base_dir.mkdir(parents=True, exist_ok=True)
         self.trace_sink = trace_sink
+        self._index_path = self.base_dir / SCOPE_INDEX_FILENAME
+        self._lock = threading.RLock()
+        self._reset_index()
+        self._index_loaded = False
 
     def write(self, entry: dict, trace_id: str) -> dict:
         if "content" not in entry or "metadata" not in entry or "scope" not in entry:
@@ -21,17 +50,40 @@ class FileMemoryStore:
         entry["id"] = entry_id
 
         path = self.base_dir / f"{entry_id}.json"
-        with path.open("w") as f:
-            json.dump(entry, f, indent=2)
+        with self._lock:
+            self._ensure_index()
+            with path.open("w") as f:
+                json.dump(entry, f, indent=2)
+            with self._index_path.open("a") as f:
+                f.write(json.dumps({"id": entry_id, "scope": entry.get("scope") or {}}) + "\n")
+            self._refresh_index()
 
         self._emit(trace_id, "memory_write_success", {"memory_id": entry_id})
         return entry
 
-    def query(self, scope: dict, trace_id: str) -> list[dict]:
+    def query(
+        self,
+        scope: dict,
+        trace_id: str,
+        limit: int | None = None,
+        newest_first: bool = False,
+    ) -> list[dict]:
+        with self._lock:
+            self._ensure_index()
+            candidates = self._candidate_ids(scope)
+        if newest_first:
+            candidates.reverse()
+
         results = []
-        for path in self.base_dir.glob("*.json"):
-            with path.open("r") as f:
-                entry = json.load(f)
+        for entry_id in candidates:
+            if limit is not None and len(results) >= limit:
+                break
+            path = self.base_dir / f"{entry_id}.json"
+            try:
+                with path.open("r") as f:
+                    entry = json.load(f)
+            except (OSError, json.JSONDecodeError):
+                continue
 
             if self._scope_match(entry.get("scope", {}), scope):
                 results.append(entry)
@@ -45,6 +97,118 @@ class FileMemoryStore:
                 return False
         return True
 
+    def _reset_index(self) -> None:
+        self._entry_seq: dict[str, int] = {}
+        self._entry_scope: dict[str, dict] = {}
+        self._postings: dict[tuple, set[str]] = {}
+        self._next_seq = 0
+        self._index_offset = 0
+
+    def _candidate_ids(self, scope: dict) -> list[str]:
+        # Unhashable query values narrow nothing here; query() filters them with _scope_match
+        keys = [_posting_key(key, val) for key, val in scope.items() if val is not None]
+        keys = [key for key in keys if key is not None]
+        if not keys:
+            ids = set(self._entry_seq)
+        else:
+            postings = sorted((self._postings.get(key, set()) for key in keys), key=len)
+            ids = set(postings[0])
+            for posting in postings[1:]:
+                ids &= posting
+                if not ids:
+                    break
+        return sorted(ids, key=self._entry_seq.__getitem__)
+
+    def _apply_index_line(self, line: str) -> None:
+        try:
+            record = json.loads(line)
+        except json.JSONDecodeError:
+            return
+        if not isinstance(record, dict) or not record.get("id"):
+            return
+        entry_id = str(record["id"])
+        scope = record.get("scope") if isinstance(record.get("scope"), dict) else {}
+
+        for key, val in self._entry_scope.get(entry_id, {}).items():
+            posting_key = _posting_key(key, val)
+            if posting_key is not None and posting_key in self._postings:
+                self._postings[posting_key].discard(entry_id)
+        self._entry_scope[entry_id] = scope
+        self._entry_seq[entry_id] = self._next_seq
+        self._next_seq += 1
+        for key, val in scope.items():
+            posting_key = _posting_key(key, val)
+            if posting_key is not None:
+                self._postings.setdefault(posting_key, set()).add(entry_id)
+
+    def _ensure_index(self) -> None:
+        if not self._index_loaded:
+            self._load_index()
+            self._index_loaded = True
+            return
+        self._refresh_index()
+
+    def _refresh_index(self) -> None:
+        try:
+            size = self._index_path.stat().st_size
+        except OSError:
+            self._rebuild_index()
+            return
+        if size < self._index_offset:
+            self._load_index()
+            return
+        if size == self._index_offset:
+            return
+        with self._index_path.open("rb") as f:
+            f.seek(self._index_offset)
+            for raw in f:
+                if not raw.endswith(b"\n"):
+                    break
+                self._index_offset += len(raw)
+                self._apply_index_line(raw.decode("utf-8"))
+
+    def _load_index(self) -> None:
+        with self._lock:
+            self._reset_index()
+            on_disk = {
+                name[: -len(".json")]
+                for name in os.listdir(self.base_dir)
+                if name.endswith(".json")
+            }
+            if not self._index_path.exists():
+                self._rebuild_index(on_disk)
+                return
+            self._refresh_index()
+            if set(self._entry_seq) != on_disk:
+                self._rebuild_index(on_disk)
+
+    def _rebuild_index(self, entry_ids: set[str] | None = None) -> None:
+        with self._lock:
+            self._reset_index()
+            if entry_ids is None:
+                entry_ids = {path.stem for path in self.base_dir.glob("*.json")}
+            entries = []
+            for entry_id in entry_ids:
+                path = self.base_dir / f"{entry_id}.json"
+                try:
+                    mtime_ns = path.stat().st_mtime_ns
+                    with path.open("r") as f:
+                        entry = json.load(f)
+                except (OSError, json.JSONDecodeError):
+                    continue
+                scope = entry.get("scope") if isinstance(entry, dict) else None
+                entries.append((mtime_ns, entry_id, scope if isinstance(scope, dict) else {}))
+            entries.sort()
+
+            lines = [json.dumps({"id": entry_id, "scope": scope}) + "\n" for _, entry_id, scope in entries]
+            tmp_path = self._index_path.with_suffix(".jsonl.tmp")
+            with tmp_path.open("w") as f:
+                f.write("".join(lines))
+            os.replace(tmp_path, self._index_path)
+            for line in lines:
+                self._apply_index_line(line)
+            self._index_offset = self._index_path.stat().st_size
+
     def _emit(self, trace_id: str, event_type: str, payload: dict):
         if not self.trace_sink:
             return
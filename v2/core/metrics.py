@@ -3,10 +3,19 @@
 from __future__ import annotations
 
 import copy
+import math
 import threading
 from dataclasses import dataclass
 from typing import Dict
 
+# Log-spaced latency buckets: HISTOGRAM_SUBBUCKETS per doubling above
+# HISTOGRAM_LOW_MS, so a reported percentile is within about 9% of the true
+# value. Bucket i covers (LOW * 2^((i-1)/SUB), LOW * 2^(i/SUB)]; latencies at or
+# below LOW land in bucket 0.
+HISTOGRAM_LOW_MS = 0.001
+HISTOGRAM_SUBBUCKETS = 8
+LATENCY_PERCENTILES = (50, 95, 99)
+
 
 @dataclass(frozen=True)
 class MetricsSummary:
@@ -19,6 +28,7 @@ class _MetricsStore:
         self._lock = threading.Lock()
         self._counters: Dict[str, int] = {}
         self._latencies: Dict[str, Dict[str, float]] = {}
+        self._histograms: Dict[str, Dict[int, int]] = {}
 
     def increment(self, name: str, amount: int = 1) -> None:
         if not name:
@@ -46,17 +56,52 @@ class _MetricsStore:
             bucket["min_ms"] = min(float(bucket["min_ms"]), latency_ms)
             bucket["max_ms"] = max(float(bucket["max_ms"]), latency_ms)
             bucket["avg_ms"] = float(bucket["total_ms"]) / float(bucket["count"])
+            histogram = self._histograms.setdefault(name, {})
+            index = _histogram_index(latency_ms)
+            histogram[index] = histogram.get(index, 0) + 1
 
     def summary(self) -> MetricsSummary:
         with self._lock:
             counters = copy.deepcopy(self._counters)
             latencies = copy.deepcopy(self._latencies)
+            histograms = {name: dict(histogram) for name, histogram in self._histograms.items()}
+        for name, bucket in latencies.items():
+            bucket.update(_percentiles(histograms.get(name, {}), bucket["min_ms"], bucket["max_ms"]))
         return MetricsSummary(counters=counters, latencies_ms=latencies)
 
     def reset(self) -> None:
         with self._lock:
             self._counters = {}
             self._latencies = {}
+            self._histograms = {}
+
+
+def _histogram_index(latency_ms: float) -> int:
+    if latency_ms <= HISTOGRAM_LOW_MS:
+        return 0
+    return max(0, math.ceil(math.log2(latency_ms / HISTOGRAM_LOW_MS) * HISTOGRAM_SUBBUCKETS))
+
+
+def _histogram_upper_ms(index: int) -> float:
+    return HISTOGRAM_LOW_MS * 2.0 ** (index / HISTOGRAM_SUBBUCKETS)
+
+
+def _percentiles(histogram: Dict[int, int], min_ms: float, max_ms: float) -> Dict[str, float]:
+    """Nearest-rank percentiles, reported as the upper edge of the bucket (clamped to min/max)."""
+    total = sum(histogram.values())
+    result: Dict[str, float] = {}
+    if not total:
+        return result
+    buckets = sorted(histogram.items())
+    for percentile in LATENCY_PERCENTILES:
+        rank = max(1, math.ceil(total * percentile / 100.0))
+        seen = 0
+        for index, count in buckets:
+            seen += count
+            if seen >= rank:
+                break
+        result[f"p{percentile}_ms"] = min(max(_histogram_upper_ms(index), float(min_ms)), float(max_ms))
+    return result
 
 
 _STORE = _MetricsStore()
@@ -6,10 +6,11 @@ import copy
 import hashlib
 import threading
 import uuid
+from collections import deque
 from contextlib import contextmanager
 from contextvars import ContextVar
 from datetime import datetime, timezone
-from typing import Any, Dict, Iterator, List
+from typing import Any, Deque, Dict, Iterator, List
 
 from v2.core.trace_report import TelemetryEvent
 
@@ -55,22 +56,50 @@ def sanitize_metadata(metadata: Dict[str, Any] | None) -> Dict[str, Any]:
     return {str(key): _sanitize_value(str(key), value) for key, value in metadata.items()}
 
 
+DEFAULT_TELEMETRY_CAPACITY = 50_000
+
+
 class _TelemetryStore:
-    def __init__(self) -> None:
+    """
+    Ring buffer of the most recent telemetry events, indexed by session.
+
+    Once capacity is reached the oldest event is evicted. Eviction is global
+    oldest-first, so it is always the head of its session's deque as well.
+    """
+
+    def __init__(self, capacity: int = DEFAULT_TELEMETRY_CAPACITY) -> None:
         self._lock = threading.Lock()
-        self._events: List[TelemetryEvent] = []
+        self._capacity = max(1, int(capacity))
+        self._events: Deque[TelemetryEvent] = deque()
+        self._by_session: Dict[str, Deque[TelemetryEvent]] = {}
 
     def append(self, event: TelemetryEvent) -> None:
         with self._lock:
             self._events.append(event)
+            self._by_session.setdefault(event.session_id, deque()).append(event)
+            self._trim()
 
     def by_session(self, session_id: str) -> List[TelemetryEvent]:
         with self._lock:
-            return [copy.deepcopy(event) for event in self._events if event.session_id == session_id]
+            return [copy.deepcopy(event) for event in self._by_session.get(session_id, ())]
+
+    def set_capacity(self, capacity: int) -> None:
+        with self._lock:
+            self._capacity = max(1, int(capacity))
+            self._trim()
 
     def reset(self) -> None:
         with self._lock:
-            self._events = []
+            self._events = deque()
+            self._by_session = {}
+
+    def _trim(self) -> None:
+        while len(self._events) > self._capacity:
+            evicted = self._events.popleft()
+            session_events = self._by_session[evicted.session_id]
+            session_events.popleft()
+            if not session_events:
+                del self._by_session[evicted.session_id]
 
 
 _STORE = _TelemetryStore()
@@ -128,5 +157,9 @@ def get_session_events(session_id: str) -> List[TelemetryEvent]:
     return _STORE.by_session(session_id=session_id)
 
 
+def set_telemetry_capacity(capacity: int) -> None:
+    _STORE.set_capacity(capacity)
+
+
 def reset_telemetry_events() -> None:
     _STORE.reset()
@@ -10,20 +10,23 @@ correctly invoke the configured LLM.
 import hashlib
 import html
 import json
+import logging
 import os
 import re
 import shlex
 import socket
 import subprocess
 import time
+import threading
 import yaml
 import uuid
 from difflib import SequenceMatcher
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Dict, Any, List
+from typing import Callable, Dict, Any, List, Tuple
 
 import copy
+from contextvars import ContextVar
 
 try:
     from . import llm_api
@@ -34,7 +37,7 @@ from v2.core.advisory_planning import build_advisory_plan
 from v2.core.conversation_layer import process_conversational_turn, run_governed_interpreter
 from v2.core.contracts.loader import load_schema, ContractViolation
 from v2.core.tool_runner.docker_runner import DockerRunner
-from v2.core.trace.file_trace_sink import FileTraceSink
+from v2.core.trace.file_trace_sink import DURABILITY_MODES, FileTraceSink
 from v2.core.tool_registry.registry import ToolRegistry
 from v2.core.tool_registry.loader import ToolLoader
 from v2.core.agent.tool_router import ToolRouter
@@ -83,6 +86,7 @@ from v2.core.aci_intent_gatekeeper import (
     phase_gatekeeper,
     route_intent,
 )
+from v2.core.sessions import current_session_state as _session_state, default_session_state
 from v2.core.aci_issuance_ledger import (
     ACIIssuanceLedger,
     REVOCATION_CONTRACT_NAME,
@@ -135,7 +139,25 @@ _V2_ROOT = Path(__file__).resolve().parents[1]
 _PROJECT_ROOT = _V2_ROOT.parent
 
 
-_trace_sink = FileTraceSink()
+logger = logging.getLogger(__name__)
+
+
+def _trace_durability_from_env() -> str:
+    durability = os.environ.get("BILLY_TRACE_DURABILITY", "flush").strip().lower() or "flush"
+    if durability not in DURABILITY_MODES:
+        logger.warning(
+            "Unknown BILLY_TRACE_DURABILITY %r; expected one of %s. Using 'flush'.",
+            durability,
+            ", ".join(DURABILITY_MODES),
+        )
+        return "flush"
+    return durability
+
+
+_trace_sink = FileTraceSink(
+    buffered=os.environ.get("BILLY_TRACE_BUFFERED", "").strip().lower() in {"1", "true", "yes"},
+    durability=_trace_durability_from_env(),
+)
 _docker_runner = DockerRunner(trace_sink=_trace_sink)
 _tool_registry = ToolRegistry()
 _memory_store = FileMemoryStore(trace_sink=_trace_sink)
@@ -172,37 +194,47 @@ _approval_store = ApprovalStore()
 _approval_flow = ApprovalFlow()
 _autonomy_registry = AutonomyRegistry()
 
+# Conversation-scoped stores live on the current SessionState (see
+# v2/core/sessions.py); these names alias the default session's stores.
+_default_session_state = default_session_state()
+
 _exec_contract_dir = _V2_ROOT / "var" / "execution_contract"
 _exec_contract_dir.mkdir(parents=True, exist_ok=True)
 _exec_contract_state_path = _exec_contract_dir / "state.json"
 _exec_contract_journal_path = _exec_contract_dir / "journal.jsonl"
-_pending_exec_proposals: Dict[str, Dict[str, str]] = {}
+_pending_exec_proposals = _default_session_state.pending_exec_proposals
 
 _ops_contract_dir = _V2_ROOT / "var" / "ops"
 _ops_contract_dir.mkdir(parents=True, exist_ok=True)
 _ops_state_path = _ops_contract_dir / "state.json"
 _ops_journal_path = _ops_contract_dir / "journal.jsonl"
-_pending_ops_plans: Dict[str, Dict[str, str]] = {}
+_pending_ops_plans = _default_session_state.pending_ops_plans
 _aci_issuance_dir = _V2_ROOT / "var" / "aci_issuance"
 _aci_issuance_dir.mkdir(parents=True, exist_ok=True)
 _aci_issuance_ledger_path = _aci_issuance_dir / "ledger.jsonl"
-_last_inspection: dict = {}
-_last_introspection_snapshot: Dict[str, Any] = {}
-_last_resolution: Dict[str, Any] = {}
-_cdm_drafts: Dict[str, Dict[str, Any]] = {}
-_approved_drafts: Dict[str, List[Dict[str, Any]]] = {}
+_last_inspection = _default_session_state.last_inspection
+_last_introspection_snapshot = _default_session_state.last_introspection_snapshot
+_last_resolution = _default_session_state.last_resolution
+_cdm_drafts = _default_session_state.cdm_drafts
+_approved_drafts = _default_session_state.approved_drafts
 _approved_drafts_audit: List[Dict[str, Any]] = []
 _application_attempts: List[Dict[str, Any]] = []
-_tool_drafts: Dict[str, Dict[str, Any]] = {}
-_approved_tools: Dict[str, List[Dict[str, Any]]] = {}
+_tool_drafts = _default_session_state.tool_drafts
+_approved_tools = _default_session_state.approved_tools
 _tool_approval_audit: List[Dict[str, Any]] = []
 _registered_tools: Dict[str, Dict[str, Any]] = {}
+# Approved draft and approval record captured at registration, by tool_draft_id,
+# so a registered tool can run in sessions other than the one that drafted it.
+_registered_tool_drafts: Dict[str, Dict[str, Any]] = {}
 _tool_registration_audit: List[Dict[str, Any]] = []
-_pending_tool_executions: Dict[str, Dict[str, Any]] = {}
+# Tool drafts and approvals are per session; the registered-tool catalogue and
+# the audit logs are shared by every session.
+_tool_catalog_lock = threading.Lock()
+_pending_tool_executions = _default_session_state.pending_tool_executions
 _tool_execution_audit: List[Dict[str, Any]] = []
 _PENDING_TOOL_TTL_SECONDS = 300
-_workflows: Dict[str, Dict[str, Any]] = {}
-_approved_workflows: Dict[str, List[Dict[str, Any]]] = {}
+_workflows = _default_session_state.workflows
+_approved_workflows = _default_session_state.approved_workflows
 _workflow_audit: List[Dict[str, Any]] = []
 _WORKFLOW_DECLARED_MATURITY_LEVEL = 4
 _WORKFLOW_LAYER_MATURITY_DECLARATIONS: Dict[str, Dict[str, int]] = {
@@ -1335,7 +1367,7 @@ def _create_cdm_draft(mode: str, request: str, trace_id: str) -> Dict[str, Any]:
         "trace_id": trace_id,
     }
     record["draft_hash"] = _compute_draft_hash(record)
-    _cdm_drafts[draft_id] = record
+    _session_state().cdm_drafts[draft_id] = record
     return record
 
 
@@ -1535,12 +1567,13 @@ def _create_tool_draft(mode: str, request: str, trace_id: str) -> Dict[str, Any]
         when_not_to_use=when_not_to_use,
         spec=spec,
     )
-    _tool_drafts[tool_draft_id] = record
+    _session_state().tool_drafts[tool_draft_id] = record
     return record
 
 
 def _approve_tool_draft(tool_draft_id: str, approved_by: str) -> tuple[bool, str]:
-    draft = _tool_drafts.get(tool_draft_id)
+    state = _session_state()
+    draft = state.tool_drafts.get(tool_draft_id)
     if draft is None:
         return False, "Tool approval rejected: tool_draft_id does not exist."
 
@@ -1554,7 +1587,7 @@ def _approve_tool_draft(tool_draft_id: str, approved_by: str) -> tuple[bool, str
     if current_hash != expected_hash:
         return False, "Tool approval rejected: draft content hash mismatch."
 
-    if _approved_tools.get(tool_draft_id):
+    if state.approved_tools.get(tool_draft_id):
         return False, "Tool approval rejected: tool draft was already approved."
 
     approval_record = {
@@ -1565,8 +1598,9 @@ def _approve_tool_draft(tool_draft_id: str, approved_by: str) -> tuple[bool, str
         "status": "approved",
         "source": "TDM",
     }
-    _approved_tools.setdefault(tool_draft_id, []).append(dict(approval_record))
-    _tool_approval_audit.append(dict(approval_record))
+    state.approved_tools.setdefault(tool_draft_id, []).append(dict(approval_record))
+    with _tool_catalog_lock:
+        _tool_approval_audit.append(dict(approval_record))
 
     input_names = [item.get("name", "") for item in draft.get("inputs", []) if isinstance(item, dict)]
     output_names = [item.get("name", "") for item in draft.get("outputs", []) if isinstance(item, dict)]
@@ -1584,11 +1618,12 @@ def _approve_tool_draft(tool_draft_id: str, approved_by: str) -> tuple[bool, str
 
 
 def _register_tool_draft(tool_draft_id: str, registered_by: str) -> tuple[bool, str]:
-    draft = _tool_drafts.get(tool_draft_id)
+    state = _session_state()
+    draft = state.tool_drafts.get(tool_draft_id)
     if draft is None:
         return False, "Tool registration rejected: tool_draft_id does not exist."
 
-    approvals = _approved_tools.get(tool_draft_id)
+    approvals = state.approved_tools.get(tool_draft_id)
     if not approvals:
         return False, "Tool registration rejected: tool draft is not approved."
     approval_record = approvals[-1]
@@ -1611,38 +1646,43 @@ def _register_tool_draft(tool_draft_id: str, registered_by: str) -> tuple[bool,
         return False, "Tool registration rejected: tool name is missing."
 
     registration_key = f"{tool_name}@{tool_draft_id}"
-    if registration_key in _registered_tools:
-        return False, "Tool registration rejected: tool draft is already registered."
-
-    spec = draft.get("spec")
-    executability_cfg = {}
-    if isinstance(spec, dict):
-        executability_cfg = spec.get("executability", {})
-    if not isinstance(executability_cfg, dict):
-        executability_cfg = {}
-    executability_enabled = bool(executability_cfg.get("enabled", False))
-    requires_confirmation = bool(executability_cfg.get("requires_confirmation", True))
+    with _tool_catalog_lock:
+        if registration_key in _registered_tools:
+            return False, "Tool registration rejected: tool draft is already registered."
 
-    registration_record = {
-        "registration_key": registration_key,
-        "tool_name": tool_name,
-        "tool_draft_id": tool_draft_id,
-        "intent": draft.get("tool_purpose", ""),
-        "contract": {
-            "inputs": draft.get("inputs", []),
-            "outputs": draft.get("outputs", []),
-        },
-        "declared_side_effects": draft.get("declared_side_effects", []),
-        "safety_constraints": draft.get("safety_constraints", []),
-        "visibility": "visible",
-        "executability": executability_enabled,
-        "requires_confirmation": requires_confirmation,
-        "registered_by": registered_by,
-        "registered_at": datetime.now(timezone.utc).isoformat(),
-        "source": "TRM",
-    }
-    _registered_tools[registration_key] = dict(registration_record)
-    _tool_registration_audit.append(dict(registration_record))
+        spec = draft.get("spec")
+        executability_cfg = {}
+        if isinstance(spec, dict):
+            executability_cfg = spec.get("executability", {})
+        if not isinstance(executability_cfg, dict):
+            executability_cfg = {}
+        executability_enabled = bool(executability_cfg.get("enabled", False))
+        requires_confirmation = bool(executability_cfg.get("requires_confirmation", True))
+
+        registration_record = {
+            "registration_key": registration_key,
+            "tool_name": tool_name,
+            "tool_draft_id": tool_draft_id,
+            "intent": draft.get("tool_purpose", ""),
+            "contract": {
+                "inputs": draft.get("inputs", []),
+                "outputs": draft.get("outputs", []),
+            },
+            "declared_side_effects": draft.get("declared_side_effects", []),
+            "safety_constraints": draft.get("safety_constraints", []),
+            "visibility": "visible",
+            "executability": executability_enabled,
+            "requires_confirmation": requires_confirmation,
+            "registered_by": registered_by,
+            "registered_at": datetime.now(timezone.utc).isoformat(),
+            "source": "TRM",
+        }
+        _registered_tools[registration_key] = dict(registration_record)
+        _registered_tool_drafts[tool_draft_id] = {
+            "draft": copy.deepcopy(draft),
+            "approval": dict(approval_record),
+        }
+        _tool_registration_audit.append(dict(registration_record))
 
     side_effects = registration_record.get("declared_side_effects", [])
     lines = [
@@ -1671,7 +1711,7 @@ def _append_workflow_audit_event(
         "details": json.loads(json.dumps(details, sort_keys=True)),
     }
     _workflow_audit.append(dict(event))
-    workflow = _workflows.get(workflow_id)
+    workflow = _session_state().workflows.get(workflow_id)
     if workflow is not None:
         workflow_audit = workflow.setdefault("audit", [])
         if isinstance(workflow_audit, list):
@@ -1703,7 +1743,7 @@ def _create_workflow(payload: Dict[str, Any], created_by: str, trace_id: str) ->
         "trace_id": trace_id,
         "audit": [],
     }
-    _workflows[workflow_id] = workflow_record
+    _session_state().workflows[workflow_id] = workflow_record
     _append_workflow_audit_event(
         workflow_id,
         "workflow_defined",
@@ -1728,11 +1768,11 @@ def _approve_workflow(workflow_id: str, approved_by: str) -> tuple[bool, str]:
     if not maturity_ok:
         return False, maturity_reason
 
-    workflow = _workflows.get(workflow_id)
+    workflow = _session_state().workflows.get(workflow_id)
     if workflow is None:
         return False, "Workflow approval rejected: workflow_id does not exist."
 
-    if _approved_workflows.get(workflow_id):
+    if _session_state().approved_workflows.get(workflow_id):
         return False, "Workflow approval rejected: workflow is already approved."
 
     steps = workflow.get("steps")
@@ -1753,7 +1793,7 @@ def _approve_workflow(workflow_id: str, approved_by: str) -> tuple[bool, str]:
         "status": "approved",
         "source": "WORKFLOW_MODE",
     }
-    _approved_workflows.setdefault(workflow_id, []).append(dict(approval_record))
+    _session_state().approved_workflows.setdefault(workflow_id, []).append(dict(approval_record))
     workflow["status"] = "approved"
     _append_workflow_audit_event(
         workflow_id,
@@ -1774,11 +1814,11 @@ def _run_workflow(workflow_id: str, trace_id: str) -> tuple[bool, str]:
     if not maturity_ok:
         return False, maturity_reason
 
-    workflow = _workflows.get(workflow_id)
+    workflow = _session_state().workflows.get(workflow_id)
     if workflow is None:
         return False, "Workflow execution rejected: workflow_id does not exist."
 
-    approvals = _approved_workflows.get(workflow_id)
+    approvals = _session_state().approved_workflows.get(workflow_id)
     if not approvals:
         return False, "Workflow execution rejected: workflow is not approved."
     approval_record = approvals[-1]
@@ -1906,7 +1946,7 @@ def _run_workflow(workflow_id: str, trace_id: str) -> tuple[bool, str]:
 
 
 def _approve_cdm_draft(draft_id: str, approved_by: str) -> tuple[bool, str]:
-    draft = _cdm_drafts.get(draft_id)
+    draft = _session_state().cdm_drafts.get(draft_id)
     if draft is None:
         return False, "Approval rejected: draft_id does not exist."
 
@@ -1920,7 +1960,7 @@ def _approve_cdm_draft(draft_id: str, approved_by: str) -> tuple[bool, str]:
     if current_hash != expected_hash:
         return False, "Approval rejected: draft content has changed."
 
-    if _approved_drafts.get(draft_id):
+    if _session_state().approved_drafts.get(draft_id):
         return False, "Approval rejected: draft was already approved."
 
     approval_record = {
@@ -1931,7 +1971,7 @@ def _approve_cdm_draft(draft_id: str, approved_by: str) -> tuple[bool, str]:
         "status": "approved",
         "source": "CDM",
     }
-    _approved_drafts.setdefault(draft_id, []).append(dict(approval_record))
+    _session_state().approved_drafts.setdefault(draft_id, []).append(dict(approval_record))
     _approved_drafts_audit.append(dict(approval_record))
 
     files_affected = draft.get("files_affected") if isinstance(draft.get("files_affected"), list) else []
@@ -1976,11 +2016,11 @@ def _prepare_tool_execution(tool_name: str, payload: Dict[str, Any]) -> tuple[bo
         return False, "Tool execution rejected: tool is not registered.", None
 
     tool_draft_id = str(registration.get("tool_draft_id", "")).strip()
-    draft = _tool_drafts.get(tool_draft_id)
-    approvals = _approved_tools.get(tool_draft_id)
-    if draft is None or not approvals:
+    registered = _registered_tool_drafts.get(tool_draft_id)
+    if registered is None:
         return False, "Tool execution rejected: tool is not approved.", None
-    approval_record = approvals[-1]
+    draft = registered["draft"]
+    approval_record = registered["approval"]
     if approval_record.get("status") != "approved":
         return False, "Tool execution rejected: tool is not approved.", None
 
@@ -2072,18 +2112,19 @@ def _execute_pending_tool(prepared: Dict[str, Any], trace_id: str) -> tuple[bool
 
 
 def _handle_run_tool(tool_name: str, payload: Dict[str, Any]) -> tuple[bool, str]:
-    pending = _pending_tool_executions.get(tool_name)
+    pending_executions = _session_state().pending_tool_executions
+    pending = pending_executions.get(tool_name)
     if pending is not None:
         created = float(pending.get("prepared_at", 0.0))
         if (time.time() - created) <= _PENDING_TOOL_TTL_SECONDS:
             return False, "Tool execution rejected: pending confirmation already exists for this tool."
-        _pending_tool_executions.pop(tool_name, None)
+        pending_executions.pop(tool_name, None)
 
     ok, reason, prepared = _prepare_tool_execution(tool_name=tool_name, payload=payload)
     if not ok or prepared is None:
         return False, reason
 
-    _pending_tool_executions[tool_name] = prepared
+    pending_executions[tool_name] = prepared
     side_effects = prepared.get("declared_side_effects", [])
     lines = [
         "TOOL_EXECUTION_PENDING",
@@ -2102,33 +2143,34 @@ def _handle_run_tool(tool_name: str, payload: Dict[str, Any]) -> tuple[bool, str
 
 
 def _handle_confirm_run_tool(tool_name: str, trace_id: str) -> tuple[bool, str]:
-    pending = _pending_tool_executions.get(tool_name)
+    pending_executions = _session_state().pending_tool_executions
+    pending = pending_executions.get(tool_name)
     if pending is None:
         return False, "Tool execution rejected: no pending execution for this tool."
 
     created = float(pending.get("prepared_at", 0.0))
     if (time.time() - created) > _PENDING_TOOL_TTL_SECONDS:
-        _pending_tool_executions.pop(tool_name, None)
+        pending_executions.pop(tool_name, None)
         return False, "Tool execution rejected: pending execution is stale."
 
     registration = _select_registered_tool(tool_name)
     if registration is None:
-        _pending_tool_executions.pop(tool_name, None)
+        pending_executions.pop(tool_name, None)
         return False, "Tool execution rejected: tool registration drift detected."
 
     if str(registration.get("tool_draft_id", "")) != str(pending.get("tool_draft_id", "")):
-        _pending_tool_executions.pop(tool_name, None)
+        pending_executions.pop(tool_name, None)
         return False, "Tool execution rejected: pending execution drift detected."
 
     payload = pending.get("payload")
     if not isinstance(payload, dict):
-        _pending_tool_executions.pop(tool_name, None)
+        pending_executions.pop(tool_name, None)
         return False, "Tool execution rejected: pending payload is invalid."
     if _compute_payload_hash(payload) != str(pending.get("payload_hash", "")):
-        _pending_tool_executions.pop(tool_name, None)
+        pending_executions.pop(tool_name, None)
         return False, "Tool execution rejected: pending payload drift detected."
 
-    _pending_tool_executions.pop(tool_name, None)
+    pending_executions.pop(tool_name, None)
     success, audit, message = _execute_pending_tool(prepared=pending, trace_id=trace_id)
     lines = [
         "TOOL_EXECUTION_RESULT",
@@ -2238,11 +2280,11 @@ def _validate_apply_payload(draft: Dict[str, Any]) -> tuple[bool, str, List[Dict
 
 
 def _apply_cdm_draft(draft_id: str) -> tuple[bool, str]:
-    draft = _cdm_drafts.get(draft_id)
+    draft = _session_state().cdm_drafts.get(draft_id)
     if draft is None:
         return False, "Apply rejected: draft_id does not exist."
 
-    approvals = _approved_drafts.get(draft_id)
+    approvals = _session_state().approved_drafts.get(draft_id)
     if not approvals:
         return False, "Apply rejected: draft is not approved."
     approval_record = approvals[-1]
@@ -3456,23 +3498,7 @@ def _resolution_fingerprints(bundle, outcome) -> tuple[str, str]:
 
 
 def _find_resolution_record(task_id: str, fingerprint: str | None = None) -> dict | None:
-    path = _execution_journal.records_path
-    if not path.exists():
-        return None
-    for line in path.read_text(encoding="utf-8").splitlines():
-        if not line.strip():
-            continue
-        try:
-            record = json.loads(line)
-        except Exception:
-            continue
-        payload = record.get("resolution")
-        if not payload:
-            continue
-        if payload.get("task_id") != task_id:
-            continue
-        if payload.get("terminal") is not True:
-            continue
+    for payload in _execution_journal.resolution_records(task_id):
         if payload.get("contract_version") != M27_CONTRACT_VERSION:
             raise RuntimeError("Resolution contract version mismatch in journal.")
         if fingerprint is None or payload.get("evidence_fingerprint") == fingerprint:
@@ -3624,8 +3650,8 @@ def _run_deterministic_loop(user_input: str, trace_id: str) -> dict:
                 task_context = build_task(task.task_id, task.description)
                 outcome = resolve_task(task_context, evidence_bundle, inspection_meta).outcome
                 _validate_resolution_outcome(outcome)
-                _last_introspection_snapshot[task.task_id] = snapshot
-                _last_resolution[task.task_id] = outcome
+                _session_state().last_introspection_snapshot[task.task_id] = snapshot
+                _session_state().last_resolution[task.task_id] = outcome
                 evidence_fp, resolution_fp = _resolution_fingerprints(evidence_bundle, outcome)
                 existing_record = _find_resolution_record(task.task_id, resolution_fp)
                 if existing_record is None:
@@ -3680,14 +3706,14 @@ def _run_deterministic_loop(user_input: str, trace_id: str) -> dict:
                     task_origination=task_origination_block,
                     snapshot_block=_render_introspection_snapshot(snapshot, task.task_id),
                 )
-            outcome = _last_resolution.get(task.task_id)
-            snapshot = _last_introspection_snapshot.get(task.task_id)
+            outcome = _session_state().last_resolution.get(task.task_id)
+            snapshot = _session_state().last_introspection_snapshot.get(task.task_id)
             if outcome is None and snapshot is not None:
                 evidence_bundle, inspection_meta = build_evidence_bundle_from_snapshot(snapshot)
                 task_context = build_task(task.task_id, task.description)
                 outcome = resolve_task(task_context, evidence_bundle, inspection_meta).outcome
                 _validate_resolution_outcome(outcome)
-                _last_resolution[task.task_id] = outcome
+                _session_state().last_resolution[task.task_id] = outcome
             if outcome is None:
                 task_context = build_task(task.task_id, task.description)
                 inspection_meta = InspectionMeta(
@@ -3698,7 +3724,7 @@ def _run_deterministic_loop(user_input: str, trace_id: str) -> dict:
                 )
                 outcome = resolve_task(task_context, empty_evidence_bundle(), inspection_meta).outcome
                 _validate_resolution_outcome(outcome)
-                _last_resolution[task.task_id] = outcome
+                _session_state().last_resolution[task.task_id] = outcome
             else:
                 _validate_resolution_outcome(outcome)
             evidence_bundle = empty_evidence_bundle()
@@ -4272,13 +4298,14 @@ def _normalize_service_name(name: str) -> str:
 
 
 def _build_atomic_ops_plan(verb: str, target: str) -> str | None:
-    if not _last_inspection:
+    last_inspection = _session_state().last_inspection
+    if not last_inspection:
         return None
 
-    systemd_units = set(_last_inspection.get("systemd_units", []))
-    systemd_lines = _last_inspection.get("systemd_lines", {})
-    docker_names = set(_last_inspection.get("docker_names", []))
-    docker_lines = _last_inspection.get("docker_lines", {})
+    systemd_units = set(last_inspection.get("systemd_units", []))
+    systemd_lines = last_inspection.get("systemd_lines", {})
+    docker_names = set(last_inspection.get("docker_names", []))
+    docker_lines = last_inspection.get("docker_lines", {})
 
     normalized = _normalize_service_name(target)
     unit_name = normalized if normalized in systemd_units else target
@@ -4293,7 +4320,7 @@ def _build_atomic_ops_plan(verb: str, target: str) -> str | None:
     if not use_systemd and not use_docker:
         return None
 
-    timestamp = _last_inspection.get("timestamp", "unknown")
+    timestamp = last_inspection.get("timestamp", "unknown")
 
     if use_systemd:
         observed_line = systemd_lines.get(unit_name, f"{unit_name} (observed in systemd)")
@@ -4397,8 +4424,9 @@ def _parse_docker_lines(output: str) -> tuple[set[str], dict[str, str]]:
 
 
 def _record_inspection(data: dict) -> None:
-    _last_inspection.clear()
-    _last_inspection.update(data)
+    last_inspection = _session_state().last_inspection
+    last_inspection.clear()
+    last_inspection.update(data)
 
 
 def _inspect_barn(query: str) -> str:
@@ -4675,6 +4703,173 @@ _capability_registry.register({
 })
 
 
+class _TurnPreClassifier:
+    """
+    Single-pass screen for the conversation-layer routes of run_turn.
+
+    Each family lists trigger substrings such that every utterance its
+    predicates accept contains at least one of them once lowercased and
+    whitespace-collapsed (the normalization the predicates apply). classify()
+    finds every trigger occurrence with one scan of a compiled alternation and
+    returns the families present; routes of absent families cannot match and
+    are skipped.
+    """
+
+    def __init__(self, triggers: Dict[str, Tuple[str, ...]]) -> None:
+        families_by_trigger: Dict[str, set[str]] = {}
+        for family, phrases in triggers.items():
+            for phrase in phrases:
+                families_by_trigger.setdefault(phrase, set()).add(family)
+        # Longest first, so a match reports the longest trigger at its position.
+        # Shorter triggers starting there are its prefixes: fold their families in.
+        ordered = sorted(families_by_trigger, key=len, reverse=True)
+        self._families = {
+            trigger: frozenset().union(
+                *(families for prefix, families in families_by_trigger.items() if trigger.startswith(prefix))
+            )
+            for trigger in ordered
+        }
+        self._pattern = re.compile("(?=(" + "|".join(re.escape(trigger) for trigger in ordered) + "))")
+
+    def classify(self, utterance: str) -> frozenset[str]:
+        lowered = re.sub(r"\s+", " ", str(utterance or "").strip().lower())
+        found: set[str] = set()
+        for match in self._pattern.finditer(lowered):
+            found |= self._families[match.group(1)]
+        return frozenset(found)
+
+
+_CONVERSATION_LAYER_TRIGGERS: Dict[str, Tuple[str, ...]] = {
+    "session_summary": (
+        _SESSION_SUMMARY_DISCARD_PHRASES + _SESSION_SUMMARY_RESUME_PHRASES + _SESSION_SUMMARY_PAUSE_PHRASES
+    ),
+    "critique": _CRITIQUE_OFFER_PHRASES,
+    "goal": ("goal", "objective", "end up with"),
+    "constraint": ("constraint", "we must", "do not", "keep it ", "no "),
+    "assumption": ("assum",),
+    "decision": ("decision", "go with", "the plan"),
+    "task_mode": (
+        "task mode",
+        "work mode",
+        "brainstorm",
+        "step by step",
+        "step-by-step",
+        "critique",
+        "compare",
+        "summar",
+    ),
+    "role": ("role", "teacher", "senior", "architect", "product", "researcher", "coach"),
+    "tone": (
+        "tone",
+        "concise",
+        "short",
+        "brief",
+        "detail",
+        "step by step",
+        "step-by-step",
+        "verbosity",
+        "direct",
+        "what to do",
+        "options",
+        "exploratory",
+        "gentle",
+        "soften",
+        "firm",
+        "confident",
+    ),
+    "preference": ("preferences", "css", "html", "keep it simple", "styled", "markdown"),
+    "website": _WEBSITE_BUILD_TARGET_TOKENS,
+}
+
+_TURN_PRECLASSIFIER = _TurnPreClassifier(_CONVERSATION_LAYER_TRIGGERS)
+
+# Conversation-layer routes of run_turn in precedence order: (trigger family,
+# BillyRuntime method). Routes with no family depend on session state rather
+# than wording and always run.
+_CONVERSATION_LAYER_ROUTES: Tuple[Tuple[str | None, str], ...] = (
+    ("session_summary", "_route_session_summary_recall"),
+    ("critique", "_route_critique_offer"),
+    ("session_summary", "_route_session_summary_offer"),
+    ("goal", "_route_goal_register"),
+    (None, "_route_goal_misalignment"),
+    ("constraint", "_route_constraint_register"),
+    (None, "_route_constraint_conflict"),
+    ("assumption", "_route_assumption_register"),
+    ("decision", "_route_decision_register"),
+    ("task_mode", "_route_task_mode"),
+    ("role", "_route_role_framing"),
+    ("tone", "_route_tone_preference"),
+    ("preference", "_route_session_preference"),
+    (None, "_route_task_artifact"),
+    ("website", "_route_website_preflight"),
+)
+
+
+# Receives answer text as it streams, set by BillyRuntime.ask(on_delta=...) for one turn.
+_ANSWER_DELTA_SINK: ContextVar[Callable[[str], None] | None] = ContextVar("answer_delta_sink", default=None)
+# Whether the current _llm_answer call may stream, see BillyRuntime._streaming_llm_answer.
+_ANSWER_STREAM_ENABLED: ContextVar[bool] = ContextVar("answer_stream_enabled", default=False)
+
+_TRAILING_WORD_RE = re.compile(r"\s+\S*\Z")
+
+
+class _AnswerDeltaGuard:
+    """
+    Forwards streamed LLM deltas with the identity rewrite applied, holding back
+    whatever the whole-answer post-processing could still change: leading
+    whitespace, the trailing (possibly partial) word, and text that may yet turn
+    out to be a terminal filler phrase. The rewrites are word-bounded, so
+    rewriting whitespace-delimited segments matches rewriting the whole answer.
+
+    Words that could still complete a THIRD_PERSON_BLOCKLIST phrase are held
+    too, in any case, and once a rewritten segment contains such a phrase
+    nothing more is forwarded: _identity_guard will refuse the whole answer.
+    """
+
+    def __init__(self, rewrite: Callable[[str], str], sink: Callable[[str], None]) -> None:
+        self._rewrite = rewrite
+        self._sink = sink
+        self._buffer = ""
+        self._started = False
+        self._refused = False
+
+    def feed(self, delta: str) -> None:
+        if self._refused:
+            return
+        self._buffer += delta
+        if not self._started:
+            self._buffer = self._buffer.lstrip()
+            candidate = self._buffer.strip().lower().rstrip(".!?")
+            if any(phrase.startswith(candidate) for phrase in _TERMINAL_FILLER_PHRASES):
+                return
+        trailing = _TRAILING_WORD_RE.search(self._buffer)
+        cut = _blocklist_prefix_start(self._buffer[: trailing.start()] if trailing else "")
+        if cut <= 0:
+            return
+        segment, self._buffer = self._buffer[:cut], self._buffer[cut:]
+        rewritten = self._rewrite(segment)
+        if any(phrase in rewritten.lower() for phrase in THIRD_PERSON_BLOCKLIST):
+            self._refused = True
+            return
+        self._started = True
+        self._sink(rewritten)
+
+
+def _blocklist_prefix_start(segment: str) -> int:
+    """
+    Where the words at the end of segment start to spell a proper prefix of a
+    THIRD_PERSON_BLOCKLIST phrase (case-insensitively, any whitespace between
+    words, as the identity rewrite matches them), or len(segment).
+    """
+    longest = max(len(phrase.split()) for phrase in THIRD_PERSON_BLOCKLIST)
+    starts = [match.start() for match in re.finditer(r"\S+", segment)][-longest:]
+    for start in starts:
+        tail = " ".join(segment[start:].lower().split())
+        if any(phrase.startswith(tail) and phrase != tail for phrase in THIRD_PERSON_BLOCKLIST):
+            return start
+    return len(segment)
+
+
 def _run_demo_tool(trace_id: str):
     return _docker_runner.run(
         tool_id="demo.hello",
@@ -11866,6 +12061,13 @@ class BillyRuntime:
         if not isinstance(answer, str):
             answer = str(answer)
 
+        normalized = self._identity_rewrite(answer)
+        lowered = normalized.lower()
+        if any(phrase in lowered for phrase in THIRD_PERSON_BLOCKLIST):
+            raise RuntimeError("Identity normalization failed: third-person Billy reference remained.")
+        return normalized
+
+    def _identity_rewrite(self, answer: str) -> str:
         normalized = answer
         # Targeted phrase rewrites for known third-person drift.
         normalized = re.sub(r"\b[Bb]illy\s+must\b", "I must", normalized)
@@ -11877,10 +12079,6 @@ class BillyRuntime:
         normalized = re.sub(r"\b[Bb]illy\b", "I", normalized)
         normalized = re.sub(r"\b[Cc]had's\b", "your", normalized)
         normalized = re.sub(r"\b[Cc]had\b", "you", normalized)
-
-        lowered = normalized.lower()
-        if any(phrase in lowered for phrase in THIRD_PERSON_BLOCKLIST):
-            raise RuntimeError("Identity normalization failed: third-person Billy reference remained.")
         return normalized
 
     def _load_config_from_yaml(self) -> Dict[str, Any]:
@@ -11926,6 +12124,32 @@ class BillyRuntime:
             return ""
         return str(final_output)
 
+    def _conversational_framing_active(self) -> bool:
+        """
+        True when session framing (tone, role, task mode, references) may rewrite a conversational answer.
+        """
+        return bool(
+            self._session_tone
+            or self._effective_role_framing() is not None
+            or self._effective_task_mode() is not None
+            or self._latest_active_goal() is not None
+            or self._latest_active_constraint() is not None
+            or self._latest_active_assumption() is not None
+            or self._latest_session_decision() is not None
+        )
+
+    def _streaming_llm_answer(self, prompt: str, enabled: bool = True) -> str:
+        """
+        _llm_answer that forwards the answer to the turn's delta sink (see ask) as
+        it arrives. Only for callers whose final output is the answer after
+        _replace_terminal_filler.
+        """
+        token = _ANSWER_STREAM_ENABLED.set(enabled)
+        try:
+            return self._llm_answer(prompt)
+        finally:
+            _ANSWER_STREAM_ENABLED.reset(token)
+
     def _llm_answer(self, prompt: str) -> str:
         if llm_api is None:
             return "I encountered an error trying to connect to the model provider."
@@ -11942,7 +12166,12 @@ class BillyRuntime:
             {"role": "system", "content": system_prompt},
             {"role": "user", "content": prompt},
         ]
-        answer = llm_api.get_completion(messages, model_config)
+        sink = _ANSWER_DELTA_SINK.get() if _ANSWER_STREAM_ENABLED.get() else None
+        if sink is not None:
+            guard = _AnswerDeltaGuard(self._identity_rewrite, sink)
+            answer = llm_api.get_completion(messages, model_config, on_delta=guard.feed)
+        else:
+            answer = llm_api.get_completion(messages, model_config)
         if not isinstance(answer, str):
             answer = str(answer)
         return self._identity_guard(prompt, answer)
@@ -11950,22 +12179,269 @@ class BillyRuntime:
     def get_captured_content_last(self, count: int) -> List[Dict[str, Any]]:
         return [item.to_dict() for item in self._content_capture_store.get_last(count)]
 
-    def ask(self, prompt: str) -> str:
+    def ask(self, prompt: str, on_delta: Callable[[str], None] | None = None) -> str:
         """
         User-facing chat entrypoint.
 
         This is the method called by:
         - /v1/chat/completions
         - CLI main.py
+
+        When the turn is answered directly by the LLM, on_delta receives the
+        answer text as it streams. The streamed text is always a prefix of the
+        returned answer; the caller sends the rest (all of it for governed turns).
         """
         normalized = prompt.strip()
         if not normalized:
             return ""
 
         trace_id = f"trace-{int(time.time() * 1000)}"
-        result = self.run_turn(prompt, {"trace_id": trace_id})
+        token = _ANSWER_DELTA_SINK.set(on_delta)
+        try:
+            result = self.run_turn(prompt, {"trace_id": trace_id})
+        finally:
+            _ANSWER_DELTA_SINK.reset(token)
         return self._render_user_output(result)
 
+    def _route_conversation_layer(self, utterance: str, trace_id: str) -> Dict[str, Any] | None:
+        families = _TURN_PRECLASSIFIER.classify(utterance)
+        for family, route in _CONVERSATION_LAYER_ROUTES:
+            if family is not None and family not in families:
+                continue
+            response = getattr(self, route)(utterance, trace_id)
+            if response is not None:
+                return response
+        return None
+
+    def _route_session_summary_recall(self, utterance: str, trace_id: str) -> Dict[str, Any] | None:
+        if self._is_session_summary_discard_request(utterance):
+            return self._build_session_summary_discard_response(trace_id=trace_id)
+        if self._session_summary_resume_signal(utterance) is not None:
+            resume_response = self._build_session_summary_resume_response(trace_id=trace_id)
+            if resume_response is not None:
+                return resume_response
+        return None
+
+    def _route_critique_offer(self, utterance: str, trace_id: str) -> Dict[str, Any] | None:
+        if self._is_critique_invitation(utterance) and self._has_critique_context():
+            return self._build_critique_offer_response(trace_id=trace_id)
+        return None
+
+    def _route_session_summary_offer(self, utterance: str, trace_id: str) -> Dict[str, Any] | None:
+        if self._should_offer_session_summary(utterance):
+            return self._build_session_summary_offer_response(trace_id=trace_id)
+        return None
+
+    def _route_goal_register(self, utterance: str, trace_id: str) -> Dict[str, Any] | None:
+        goal_reset_mode = self._goal_reset_mode(utterance)
+        if goal_reset_mode is not None:
+            return self._build_goal_reset_response(
+                mode=goal_reset_mode,
+                trace_id=trace_id,
+            )
+        if self._is_goal_list_request(utterance):
+            return self._build_goal_list_response(trace_id=trace_id)
+        if self._is_goal_reorder_request(utterance):
+            return self._build_goal_reorder_response(trace_id=trace_id)
+        goal_update_candidate = self._extract_goal_update_candidate(utterance)
+        if goal_update_candidate is not None:
+            if str(goal_update_candidate.get("error", "")).strip() == "no_active_goal":
+                return {
+                    "final_output": "No active goal exists to update.",
+                    "tool_calls": [],
+                    "status": "success",
+                    "trace_id": trace_id,
+                    "mode": "conversation_layer",
+                    "execution_enabled": False,
+                    "advisory_only": True,
+                }
+            if str(goal_update_candidate.get("error", "")).strip() == "needs_replacement":
+                return self._build_goal_update_guidance_response(trace_id=trace_id)
+            return self._build_goal_capture_confirmation_response(
+                candidate=goal_update_candidate,
+                trace_id=trace_id,
+            )
+        goal_candidate = self._extract_goal_candidate(utterance)
+        if goal_candidate is not None:
+            return self._build_goal_capture_confirmation_response(
+                candidate=goal_candidate,
+                trace_id=trace_id,
+            )
+        return None
+
+    def _route_goal_misalignment(self, utterance: str, trace_id: str) -> Dict[str, Any] | None:
+        goal_misalignment = self._active_goal_misalignment(utterance)
+        if goal_misalignment is not None:
+            return self._build_goal_misalignment_response(
+                misalignment=goal_misalignment,
+                request_utterance=utterance,
+                trace_id=trace_id,
+            )
+        return None
+
+    def _route_constraint_register(self, utterance: str, trace_id: str) -> Dict[str, Any] | None:
+        constraint_reset_mode = self._constraint_reset_mode(utterance)
+        if constraint_reset_mode is not None:
+            return self._build_constraint_reset_response(
+                mode=constraint_reset_mode,
+                trace_id=trace_id,
+            )
+        if self._is_constraint_list_request(utterance):
+            return self._build_constraint_list_response(trace_id=trace_id)
+        constraint_change_candidate = self._extract_constraint_change_candidate(utterance)
+        if constraint_change_candidate is not None:
+            if str(constraint_change_candidate.get("error", "")).strip() == "no_active_constraint":
+                return {
+                    "final_output": "No active constraint exists to change.",
+                    "tool_calls": [],
+                    "status": "success",
+                    "trace_id": trace_id,
+                    "mode": "conversation_layer",
+                    "execution_enabled": False,
+                    "advisory_only": True,
+                }
+            if str(constraint_change_candidate.get("error", "")).strip() == "needs_replacement":
+                return self._build_constraint_change_guidance_response(trace_id=trace_id)
+            return self._build_constraint_capture_confirmation_response(
+                candidate=constraint_change_candidate,
+                trace_id=trace_id,
+            )
+        constraint_candidate = self._extract_constraint_candidate(utterance)
+        if constraint_candidate is not None:
+            return self._build_constraint_capture_confirmation_response(
+                candidate=constraint_candidate,
+                trace_id=trace_id,
+            )
+        return None
+
+    def _route_constraint_conflict(self, utterance: str, trace_id: str) -> Dict[str, Any] | None:
+        constraint_conflict = self._active_constraint_conflict(utterance)
+        if constraint_conflict is not None:
+            return self._build_constraint_conflict_response(
+                conflict=constraint_conflict,
+                request_utterance=utterance,
+                trace_id=trace_id,
+            )
+        return None
+
+    def _route_assumption_register(self, utterance: str, trace_id: str) -> Dict[str, Any] | None:
+        assumption_reset_mode = self._assumption_reset_mode(utterance)
+        if assumption_reset_mode is not None:
+            return self._build_assumption_reset_response(
+                mode=assumption_reset_mode,
+                trace_id=trace_id,
+            )
+        if self._is_assumption_confirm_request(utterance):
+            if self._latest_active_assumption() is None:
+                accepted_candidate = self._extract_assumption_candidate(utterance)
+                if accepted_candidate is not None:
+                    return self._build_assumption_capture_confirmation_response(
+                        candidate=accepted_candidate,
+                        trace_id=trace_id,
+                    )
+            return self._build_assumption_confirm_response(trace_id=trace_id)
+        assumption_change_candidate = self._extract_assumption_change_candidate(utterance)
+        if assumption_change_candidate is not None:
+            if str(assumption_change_candidate.get("error", "")).strip() == "no_active_assumption":
+                return {
+                    "final_output": "No active assumption exists to change.",
+                    "tool_calls": [],
+                    "status": "success",
+                    "trace_id": trace_id,
+                    "mode": "conversation_layer",
+                    "execution_enabled": False,
+                    "advisory_only": True,
+                }
+            if str(assumption_change_candidate.get("error", "")).strip() == "needs_replacement":
+                return self._build_assumption_change_guidance_response(trace_id=trace_id)
+            return self._build_assumption_capture_confirmation_response(
+                candidate=assumption_change_candidate,
+                trace_id=trace_id,
+            )
+        assumption_candidate = self._extract_assumption_candidate(utterance)
+        if assumption_candidate is not None:
+            return self._build_assumption_capture_confirmation_response(
+                candidate=assumption_candidate,
+                trace_id=trace_id,
+            )
+        return None
+
+    def _route_decision_register(self, utterance: str, trace_id: str) -> Dict[str, Any] | None:
+        decision_reset_mode = self._decision_reset_mode(utterance)
+        if decision_reset_mode is not None:
+            return self._build_decision_reset_response(
+                mode=decision_reset_mode,
+                trace_id=trace_id,
+            )
+        decision_candidate = self._extract_decision_candidate(utterance)
+        if decision_candidate is not None:
+            return self._build_decision_capture_confirmation_response(
+                candidate=decision_candidate,
+                trace_id=trace_id,
+            )
+        return None
+
+    def _route_task_mode(self, utterance: str, trace_id: str) -> Dict[str, Any] | None:
+        if self._is_task_mode_reset_request(utterance):
+            return self._build_task_mode_reset_response(trace_id=trace_id)
+        task_mode_candidate = self._extract_task_mode_candidate(utterance)
+        if task_mode_candidate is not None:
+            return self._build_task_mode_capture_confirmation_response(
+                task_mode=task_mode_candidate,
+                trace_id=trace_id,
+            )
+        return None
+
+    def _route_role_framing(self, utterance: str, trace_id: str) -> Dict[str, Any] | None:
+        if self._is_role_reset_request(utterance):
+            return self._build_role_reset_response(trace_id=trace_id)
+        role_candidate = self._extract_role_framing_candidate(utterance)
+        if role_candidate is not None:
+            return self._build_role_framing_confirmation_response(
+                role_name=role_candidate,
+                trace_id=trace_id,
+            )
+        return None
+
+    def _route_tone_preference(self, utterance: str, trace_id: str) -> Dict[str, Any] | None:
+        if self._is_tone_reset_request(utterance):
+            return self._build_tone_reset_response(trace_id=trace_id)
+        tone_candidate = self._extract_tone_preference_candidate(utterance)
+        if tone_candidate is not None:
+            return self._build_tone_preference_confirmation_response(
+                candidate=tone_candidate,
+                trace_id=trace_id,
+            )
+        return None
+
+    def _route_session_preference(self, utterance: str, trace_id: str) -> Dict[str, Any] | None:
+        if self._is_preference_reset_request(utterance):
+            return self._build_preference_reset_response(trace_id=trace_id)
+        preference_candidate = self._extract_session_preference_candidate(utterance)
+        if preference_candidate is not None:
+            return self._build_preference_capture_confirmation_response(
+                candidate=preference_candidate,
+                trace_id=trace_id,
+            )
+        return None
+
+    def _route_task_artifact(self, utterance: str, trace_id: str) -> Dict[str, Any] | None:
+        artifact_response = self._handle_task_artifact_turn(
+            user_input=utterance,
+            trace_id=trace_id,
+        )
+        if artifact_response is not None:
+            return artifact_response
+        return None
+
+    def _route_website_preflight(self, utterance: str, trace_id: str) -> Dict[str, Any] | None:
+        if self._should_trigger_website_preflight(utterance):
+            return self._build_website_preflight_response(
+                utterance=utterance,
+                trace_id=trace_id,
+            )
+        return None
+
     def run_turn(self, user_input: str, session_context: Dict[str, Any]):
         trace_id = session_context.get("trace_id") if isinstance(session_context, dict) else None
         if not trace_id:
@@ -12047,190 +12523,9 @@ class BillyRuntime:
             )
 
         if not should_route_aci:
-            if self._is_session_summary_discard_request(normalized_input):
-                return self._build_session_summary_discard_response(trace_id=trace_id)
-            if self._session_summary_resume_signal(normalized_input) is not None:
-                resume_response = self._build_session_summary_resume_response(trace_id=trace_id)
-                if resume_response is not None:
-                    return resume_response
-            if self._is_critique_invitation(normalized_input) and self._has_critique_context():
-                return self._build_critique_offer_response(trace_id=trace_id)
-            if self._should_offer_session_summary(normalized_input):
-                return self._build_session_summary_offer_response(trace_id=trace_id)
-            goal_reset_mode = self._goal_reset_mode(normalized_input)
-            if goal_reset_mode is not None:
-                return self._build_goal_reset_response(
-                    mode=goal_reset_mode,
-                    trace_id=trace_id,
-                )
-            if self._is_goal_list_request(normalized_input):
-                return self._build_goal_list_response(trace_id=trace_id)
-            if self._is_goal_reorder_request(normalized_input):
-                return self._build_goal_reorder_response(trace_id=trace_id)
-            goal_update_candidate = self._extract_goal_update_candidate(normalized_input)
-            if goal_update_candidate is not None:
-                if str(goal_update_candidate.get("error", "")).strip() == "no_active_goal":
-                    return {
-                        "final_output": "No active goal exists to update.",
-                        "tool_calls": [],
-                        "status": "success",
-                        "trace_id": trace_id,
-                        "mode": "conversation_layer",
-                        "execution_enabled": False,
-                        "advisory_only": True,
-                    }
-                if str(goal_update_candidate.get("error", "")).strip() == "needs_replacement":
-                    return self._build_goal_update_guidance_response(trace_id=trace_id)
-                return self._build_goal_capture_confirmation_response(
-                    candidate=goal_update_candidate,
-                    trace_id=trace_id,
-                )
-            goal_candidate = self._extract_goal_candidate(normalized_input)
-            if goal_candidate is not None:
-                return self._build_goal_capture_confirmation_response(
-                    candidate=goal_candidate,
-                    trace_id=trace_id,
-                )
-            goal_misalignment = self._active_goal_misalignment(normalized_input)
-            if goal_misalignment is not None:
-                return self._build_goal_misalignment_response(
-                    misalignment=goal_misalignment,
-                    request_utterance=normalized_input,
-                    trace_id=trace_id,
-                )
-            constraint_reset_mode = self._constraint_reset_mode(normalized_input)
-            if constraint_reset_mode is not None:
-                return self._build_constraint_reset_response(
-                    mode=constraint_reset_mode,
-                    trace_id=trace_id,
-                )
-            if self._is_constraint_list_request(normalized_input):
-                return self._build_constraint_list_response(trace_id=trace_id)
-            constraint_change_candidate = self._extract_constraint_change_candidate(normalized_input)
-            if constraint_change_candidate is not None:
-                if str(constraint_change_candidate.get("error", "")).strip() == "no_active_constraint":
-                    return {
-                        "final_output": "No active constraint exists to change.",
-                        "tool_calls": [],
-                        "status": "success",
-                        "trace_id": trace_id,
-                        "mode": "conversation_layer",
-                        "execution_enabled": False,
-                        "advisory_only": True,
-                    }
-                if str(constraint_change_candidate.get("error", "")).strip() == "needs_replacement":
-                    return self._build_constraint_change_guidance_response(trace_id=trace_id)
-                return self._build_constraint_capture_confirmation_response(
-                    candidate=constraint_change_candidate,
-                    trace_id=trace_id,
-                )
-            constraint_candidate = self._extract_constraint_candidate(normalized_input)
-            if constraint_candidate is not None:
-                return self._build_constraint_capture_confirmation_response(
-                    candidate=constraint_candidate,
-                    trace_id=trace_id,
-                )
-            constraint_conflict = self._active_constraint_conflict(normalized_input)
-            if constraint_conflict is not None:
-                return self._build_constraint_conflict_response(
-                    conflict=constraint_conflict,
-                    request_utterance=normalized_input,
-                    trace_id=trace_id,
-                )
-            assumption_reset_mode = self._assumption_reset_mode(normalized_input)
-            if assumption_reset_mode is not None:
-                return self._build_assumption_reset_response(
-                    mode=assumption_reset_mode,
-                    trace_id=trace_id,
-                )
-            if self._is_assumption_confirm_request(normalized_input):
-                if self._latest_active_assumption() is None:
-                    accepted_candidate = self._extract_assumption_candidate(normalized_input)
-                    if accepted_candidate is not None:
-                        return self._build_assumption_capture_confirmation_response(
-                            candidate=accepted_candidate,
-                            trace_id=trace_id,
-                        )
-                return self._build_assumption_confirm_response(trace_id=trace_id)
-            assumption_change_candidate = self._extract_assumption_change_candidate(normalized_input)
-            if assumption_change_candidate is not None:
-                if str(assumption_change_candidate.get("error", "")).strip() == "no_active_assumption":
-                    return {
-                        "final_output": "No active assumption exists to change.",
-                        "tool_calls": [],
-                        "status": "success",
-                        "trace_id": trace_id,
-                        "mode": "conversation_layer",
-                        "execution_enabled": False,
-                        "advisory_only": True,
-                    }
-                if str(assumption_change_candidate.get("error", "")).strip() == "needs_replacement":
-                    return self._build_assumption_change_guidance_response(trace_id=trace_id)
-                return self._build_assumption_capture_confirmation_response(
-                    candidate=assumption_change_candidate,
-                    trace_id=trace_id,
-                )
-            assumption_candidate = self._extract_assumption_candidate(normalized_input)
-            if assumption_candidate is not None:
-                return self._build_assumption_capture_confirmation_response(
-                    candidate=assumption_candidate,
-                    trace_id=trace_id,
-                )
-            decision_reset_mode = self._decision_reset_mode(normalized_input)
-            if decision_reset_mode is not None:
-                return self._build_decision_reset_response(
-                    mode=decision_reset_mode,
-                    trace_id=trace_id,
-                )
-            decision_candidate = self._extract_decision_candidate(normalized_input)
-            if decision_candidate is not None:
-                return self._build_decision_capture_confirmation_response(
-                    candidate=decision_candidate,
-                    trace_id=trace_id,
-                )
-            if self._is_task_mode_reset_request(normalized_input):
-                return self._build_task_mode_reset_response(trace_id=trace_id)
-            task_mode_candidate = self._extract_task_mode_candidate(normalized_input)
-            if task_mode_candidate is not None:
-                return self._build_task_mode_capture_confirmation_response(
-                    task_mode=task_mode_candidate,
-                    trace_id=trace_id,
-                )
-            if self._is_role_reset_request(normalized_input):
-                return self._build_role_reset_response(trace_id=trace_id)
-            role_candidate = self._extract_role_framing_candidate(normalized_input)
-            if role_candidate is not None:
-                return self._build_role_framing_confirmation_response(
-                    role_name=role_candidate,
-                    trace_id=trace_id,
-                )
-            if self._is_tone_reset_request(normalized_input):
-                return self._build_tone_reset_response(trace_id=trace_id)
-            tone_candidate = self._extract_tone_preference_candidate(normalized_input)
-            if tone_candidate is not None:
-                return self._build_tone_preference_confirmation_response(
-                    candidate=tone_candidate,
-                    trace_id=trace_id,
-                )
-            if self._is_preference_reset_request(normalized_input):
-                return self._build_preference_reset_response(trace_id=trace_id)
-            preference_candidate = self._extract_session_preference_candidate(normalized_input)
-            if preference_candidate is not None:
-                return self._build_preference_capture_confirmation_response(
-                    candidate=preference_candidate,
-                    trace_id=trace_id,
-                )
-            artifact_response = self._handle_task_artifact_turn(
-                user_input=normalized_input,
-                trace_id=trace_id,
-            )
-            if artifact_response is not None:
-                return artifact_response
-            if self._should_trigger_website_preflight(normalized_input):
-                return self._build_website_preflight_response(
-                    utterance=normalized_input,
-                    trace_id=trace_id,
-                )
+            conversation_response = self._route_conversation_layer(normalized_input, trace_id)
+            if conversation_response is not None:
+                return conversation_response
 
         plan_signal = self._plan_advancement_signal(normalized_input)
         if not should_route_aci and plan_signal is not None:
@@ -12742,7 +13037,7 @@ class BillyRuntime:
             prompt = interaction_dispatch.get("payload", normalized_input)
             if not isinstance(prompt, str) or not prompt.strip():
                 prompt = normalized_input
-            generated_text = self._llm_answer(prompt)
+            generated_text = self._streaming_llm_answer(prompt)
             generated_text = self._replace_terminal_filler(generated_text)
             self._last_content_generation_response = {
                 "text": generated_text,
@@ -13056,7 +13351,12 @@ class BillyRuntime:
                                     self._apply_task_mode_to_conversational_text(
                                         self._apply_role_framing_to_conversational_text(
                                             self._apply_tone_to_conversational_text(
-                                                self._replace_terminal_filler(self._llm_answer(route_payload))
+                                                self._replace_terminal_filler(
+                                                    self._streaming_llm_answer(
+                                                        route_payload,
+                                                        enabled=not self._conversational_framing_active(),
+                                                    )
+                                                )
                                             )
                                         )
                                     )
@@ -13296,7 +13596,7 @@ class BillyRuntime:
         approve_parts = normalized_input.split()
         if len(approve_parts) == 2 and approve_parts[0] == "APPROVE":
             approval_id = approve_parts[1]
-            proposal = _pending_exec_proposals.get(approval_id)
+            proposal = _session_state().pending_exec_proposals.get(approval_id)
             if not proposal:
                 return {
                     "final_output": "Approval rejected: unknown or expired proposal id.",
@@ -13361,7 +13661,7 @@ class BillyRuntime:
                     "limits_remaining": limits_remaining,
                 },
             )
-            _pending_exec_proposals.pop(approval_id, None)
+            _session_state().pending_exec_proposals.pop(approval_id, None)
 
             response = "\n".join(
                 [
@@ -13603,7 +13903,7 @@ class BillyRuntime:
                     ],
                     "branch": branch,
                 }
-                _pending_exec_proposals[proposal_id] = proposal
+                _session_state().pending_exec_proposals[proposal_id] = proposal
                 _journal_exec_contract("proposal", proposal)
 
                 response = "\n".join(
@@ -13635,7 +13935,7 @@ class BillyRuntime:
                 "risk": preset.get("risk_level", "low") if action else "low",
                 "expected_result": expected_result,
             }
-            _pending_exec_proposals[proposal_id] = proposal
+            _session_state().pending_exec_proposals[proposal_id] = proposal
             _journal_exec_contract("proposal", proposal)
 
             response = "\n".join(
@@ -14456,7 +14756,7 @@ class BillyRuntime:
             }
 
         return {
-            "final_output": self._replace_terminal_filler(self._llm_answer(user_input)),
+            "final_output": self._replace_terminal_filler(self._streaming_llm_answer(user_input)),
             "tool_calls": [],
             "status": "success",
             "trace_id": trace_id,
@@ -0,0 +1,208 @@
+"""
+Session-scoped conversation state.
+
+runtime.py keeps conversation-scoped stores (drafts, pending proposals and
+executions, workflows, inspection results) at module level. SessionState
+holds one set of those stores; session_scope() makes a SessionState current
+for the duration of a turn, and the runtime always reaches its stores via
+current_session_state(). Outside any scope the process-wide default state is
+used, which is what the CLI and single-session callers see.
+
+SessionRegistry maps session ids to a Session: a dedicated runtime instance
+(which carries the conversation context), its SessionState and a lock that
+serializes turns within the session while different sessions run in parallel.
+Async callers queue for a turn with Session.acquire_turn() on their event loop,
+so a worker thread is only taken once the session is free.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import re
+import threading
+import time
+from collections import OrderedDict, deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Callable, Dict, Iterator, List
+
+DEFAULT_SESSION_ID = "default"
+SESSION_ID_PATTERN = re.compile(r"^[A-Za-z0-9][A-Za-z0-9._:-]{0,127}$")
+
+
+class SessionState:
+    """Conversation-scoped stores the runtime keeps between turns."""
+
+    def __init__(self) -> None:
+        self.pending_exec_proposals: Dict[str, Dict[str, str]] = {}
+        self.pending_ops_plans: Dict[str, Dict[str, str]] = {}
+        self.last_inspection: Dict[str, Any] = {}
+        self.last_introspection_snapshot: Dict[str, Any] = {}
+        self.last_resolution: Dict[str, Any] = {}
+        self.cdm_drafts: Dict[str, Dict[str, Any]] = {}
+        self.approved_drafts: Dict[str, List[Dict[str, Any]]] = {}
+        self.tool_drafts: Dict[str, Dict[str, Any]] = {}
+        self.approved_tools: Dict[str, List[Dict[str, Any]]] = {}
+        self.pending_tool_executions: Dict[str, Dict[str, Any]] = {}
+        self.workflows: Dict[str, Dict[str, Any]] = {}
+        self.approved_workflows: Dict[str, List[Dict[str, Any]]] = {}
+
+
+_default_state = SessionState()
+_current_state: ContextVar[SessionState] = ContextVar("session_state", default=_default_state)
+
+
+def default_session_state() -> SessionState:
+    return _default_state
+
+
+def current_session_state() -> SessionState:
+    return _current_state.get()
+
+
+@contextmanager
+def session_scope(state: SessionState) -> Iterator[SessionState]:
+    token = _current_state.set(state)
+    try:
+        yield state
+    finally:
+        _current_state.reset(token)
+
+
+def validate_session_id(session_id: str) -> str:
+    if not SESSION_ID_PATTERN.match(session_id):
+        raise ValueError(
+            "Invalid session id: use 1-128 letters, digits, '.', '_', ':' or '-', "
+            "starting with a letter or digit."
+        )
+    return session_id
+
+
+class Session:
+    def __init__(self, session_id: str, runtime: Any, state: SessionState) -> None:
+        self.session_id = session_id
+        self.runtime = runtime
+        self.state = state
+        self.lock = threading.Lock()
+        self.last_used = time.monotonic()
+        # FIFO of async turns; the mutex guards _turn_taken and _waiters and is
+        # never held across an await, so waiters on any event loop can share it
+        self._turn_mutex = threading.Lock()
+        self._turn_taken = False
+        self._waiters: "deque[tuple[asyncio.AbstractEventLoop, asyncio.Future]]" = deque()
+
+    def in_use(self) -> bool:
+        """True while a turn runs or is queued for this session."""
+        with self._turn_mutex:
+            return self._turn_taken or bool(self._waiters) or self.lock.locked()
+
+    async def acquire_turn(self) -> None:
+        """Waits on the caller's event loop until this session is free for one turn."""
+        loop = asyncio.get_running_loop()
+        with self._turn_mutex:
+            if not self._turn_taken:
+                self._turn_taken = True
+                return
+            waiter = loop.create_future()
+            self._waiters.append((loop, waiter))
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            with self._turn_mutex:
+                queued = (loop, waiter) in self._waiters
+                if queued:
+                    self._waiters.remove((loop, waiter))
+            # Handed over just before the cancel: pass the turn on. A cancelled
+            # waiter that was still pending is passed on by _hand_over instead.
+            if not queued and not waiter.cancelled():
+                self.release_turn()
+            raise
+
+    def release_turn(self) -> None:
+        """Ends the turn taken with acquire_turn(), handing it to the next waiter."""
+        with self._turn_mutex:
+            if not self._waiters:
+                self._turn_taken = False
+                return
+            loop, waiter = self._waiters.popleft()
+        loop.call_soon_threadsafe(self._hand_over, waiter)
+
+    def _hand_over(self, waiter: asyncio.Future) -> None:
+        if waiter.cancelled():
+            self.release_turn()
+        else:
+            waiter.set_result(None)
+
+    def run(self, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """Runs fn as one turn of this session: serialized, with the session's state current."""
+        with self.lock:
+            self.last_used = time.monotonic()
+            try:
+                with session_scope(self.state):
+                    return fn(*args, **kwargs)
+            finally:
+                self.last_used = time.monotonic()
+
+
+class SessionRegistry:
+    """
+    Session id -> Session, created on first use.
+
+    The default session wraps default_runtime and the default SessionState.
+    Other sessions are evicted least recently used first once there are more
+    than max_sessions, or after idle_timeout_seconds without a turn or lookup; a
+    session with a turn in progress or queued is never evicted.
+    """
+
+    def __init__(
+        self,
+        runtime_factory: Callable[[], Any],
+        default_runtime: Any | None = None,
+        max_sessions: int = 256,
+        idle_timeout_seconds: float = 3600.0,
+    ) -> None:
+        self.runtime_factory = runtime_factory
+        self.max_sessions = max(1, int(max_sessions))
+        self.idle_timeout_seconds = float(idle_timeout_seconds)
+        self._lock = threading.Lock()
+        self._sessions: "OrderedDict[str, Session]" = OrderedDict()
+        self.default = Session(
+            DEFAULT_SESSION_ID,
+            default_runtime if default_runtime is not None else runtime_factory(),
+            _default_state,
+        )
+
+    def get(self, session_id: str | None = None) -> Session:
+        if not session_id or session_id == DEFAULT_SESSION_ID:
+            return self.default
+        validate_session_id(session_id)
+        with self._lock:
+            session = self._sessions.get(session_id)
+            if session is not None:
+                # Refreshed under the registry lock so the caller's turn cannot
+                # find its session evicted as idle before it starts.
+                session.last_used = time.monotonic()
+                self._sessions.move_to_end(session_id)
+                return session
+            self._evict()
+            # Built under the lock so concurrent first requests share one runtime.
+            session = Session(session_id, self.runtime_factory(), SessionState())
+            self._sessions[session_id] = session
+            return session
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._sessions)
+
+    def __contains__(self, session_id: str) -> bool:
+        with self._lock:
+            return session_id in self._sessions
+
+    def _evict(self) -> None:
+        now = time.monotonic()
+        for session_id, session in list(self._sessions.items()):
+            if session.in_use():
+                continue
+            idle = now - session.last_used >= self.idle_timeout_seconds
+            if idle or len(self._sessions) >= self.max_sessions:
+                del self._sessions[session_id]
@@ -1,6 +1,9 @@
 from __future__ import annotations
 
+import base64
 import hashlib
+import heapq
+import json
 import os
 import re
 import stat
@@ -353,19 +356,11 @@ def inspect_directory(payload: Dict[str, Any], workspace_root: str | Path) -> Di
                 page_size=page_size,
             )
 
-        entries, error = _collect_directory_entries(
+        resume_after, token_error = _decode_page_token(
+            page_token,
             root_directory=normalized_path,
-            allowlist_root=normalized_root,
             max_depth=max_depth,
-            include_hidden=include_hidden,
-            original_path=path_value,
-            request_depth=max_depth,
-            request_page_size=page_size,
         )
-        if error is not None:
-            return error
-
-        offset, token_error = _decode_page_token(page_token)
         if token_error is not None:
             return _directory_error_response(
                 path=path_value,
@@ -376,21 +371,29 @@ def inspect_directory(payload: Dict[str, Any], workspace_root: str | Path) -> Di
                 depth=max_depth,
                 page_size=page_size,
             )
-        if offset > len(entries):
-            return _directory_error_response(
-                path=path_value,
-                normalized_path=str(normalized_path),
-                code=ERROR_INVALID_ARGUMENT,
-                message="page_token offset is out of range.",
-                exists=True,
-                depth=max_depth,
-                page_size=page_size,
-            )
 
-        page_entries = entries[offset: offset + page_size]
+        # One entry past the page tells whether another page exists.
+        entries, error = _collect_directory_entries(
+            root_directory=normalized_path,
+            allowlist_root=normalized_root,
+            max_depth=max_depth,
+            include_hidden=include_hidden,
+            original_path=path_value,
+            request_depth=max_depth,
+            request_page_size=page_size,
+            resume_after=resume_after,
+            limit=page_size + 1,
+        )
+        if error is not None:
+            return error
+
+        page_entries = entries[:page_size]
         next_token = None
-        if offset + page_size < len(entries):
-            next_token = str(offset + page_size)
+        if len(entries) > page_size:
+            next_token = _encode_page_token(
+                root_directory=normalized_path,
+                last_path=page_entries[-1]["path"],
+            )
 
         return {
             "status": "ok",
@@ -687,13 +690,38 @@ def _sha256_file(path_value: Path) -> str:
     return hasher.hexdigest()
 
 
-def _decode_page_token(page_token: str | None) -> Tuple[int, str | None]:
+def _encode_page_token(*, root_directory: Path, last_path: str) -> str:
+    relative = Path(last_path).relative_to(root_directory)
+    cursor = {"v": 1, "after": list(relative.parts)}
+    raw = json.dumps(cursor, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii")
+
+
+def _decode_page_token(
+    page_token: str | None,
+    *,
+    root_directory: Path,
+    max_depth: int,
+) -> Tuple[Path | None, str | None]:
+    """
+    Returns the last path emitted by the previous page, or None for the first page.
+    """
     if page_token is None or not str(page_token).strip():
-        return 0, None
-    token = str(page_token).strip()
-    if not token.isdigit():
-        return 0, "page_token must be a non-negative integer string."
-    return int(token), None
+        return None, None
+    invalid = "page_token is not a valid directory cursor."
+    try:
+        cursor = json.loads(base64.urlsafe_b64decode(str(page_token).strip().encode("ascii")))
+    except (ValueError, UnicodeError):
+        return None, invalid
+    if not isinstance(cursor, dict) or cursor.get("v") != 1:
+        return None, invalid
+    parts = cursor.get("after")
+    if not isinstance(parts, list) or not parts or len(parts) > max_depth:
+        return None, invalid
+    for part in parts:
+        if not isinstance(part, str) or part in {"", ".", ".."} or "/" in part or os.sep in part:
+            return None, invalid
+    return root_directory.joinpath(*parts), None
 
 
 def _collect_directory_entries(
@@ -705,21 +733,30 @@ def _collect_directory_entries(
     original_path: str,
     request_depth: int,
     request_page_size: int,
+    resume_after: Path | None = None,
+    limit: int | None = None,
 ) -> Tuple[list[Dict[str, Any]], Dict[str, Any] | None]:
-    # queue stores (directory_path, entry_depth_for_children)
-    queue: list[Tuple[Path, int]] = [(root_directory, 1)]
-    entries: list[Dict[str, Any]] = []
-
-    while queue:
-        directory_path, entry_depth = queue.pop(0)
-        if entry_depth > max_depth:
-            continue
+    """
+    Walks the tree lazily in path order, starting after resume_after and
+    stopping once limit entries are collected.
+
+    The frontier is a heap of entries not yet emitted plus directories not yet
+    listed. A directory is keyed by its path plus a separator, which sorts
+    before all of its descendants, so it is only listed when the walk reaches
+    its subtree. To resume, each ancestor of resume_after is listed again and
+    only what sorts after it is pushed; everything else still pending lives
+    below those ancestors.
+    """
+    # frontier items: (sort_key, entry_depth, dir_entry); dir_entry None = directory to list
+    frontier: list[Tuple[str, int, os.DirEntry | None]] = []
+    after = str(resume_after) if resume_after is not None else ""
 
+    def push_children(directory_path: Path, entry_depth: int) -> Dict[str, Any] | None:
         try:
             with os.scandir(directory_path) as iterator:
-                dir_entries = sorted(list(iterator), key=lambda item: item.name)
+                dir_entries = list(iterator)
         except PermissionError:
-            return [], _directory_error_response(
+            return _directory_error_response(
                 path=original_path,
                 normalized_path=str(directory_path),
                 code=ERROR_PERMISSION_DENIED,
@@ -729,7 +766,7 @@ def _collect_directory_entries(
                 page_size=request_page_size,
             )
         except FileNotFoundError:
-            return [], _directory_error_response(
+            return _directory_error_response(
                 path=original_path,
                 normalized_path=str(directory_path),
                 code=ERROR_NOT_FOUND,
@@ -742,64 +779,105 @@ def _collect_directory_entries(
         for entry in dir_entries:
             if not include_hidden and entry.name.startswith("."):
                 continue
+            entry_path = os.path.join(str(directory_path), entry.name)
+            if entry_path > after:
+                heapq.heappush(frontier, (entry_path, entry_depth, entry))
+            elif (
+                entry_depth < max_depth
+                and entry_path + os.sep > after
+                and entry.is_dir(follow_symlinks=False)
+            ):
+                # Emitted on an earlier page, but its subtree sorts after the cursor.
+                heapq.heappush(frontier, (entry_path + os.sep, entry_depth + 1, None))
+        return None
+
+    if max_depth < 1:
+        return [], None
+    if resume_after is None:
+        error = push_children(root_directory, 1)
+        if error is not None:
+            return [], error
+    else:
+        ancestors = [root_directory]
+        for part in resume_after.relative_to(root_directory).parts[:-1]:
+            ancestors.append(ancestors[-1] / part)
+        for index, ancestor in enumerate(ancestors):
+            if index:
+                # Gone, or replaced by a non-directory, since the previous page.
+                try:
+                    if _entry_type(os.lstat(ancestor).st_mode) != "directory":
+                        break
+                except FileNotFoundError:
+                    break
+            error = push_children(ancestor, index + 1)
+            if error is not None:
+                return [], error
 
-            normalized_entry = _normalize_candidate_path(path_value=entry.path, workspace_root=allowlist_root)
-            if not _is_within(normalized_entry, allowlist_root):
-                return [], _directory_error_response(
-                    path=original_path,
-                    normalized_path=str(normalized_entry),
-                    code=ERROR_PATH_OUTSIDE_ALLOWLIST,
-                    message="Observed entry outside allowlisted workspace root.",
-                    exists=False,
-                    depth=request_depth,
-                    page_size=request_page_size,
-                )
-
-            try:
-                entry_stat = entry.stat(follow_symlinks=False)
-            except PermissionError:
-                return [], _directory_error_response(
-                    path=original_path,
-                    normalized_path=str(normalized_entry),
-                    code=ERROR_PERMISSION_DENIED,
-                    message="Permission denied while reading entry metadata.",
-                    exists=True,
-                    depth=request_depth,
-                    page_size=request_page_size,
-                )
+    entries: list[Dict[str, Any]] = []
+    while frontier and (limit is None or len(entries) < limit):
+        sort_key, entry_depth, entry = heapq.heappop(frontier)
+        if entry is None:
+            error = push_children(Path(sort_key.rstrip(os.sep)), entry_depth)
+            if error is not None:
+                return [], error
+            continue
 
-            entry_type = _entry_type(entry_stat.st_mode)
-            byte_size = int(entry_stat.st_size) if entry_type == "file" else None
+        normalized_entry = _normalize_candidate_path(path_value=entry.path, workspace_root=allowlist_root)
+        if not _is_within(normalized_entry, allowlist_root):
+            return [], _directory_error_response(
+                path=original_path,
+                normalized_path=str(normalized_entry),
+                code=ERROR_PATH_OUTSIDE_ALLOWLIST,
+                message="Observed entry outside allowlisted workspace root.",
+                exists=False,
+                depth=request_depth,
+                page_size=request_page_size,
+            )
 
-            symlink_target: str | None = None
-            symlink_target_within_allowlist: bool | None = None
-            if entry_type == "symlink":
-                try:
-                    symlink_target = os.readlink(normalized_entry)
-                    symlink_target_within_allowlist = _symlink_target_within_allowlist(
-                        symlink_path=normalized_entry,
-                        symlink_target=symlink_target,
-                        allowlist_root=allowlist_root,
-                    )
-                except OSError:
-                    symlink_target = None
-                    symlink_target_within_allowlist = False
-
-            entries.append(
-                {
-                    "name": entry.name,
-                    "path": str(normalized_entry),
-                    "entry_type": entry_type,
-                    "byte_size": byte_size,
-                    "symlink_target": symlink_target,
-                    "symlink_target_within_allowlist": symlink_target_within_allowlist,
-                }
+        try:
+            entry_stat = entry.stat(follow_symlinks=False)
+        except PermissionError:
+            return [], _directory_error_response(
+                path=original_path,
+                normalized_path=str(normalized_entry),
+                code=ERROR_PERMISSION_DENIED,
+                message="Permission denied while reading entry metadata.",
+                exists=True,
+                depth=request_depth,
+                page_size=request_page_size,
             )
 
-            if entry_type == "directory" and entry_depth < max_depth:
-                queue.append((normalized_entry, entry_depth + 1))
+        entry_type = _entry_type(entry_stat.st_mode)
+        byte_size = int(entry_stat.st_size) if entry_type == "file" else None
+
+        symlink_target: str | None = None
+        symlink_target_within_allowlist: bool | None = None
+        if entry_type == "symlink":
+            try:
+                symlink_target = os.readlink(normalized_entry)
+                symlink_target_within_allowlist = _symlink_target_within_allowlist(
+                    symlink_path=normalized_entry,
+                    symlink_target=symlink_target,
+                    allowlist_root=allowlist_root,
+                )
+            except OSError:
+                symlink_target = None
+                symlink_target_within_allowlist = False
+
+        entries.append(
+            {
+                "name": entry.name,
+                "path": str(normalized_entry),
+                "entry_type": entry_type,
+                "byte_size": byte_size,
+                "symlink_target": symlink_target,
+                "symlink_target_within_allowlist": symlink_target_within_allowlist,
+            }
+        )
+
+        if entry_type == "directory" and entry_depth < max_depth:
+            heapq.heappush(frontier, (sort_key + os.sep, entry_depth + 1, None))
 
-    entries.sort(key=lambda item: str(item.get("path", "")))
     return entries, None
 
 
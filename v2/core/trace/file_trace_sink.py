@@ -1,29 +1,176 @@
+import atexit
 import json
+import os
+import threading
+import time
+import weakref
+from collections import OrderedDict
 from pathlib import Path
 from datetime import datetime
 
 _V2_ROOT = Path(__file__).resolve().parents[2]
 
+DURABILITY_MODES = ("none", "flush", "fsync")
+
+_buffered_sinks: "weakref.WeakSet[FileTraceSink]" = weakref.WeakSet()
+
+
+def _close_buffered_sinks() -> None:
+    for sink in list(_buffered_sinks):
+        sink.close()
+
+
+atexit.register(_close_buffered_sinks)
+
+
 class FileTraceSink:
-    def __init__(self, base_dir: str | None = None):
+    """
+    Append-only JSONL trace sink, one file per trace_id.
+
+    Unbuffered (default): every emit opens, appends and closes the trace file.
+    Buffered: events are batched in memory and written through a bounded LRU
+    of open handles when max_buffered_events is reached, on flush(),
+    get_trace() and at process exit, and at most flush_interval_seconds
+    after the oldest pending event (on the next emit, or by a timer if the
+    trace goes quiet).
+
+    durability controls what a buffered write waits for:
+    "none": nothing; written bytes may sit in the handle's own buffer until
+        it fills, the handle is closed or evicted, or the idle timer fires.
+    "flush": the handle's buffer is flushed to the OS on every write.
+    "fsync": as "flush", then the file is fsynced.
+    Unbuffered writes close the file each time, so "none" and "flush" are
+    the same there.
+    """
+
+    def __init__(
+        self,
+        base_dir: str | None = None,
+        buffered: bool = False,
+        durability: str = "flush",
+        max_open_files: int = 16,
+        max_buffered_events: int = 64,
+        flush_interval_seconds: float = 1.0,
+    ):
+        if durability not in DURABILITY_MODES:
+            raise ValueError(f"Unknown trace durability mode: {durability}")
         self.base_dir = Path(base_dir) if base_dir is not None else (_V2_ROOT / "var" / "traces")
         self.base_dir.mkdir(parents=True, exist_ok=True)
+        self.buffered = buffered
+        self.durability = durability
+        self.max_open_files = max(1, int(max_open_files))
+        self.max_buffered_events = max(1, int(max_buffered_events))
+        self.flush_interval_seconds = float(flush_interval_seconds)
+
+        self._lock = threading.RLock()
+        self._pending: dict[str, list[str]] = {}
+        self._pending_count = 0
+        self._last_flush = time.monotonic()
+        self._handles: "OrderedDict[str, object]" = OrderedDict()
+        self._timer: threading.Timer | None = None
+        if buffered:
+            _buffered_sinks.add(self)
+
+    def _trace_file(self, trace_id: str) -> Path:
+        return self.base_dir / f"{trace_id}.jsonl"
+
+    def _sync(self, handle) -> None:
+        if self.durability == "none":
+            return
+        handle.flush()
+        if self.durability == "fsync":
+            os.fsync(handle.fileno())
 
     def emit(self, event: dict) -> None:
         trace_id = event["trace_id"]
-        trace_file = self.base_dir / f"{trace_id}.jsonl"
+        line = json.dumps(event) + "\n"
+
+        if not self.buffered:
+            trace_file = self._trace_file(trace_id)
+            trace_file.parent.mkdir(parents=True, exist_ok=True)
+            with trace_file.open("a") as f:
+                f.write(line)
+                if self.durability == "fsync":
+                    self._sync(f)
+            return
+
+        with self._lock:
+            self._pending.setdefault(trace_id, []).append(line)
+            self._pending_count += 1
+            due = time.monotonic() - self._last_flush >= self.flush_interval_seconds
+            if self._pending_count >= self.max_buffered_events or due:
+                self._flush_all()
+            elif self._timer is None:
+                self._timer = threading.Timer(self.flush_interval_seconds, self._flush_idle)
+                self._timer.daemon = True
+                self._timer.start()
+
+    def _handle_for(self, trace_id: str):
+        handle = self._handles.get(trace_id)
+        if handle is not None:
+            self._handles.move_to_end(trace_id)
+            return handle
+        trace_file = self._trace_file(trace_id)
         trace_file.parent.mkdir(parents=True, exist_ok=True)
+        handle = trace_file.open("a")
+        self._handles[trace_id] = handle
+        while len(self._handles) > self.max_open_files:
+            _, evicted = self._handles.popitem(last=False)
+            evicted.close()
+        return handle
+
+    def _flush_trace(self, trace_id: str) -> None:
+        lines = self._pending.pop(trace_id, None)
+        if not lines:
+            return
+        self._pending_count -= len(lines)
+        handle = self._handle_for(trace_id)
+        handle.write("".join(lines))
+        self._sync(handle)
+
+    def _flush_all(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        for trace_id in list(self._pending):
+            self._flush_trace(trace_id)
+        self._last_flush = time.monotonic()
+
+    def _flush_idle(self) -> None:
+        with self._lock:
+            if self._timer is threading.current_thread():
+                self._timer = None
+            self._flush_all()
+            # No later emit may come to push these out; hand them to the OS
+            # so readers of the trace files (TraceInspector) see them.
+            for handle in self._handles.values():
+                handle.flush()
 
-        with trace_file.open("a") as f:
-            f.write(json.dumps(event))
-            f.write("\n")
+    def flush(self, trace_id: str | None = None) -> None:
+        if not self.buffered:
+            return
+        with self._lock:
+            if trace_id is None:
+                self._flush_all()
+            else:
+                self._flush_trace(trace_id)
 
-    def flush(self, trace_id: str) -> None:
-        # no-op for file-based sink
-        return
+    def close(self) -> None:
+        with self._lock:
+            self._flush_all()
+            while self._handles:
+                _, handle = self._handles.popitem(last=False)
+                handle.close()
 
     def get_trace(self, trace_id: str) -> list[dict]:
-        trace_file = self.base_dir / f"{trace_id}.jsonl"
+        if self.buffered:
+            with self._lock:
+                self._flush_trace(trace_id)
+                # Reads go through a separate handle, so the bytes must leave our buffer.
+                handle = self._handles.get(trace_id)
+                if handle is not None:
+                    handle.flush()
+        trace_file = self._trace_file(trace_id)
         if not trace_file.exists():
             return []
 